@@ -6,6 +6,7 @@ PAGE_NAMES = {
     'budget': '💳 Budget',
     'subscriptions': '📆 Subscriptions',
     'planned_purchases': '📌 Planned Purchases',
+    'debts': '🏦 Debts',
     'about': '❓ About',
     'settings': '⚙️ Settings',
     'login': '🚨 Login'
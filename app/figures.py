@@ -0,0 +1,141 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Sequence, Tuple
+
+import pandas as pd
+
+from backend import events, table_cache
+
+# Figures kept process-wide, shared by all sessions.
+MAX_ENTRIES = 256
+
+# Cap on the cached figures' total size, measured as their Plotly JSON.
+MAX_BYTES = 32 * 2 ** 20
+
+
+def fingerprint(data: pd.DataFrame, options: Dict[str, Any]) -> str:
+    """
+    Digest of a chart's aggregated input and its options.
+
+    Args:
+        data: The (small, aggregated) frame the chart is drawn from.
+        options: Keyword options passed to the figure builder.
+
+    Returns:
+        Hex digest; equal inputs give equal digests across sessions. Frames
+        tagged with a version token are digested by the token alone.
+    """
+    return table_cache.fingerprint(data, options)
+
+
+class FigureCache:
+    """
+    LRU cache of built Plotly figures, bounded by entry count and total JSON size.
+
+    ``st.plotly_chart`` serialises whatever it is given, so entries hold the
+    finished figure rather than its JSON: re-validating JSON into a figure costs
+    about as much as building it again. The JSON size is still what the memory
+    cap counts, since that is what each figure costs to keep and to send.
+
+    Entries record the tables they were drawn from. Keys are content digests,
+    so a changed table never returns a stale figure, but the figures of the old
+    data would linger until evicted; ``invalidate`` drops exactly those.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[Any, int, FrozenSet[str]]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+            self,
+            key: Tuple[str, str],
+            build: Callable[[], Any],
+            depends_on: Sequence[str] = (),
+    ) -> Any:
+        """Cached figure for ``key``, calling ``build`` on a miss; ``depends_on`` names its source datasets."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        figure = build()
+        nbytes = len(figure.to_json(validate=False))
+        if nbytes > self.max_bytes:
+            return figure
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (figure, nbytes, frozenset(depends_on))
+            self._bytes += nbytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+        return figure
+
+    def invalidate(self, dataset: str) -> int:
+        """Drop every figure drawn from ``dataset``; returns how many."""
+        with self._lock:
+            stale = [key for key, (_, _, datasets) in self._entries.items() if dataset in datasets]
+            for key in stale:
+                self._bytes -= self._entries.pop(key)[1]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, cached bytes, hits and misses."""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes, 'hits': self.hits, 'misses': self.misses}
+
+
+_cache = FigureCache()
+events.subscribe(lambda change: _cache.invalidate(change.dataset))
+
+
+def cached_figure(
+        name: str,
+        data: pd.DataFrame,
+        build: Callable[..., Any],
+        *,
+        depends_on: Sequence[str] = (),
+        **options: Any,
+) -> Any:
+    """
+    ``build(data, **options)``, reused while the data and options are unchanged.
+
+    The returned figure is shared between reruns and sessions, so ``build``
+    must apply every trace and layout update itself and callers must not
+    modify the result.
+
+    Args:
+        name: Chart identity, e.g. ``'dashboard.treemap'``; charts built by
+            different functions from the same data need different names.
+        data: Aggregated frame the chart is drawn from.
+        build: Figure factory taking ``data`` and ``options``.
+        depends_on: File names of the tables ``data`` was aggregated from,
+            e.g. ``('budget_data.csv',)``; a write to one of them drops the figure.
+        **options: Chart options, part of the cache key.
+
+    Returns:
+        plotly.graph_objects.Figure: The built or cached figure.
+    """
+    key = (name, fingerprint(data, options))
+    return _cache.get_or_build(key, lambda: build(data, **options), depends_on)
+
+
+def cache_stats() -> Dict[str, int]:
+    """Statistics of the process-wide figure cache."""
+    return _cache.stats()
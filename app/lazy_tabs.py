@@ -0,0 +1,81 @@
+import inspect
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Sequence, Tuple, TypeVar
+
+import pandas as pd
+import streamlit as st
+
+from backend import table_cache
+
+T = TypeVar('T')
+
+# Session-state key holding each section's (version, result).
+_RESULTS_KEY = '_lazy_tab_results'
+
+# Streamlit >= 1.50 reruns on tab switches and reports the open tab.
+_SUPPORTS_LAZY = 'on_change' in inspect.signature(st.tabs).parameters
+
+
+def tabs(labels: Sequence[str], *, key: str) -> Sequence[Any]:
+    """
+    ``st.tabs`` that knows which tab is open, so closed tabs can be skipped.
+
+    On Streamlit versions without lazy tabs every tab reports itself open and
+    the page renders eagerly, as before.
+
+    Args:
+        labels: Tab labels.
+        key: Widget key; keeps the selected tab across reruns.
+
+    Returns:
+        One container per tab; pass each to ``is_open``.
+    """
+    if _SUPPORTS_LAZY:
+        return st.tabs(labels, key=key, on_change='rerun')
+    return st.tabs(labels)
+
+
+def is_open(tab: Any) -> bool:
+    """Whether ``tab`` is the selected tab (always ``True`` without lazy tab support)."""
+    selected = getattr(tab, 'open', None)
+    return True if selected is None else bool(selected)
+
+
+def cached(name: str, version: Hashable, compute: Callable[[], T]) -> T:
+    """
+    Result of ``compute()``, reused by this session while ``version`` is unchanged.
+
+    Args:
+        name: Section name, unique per page and tab, e.g. ``'dashboard.expenses'``.
+        version: Token of the data the section is computed from; see
+            ``frame_version`` and ``files_version``.
+        compute: Builds the section's data (aggregates, figures, tables).
+
+    Returns:
+        The cached or freshly computed result.
+    """
+    results: Dict[str, Tuple[Hashable, Any]] = st.session_state.setdefault(_RESULTS_KEY, {})
+    entry = results.get(name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    result = compute()
+    results[name] = (version, result)
+    return result
+
+
+def frame_version(df: pd.DataFrame) -> str:
+    """Digest of a frame; O(1) for tables tagged with a version token by their store."""
+    return table_cache.fingerprint(df)
+
+
+def files_version(directory: str | Path, pattern: str = '*.csv') -> Tuple[Tuple[str, int, int], ...]:
+    """Name, modification time and size of every matching file; changes whenever one is saved."""
+    entries = []
+    for path in sorted(Path(directory).glob(pattern)):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
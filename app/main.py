@@ -1,4 +1,5 @@
 import streamlit as st
+import copy
 import os
 import sys
 
@@ -10,6 +11,13 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
+from app import perf
+from app import session_memory
+from app import warmup
+
+perf.start_rerun()
+session_memory.begin_rerun()
+
 # Ensure session state is initialized
 if 'user' not in st.session_state:
     st.session_state.user = None
@@ -33,7 +41,8 @@ def local_css(file_name: str) -> None:
 
 # Inject your style.css
 css_path = os.path.join(PROJECT_ROOT, 'static', 'style.css')
-local_css(css_path)
+with perf.span('css'):
+    local_css(css_path)
 
 page_list = [
     pages.dashboard_page,
@@ -42,6 +51,7 @@ page_list = [
     pages.budget_page,
     pages.subscriptions_page,
     pages.planned_purchases,
+    pages.debts_page,
     pages.about_page,
     pages.settings_page,
 ]
@@ -52,6 +62,13 @@ if st.session_state.user is None:
         pages.login_page
     ]
 
+# The st.Page objects in pages.py are module-level, so every session shares them.
+# st.navigation marks the page it returns as callable and Page.run() clears the mark,
+# so two sessions on the same page race: one session's run() clears the mark the other
+# just set, and its run() fails with "This page cannot be called directly". Shallow
+# copies give each rerun its own mark; titles and url paths stay shared.
+page_list = [copy.copy(page) for page in page_list]
+
 # --- NAVIGATION SETUP ---
 current_page = st.navigation(
     pages=page_list
@@ -98,4 +115,15 @@ with st.sidebar:
         st.session_state.user = None
         st.switch_page(pages.login_page)
 
-current_page.run()
+try:
+    with perf.span('page'):
+        current_page.run()
+finally:
+    perf.finish_rerun(current_page.title)
+    session_memory.end_rerun()
+
+perf.render_panel(current_page.title)
+session_memory.render_panel()
+
+# The page is drawn; load the other pages' heavy modules in the background.
+warmup.start()
@@ -34,6 +34,11 @@ planned_purchases = st.Page(
     title=config.PAGE_NAMES['planned_purchases']
 )
 
+debts_page = st.Page(
+    page='views/debts.py',
+    title=config.PAGE_NAMES['debts']
+)
+
 about_page = st.Page(
     page='views/about.py',
     title=config.PAGE_NAMES['about']
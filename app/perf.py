@@ -0,0 +1,185 @@
+import functools
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger('budgeting_app.perf')
+
+# One JSON line per rerun on stderr unless the host application configured logging.
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Reruns kept per page for the rolling latency histogram.
+HISTORY_SIZE = 500
+
+# Histogram bucket upper bounds in milliseconds.
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, float('inf'))
+
+# Process-wide rolling rerun latencies (ms) per page, shared by all sessions.
+_history: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=HISTORY_SIZE))
+_history_lock = threading.Lock()
+
+# Streamlit runs each session's script on its own thread.
+_local = threading.local()
+
+
+def _spans() -> List[Tuple[str, float]]:
+    if not hasattr(_local, 'spans'):
+        _local.spans = []
+        _local.stack = []
+    return _local.spans
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a block of the current rerun. Nested spans are recorded as ``'outer/inner'``.
+
+    Args:
+        name: Phase name, e.g. ``'load'`` or ``'render:summary'``.
+    """
+    spans = _spans()
+    _local.stack.append(name)
+    path = '/'.join(_local.stack)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans.append((path, (time.perf_counter() - start) * 1000))
+        _local.stack.pop()
+
+
+def timed(name: str) -> Callable:
+    """Decorator form of ``span``."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_rerun() -> None:
+    """Reset the span list and start the rerun clock. Call first thing in ``main.py``."""
+    _local.spans = []
+    _local.stack = []
+    _local.started = time.perf_counter()
+
+
+def _session_id() -> str:
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return ''
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else ''
+
+
+def finish_rerun(page: str) -> float:
+    """
+    Close the rerun: add its latency to the page's history and log it.
+
+    Returns:
+        Total rerun latency in milliseconds.
+    """
+    total_ms = (time.perf_counter() - getattr(_local, 'started', time.perf_counter())) * 1000
+    with _history_lock:
+        _history[page].append(total_ms)
+
+    logger.info(json.dumps({
+        'event': 'rerun',
+        'page': page,
+        'session': _session_id(),
+        'total_ms': round(total_ms, 2),
+        'spans': {path: round(ms, 2) for path, ms in _spans()},
+    }, ensure_ascii=False))
+    return total_ms
+
+
+def last_spans() -> List[Tuple[str, float]]:
+    """Spans recorded so far in the current rerun, in completion order."""
+    return list(_spans())
+
+
+def page_latencies() -> Dict[str, 'np.ndarray']:
+    """Snapshot of the rolling rerun latencies (ms) per page."""
+    import numpy as np
+
+    with _history_lock:
+        return {page: np.fromiter(values, dtype=float) for page, values in _history.items()}
+
+
+def latency_summary() -> List[Dict[str, float]]:
+    """p50/p95/p99 rerun latency and rerun count per page."""
+    import numpy as np
+
+    rows = []
+    for page, values in sorted(page_latencies().items()):
+        if not len(values):
+            continue
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        rows.append({'Page': page, 'Reruns': len(values), 'p50 (ms)': p50, 'p95 (ms)': p95, 'p99 (ms)': p99})
+    return rows
+
+
+def histogram(values: 'np.ndarray') -> Dict[str, int]:
+    """Count of reruns per latency bucket, labelled by upper bound."""
+    import numpy as np
+
+    counts = np.bincount(np.searchsorted(BUCKETS_MS, values), minlength=len(BUCKETS_MS))
+    labels = [f'≤{int(b):,} ms' if b != float('inf') else f'>{int(BUCKETS_MS[-2]):,} ms' for b in BUCKETS_MS]
+    return dict(zip(labels, counts.tolist()))
+
+
+def render_panel(page: str) -> None:
+    """
+    Sidebar panel with this rerun's spans and the rolling per-page latency
+    histogram. Opt-in through a sidebar toggle.
+    """
+    import streamlit as st
+
+    with st.sidebar:
+        if not st.toggle('⏱️ Performance', key='perf_panel'):
+            return
+
+        st.caption('This rerun')
+        st.dataframe(
+            [{'Span': path, 'ms': round(ms, 1)} for path, ms in last_spans()],
+            hide_index=True,
+            use_container_width=True,
+        )
+
+        st.caption('Rolling rerun latency (all sessions)')
+        st.dataframe(latency_summary(), hide_index=True, use_container_width=True)
+
+        values = page_latencies().get(page)
+        if values is not None and len(values):
+            counts = histogram(values)
+            st.caption(f'{page} latency histogram')
+            st.dataframe(
+                [{'Latency': bucket, 'Reruns': count} for bucket, count in counts.items()],
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    'Reruns': st.column_config.ProgressColumn(
+                        format='%d',
+                        min_value=0,
+                        max_value=max(counts.values()),
+                    ),
+                },
+            )
@@ -0,0 +1,508 @@
+import copy
+import os
+import pickle
+import re
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Where idle sessions' frames are written. One sub-directory per session.
+SPILL_DIR = Path(os.environ.get('BUDGET_APP_SPILL_DIR', Path(tempfile.gettempdir()) / 'budgeting_app_spill'))
+
+# A session is idle once its last rerun finished this many seconds ago.
+IDLE_SECONDS = 300
+
+# Only frames at least this large (deep bytes) are spilled.
+SPILL_MIN_BYTES = 1 * 2 ** 20
+
+# Spilling walks containers and app objects this many levels below a session-state key.
+_MAX_DEPTH = 4
+
+# Sweeps piggyback on reruns, at most once per interval.
+SWEEP_INTERVAL = 30
+
+# Spill files of sessions that never came back are deleted after this long.
+SPILL_FILE_TTL = 24 * 60 * 60
+
+# Widget keys such as 'amount-12' or 'income_3' are reported as 'amount-*'.
+_WIDGET_KEY = re.compile(r'^(.*?[-_])\d+$')
+
+
+@dataclass(frozen=True, slots=True)
+class Spilled:
+    """Placeholder left in session state for a frame written to disk."""
+
+    path: str
+    nbytes: int
+
+
+class _Tracked:
+    __slots__ = ('state', 'last_active', 'running', 'spilling', 'spilled_keys')
+
+    def __init__(self, state: Any) -> None:
+        self.state = state
+        self.last_active = time.monotonic()
+        self.running = True
+        self.spilling = False
+        self.spilled_keys: Set[str] = set()
+
+
+# session id -> latest session state handle, shared by all script threads.
+_sessions: Dict[str, _Tracked] = {}
+_lock = threading.Lock()
+# Notified whenever a session's spill finishes; waited on by ``begin_rerun``.
+_spill_done = threading.Condition(_lock)
+_last_sweep = 0.0
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Accounting
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _pandas_types() -> Tuple[type, ...]:
+    """
+    DataFrame, Series and Index, or nothing while pandas has not been imported
+    (no value can be one then). Keeps pandas out of the app's cold start.
+    """
+    pd = sys.modules.get('pandas')
+    return (pd.DataFrame, pd.Series, pd.Index) if pd is not None else ()
+
+
+def _items(state: Any) -> Dict[str, Any]:
+    """User-visible keys of ``st.session_state`` or a script run's session state."""
+    return dict(state.filtered_state) if hasattr(state, 'filtered_state') else dict(state)
+
+
+def deep_size(obj: Any, _seen: Optional[Set[int]] = None) -> int:
+    """
+    Approximate bytes held by ``obj``, following containers and counting
+    pandas/NumPy buffers (including object-dtype strings) once.
+    """
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    pandas_types = _pandas_types()
+    if pandas_types and isinstance(obj, pandas_types):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pandas_types[1]) else usage)
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, Spilled):
+        return sys.getsizeof(obj)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    return size
+
+
+def _spilled_bytes(value: Any, depth: int = 0) -> int:
+    """Bytes of the ``Spilled`` placeholders in ``value``, walked like ``spill`` walks it."""
+    if isinstance(value, Spilled):
+        return value.nbytes
+    if depth >= _MAX_DEPTH:
+        return 0
+    if isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, (list, tuple)):
+        items = value
+    elif _walkable(value):
+        items = vars(value).values()
+    else:
+        return 0
+    return sum(_spilled_bytes(item, depth + 1) for item in items)
+
+
+def group_key(key: str) -> str:
+    """Collapse per-row widget keys into one pattern, e.g. ``'name-12'`` -> ``'name-*'``."""
+    match = _WIDGET_KEY.match(str(key))
+    return f'{match.group(1)}*' if match else str(key)
+
+
+def state_breakdown(state: Any) -> 'pd.DataFrame':
+    """
+    Deep size of one session's state, grouped by key pattern.
+
+    Args:
+        state: ``st.session_state`` or a tracked session state.
+
+    Returns:
+        Frame with ``'Key'``, ``'Keys'``, ``'Type'``, ``'Bytes'`` and
+        ``'Spilled Bytes'``, largest first.
+    """
+    import pandas as pd
+
+    rows = []
+    for key, value in _items(state).items():
+        rows.append({
+            'Key': group_key(key),
+            'Type': type(value).__name__ if not isinstance(value, Spilled) else 'DataFrame (spilled)',
+            'Bytes': deep_size(value),
+            'Spilled Bytes': _spilled_bytes(value),
+        })
+
+    frame = pd.DataFrame(rows, columns=['Key', 'Type', 'Bytes', 'Spilled Bytes'])
+    return (
+        frame.groupby('Key', as_index=False)
+        .agg(Keys=('Type', 'size'), Type=('Type', 'first'), Bytes=('Bytes', 'sum'),
+             **{'Spilled Bytes': ('Spilled Bytes', 'sum')})
+        .sort_values('Bytes', ascending=False, kind='stable')
+        .reset_index(drop=True)
+    )
+
+
+def memory_report() -> 'pd.DataFrame':
+    """
+    One row per tracked session: idle time, key count, resident and spilled bytes.
+    """
+    import pandas as pd
+
+    now = time.monotonic()
+    with _lock:
+        tracked = list(_sessions.items())
+
+    rows = []
+    for session_id, entry in tracked:
+        breakdown = state_breakdown(entry.state)
+        rows.append({
+            'Session': session_id[:8],
+            'Idle (s)': 0.0 if entry.running else round(now - entry.last_active, 1),
+            'Keys': int(breakdown['Keys'].sum()),
+            'Bytes': int(breakdown['Bytes'].sum()),
+            'Spilled Bytes': int(breakdown['Spilled Bytes'].sum()),
+        })
+    return pd.DataFrame(rows, columns=['Session', 'Idle (s)', 'Keys', 'Bytes', 'Spilled Bytes'])
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Spill / restore
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_-]', '_', name)
+
+
+def _walkable(obj: Any) -> bool:
+    """
+    Whether ``obj`` is one of the app's own plain objects (e.g. ``WhatIfGrid``)
+    whose attributes may hold large arrays. Frozen dataclasses and classes
+    without a ``__dict__`` are left alone.
+    """
+    cls = type(obj)
+    if not cls.__module__.startswith(('app.', 'backend.')) or not hasattr(obj, '__dict__'):
+        return False
+    params = getattr(cls, '__dataclass_params__', None)
+    return not (params is not None and params.frozen)
+
+
+def _spill_value(value: Any, path: Path, min_bytes: int, written: list, depth: int = 0) -> Tuple[Any, int]:
+    """
+    ``value`` with every large frame, series or array inside it written to
+    disk and replaced by a ``Spilled`` placeholder.
+
+    Containers are copied rather than changed, so a rerun that starts in the
+    meantime never sees a half-spilled value; ``value`` itself is returned when
+    nothing was spilled.
+
+    Returns:
+        ``(new value, bytes spilled)``; the files written are appended to ``written``.
+    """
+    np = sys.modules.get('numpy')
+    large_types = _pandas_types()[:2] + ((np.ndarray,) if np is not None else ())
+    if large_types and isinstance(value, large_types):
+        nbytes = deep_size(value)
+        if nbytes < min_bytes:
+            return value, 0
+        target = path.with_name(f'{path.name}.{len(written)}.pkl')
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        written.append(target)
+        return Spilled(path=str(target), nbytes=nbytes), nbytes
+    if depth >= _MAX_DEPTH:
+        return value, 0
+
+    if isinstance(value, dict):
+        items = list(value.items())
+    elif isinstance(value, (list, tuple)):
+        items = list(enumerate(value))
+    elif _walkable(value):
+        items = list(vars(value).items())
+    else:
+        return value, 0
+
+    freed = 0
+    changed = {}
+    for key, item in items:
+        new, nbytes = _spill_value(item, path, min_bytes, written, depth + 1)
+        if new is not item:
+            changed[key] = new
+            freed += nbytes
+    return (_replace(value, changed) if changed else value), freed
+
+
+def _restore_value(value: Any, depth: int = 0) -> Any:
+    """``value`` with every ``Spilled`` placeholder inside it loaded back; files are deleted."""
+    if isinstance(value, Spilled):
+        with open(value.path, 'rb') as f:
+            loaded = pickle.load(f)
+        os.remove(value.path)
+        return loaded
+    if depth >= _MAX_DEPTH:
+        return value
+
+    if isinstance(value, dict):
+        items = list(value.items())
+    elif isinstance(value, (list, tuple)):
+        items = list(enumerate(value))
+    elif _walkable(value):
+        items = list(vars(value).items())
+    else:
+        return value
+
+    changed = {}
+    for key, item in items:
+        new = _restore_value(item, depth + 1)
+        if new is not item:
+            changed[key] = new
+    return _replace(value, changed) if changed else value
+
+
+def _replace(value: Any, changed: Dict[Any, Any]) -> Any:
+    """Shallow copy of a dict, list, tuple or plain object with some items or attributes replaced."""
+    if isinstance(value, dict):
+        return {**value, **changed}
+    if isinstance(value, (list, tuple)):
+        items = [changed.get(i, item) for i, item in enumerate(value)]
+        if isinstance(value, list):
+            return items
+        return tuple(items) if type(value) is tuple else type(value)(*items)
+    clone = copy.copy(value)
+    for key, item in changed.items():
+        setattr(clone, key, item)
+    return clone
+
+
+def spill(session_id: str, state: Any, *, min_bytes: int = SPILL_MIN_BYTES) -> int:
+    """
+    Write a session's large frames, series and arrays to disk and leave
+    ``Spilled`` placeholders.
+
+    Besides top-level values, this walks into dicts, lists and tuples (such
+    as the ``lazy_tabs`` results) and the attributes of the app's own plain
+    objects (such as ``WhatIfGrid`` stages), up to ``_MAX_DEPTH`` levels.
+    Frozen dataclasses and third-party objects (Plotly figures, Stylers) are
+    never changed.
+
+    Each key is swapped under ``_lock`` and only while the session is idle and
+    the key still holds the value that was written out; ``begin_rerun`` waits
+    for a running spill of its session to finish before restoring.
+
+    Returns:
+        Bytes released from memory.
+    """
+    with _lock:
+        entry = _sessions.get(session_id)
+        if entry is not None:
+            if entry.running:
+                return 0
+            entry.spilling = True
+
+    freed = 0
+    directory = SPILL_DIR / _safe_name(session_id)
+    try:
+        for key, value in _items(state).items():
+            if isinstance(value, Spilled):
+                continue
+            written: list = []
+            new, nbytes = _spill_value(value, directory / _safe_name(key), min_bytes, written)
+            if new is value:
+                continue
+            with _lock:
+                running = entry is not None and entry.running
+                current = _items(state).get(key, None) is value
+                if not running and current:
+                    state[key] = new
+                    if entry is not None:
+                        entry.spilled_keys.add(key)
+            if running or not current:
+                for path in written:
+                    path.unlink(missing_ok=True)
+                if running:
+                    break
+                continue
+            freed += nbytes
+    finally:
+        if entry is not None:
+            with _lock:
+                entry.spilling = False
+                _spill_done.notify_all()
+    return freed
+
+
+def restore(state: Any, keys: Optional[Iterable[str]] = None) -> int:
+    """
+    Reload every spilled value of a session in place and delete its files.
+
+    Args:
+        state: The session's state.
+        keys: Keys that may hold placeholders; every key when ``None``.
+
+    Returns:
+        Number of keys restored.
+    """
+    items = _items(state)
+    restored = 0
+    for key in (items if keys is None else keys):
+        value = items.get(key)
+        if value is None:
+            continue
+        new = _restore_value(value)
+        if new is not value:
+            state[key] = new
+            restored += 1
+    return restored
+
+
+def _purge_stale_files(now: float) -> None:
+    if not SPILL_DIR.exists():
+        return
+    for path in SPILL_DIR.glob('*/*.pkl'):
+        try:
+            if now - path.stat().st_mtime > SPILL_FILE_TTL:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def _is_active(session_id: str) -> bool:
+    try:
+        from streamlit.runtime import Runtime
+    except ImportError:
+        return True
+    if not Runtime.exists():
+        return True
+    return bool(Runtime.instance().is_active_session(session_id))
+
+
+def sweep(*, idle_after: float = IDLE_SECONDS, min_bytes: int = SPILL_MIN_BYTES) -> int:
+    """
+    Spill large frames of every session idle for ``idle_after`` seconds and stop
+    tracking disconnected sessions (after spilling them).
+
+    Returns:
+        Bytes released from memory.
+    """
+    now = time.monotonic()
+    with _lock:
+        candidates = [
+            (session_id, entry) for session_id, entry in _sessions.items()
+            if not entry.running and now - entry.last_active >= idle_after
+        ]
+
+    freed = 0
+    for session_id, entry in candidates:
+        freed += spill(session_id, entry.state, min_bytes=min_bytes)
+        if not _is_active(session_id):
+            with _lock:
+                if _sessions.get(session_id) is entry:
+                    del _sessions[session_id]
+
+    _purge_stale_files(time.time())
+    return freed
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Rerun hooks
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _context() -> Optional[Any]:
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    return get_script_run_ctx(suppress_warning=True)
+
+
+def begin_rerun() -> None:
+    """
+    Mark the current session active and transparently reload anything spilled.
+    Call at the top of ``main.py``, before any page reads session state.
+    """
+    ctx = _context()
+    if ctx is None:
+        return
+    with _lock:
+        entry = _sessions.get(ctx.session_id)
+        if entry is None:
+            _sessions[ctx.session_id] = _Tracked(ctx.session_state)
+            keys = None
+        else:
+            entry.state = ctx.session_state
+            entry.running = True
+            entry.last_active = time.monotonic()
+            # A spill in progress stops at its next key once it sees ``running``.
+            while entry.spilling:
+                _spill_done.wait()
+            keys, entry.spilled_keys = entry.spilled_keys, set()
+    restore(ctx.session_state, keys)
+
+
+def end_rerun() -> None:
+    """
+    Mark the current session idle from now and run a sweep if one is due.
+    Call at the end of ``main.py``.
+    """
+    global _last_sweep
+
+    ctx = _context()
+    if ctx is None:
+        return
+    now = time.monotonic()
+    with _lock:
+        entry = _sessions.get(ctx.session_id)
+        if entry is not None:
+            entry.running = False
+            entry.last_active = now
+        due = now - _last_sweep >= SWEEP_INTERVAL
+        if due:
+            _last_sweep = now
+    if due:
+        sweep()
+
+
+def render_panel() -> None:
+    """Opt-in sidebar panel with per-session and per-key memory use."""
+    import streamlit as st
+
+    with st.sidebar:
+        if not st.toggle('🧠 Session Memory', key='session_memory_panel'):
+            return
+
+        mb = {'Bytes': st.column_config.NumberColumn('MB', format='%.2f'),
+              'Spilled Bytes': st.column_config.NumberColumn('Spilled MB', format='%.2f')}
+
+        st.caption('This session')
+        breakdown = state_breakdown(st.session_state)
+        breakdown[['Bytes', 'Spilled Bytes']] /= 2 ** 20
+        st.dataframe(breakdown, hide_index=True, use_container_width=True, column_config=mb)
+
+        st.caption('All sessions')
+        report = memory_report()
+        report[['Bytes', 'Spilled Bytes']] /= 2 ** 20
+        st.dataframe(report, hide_index=True, use_container_width=True, column_config=mb)
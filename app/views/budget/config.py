@@ -1,7 +1 @@
-PERIOD_MAP = {
-    'Weekly': 52,
-    'Semi-Monthly': 24,
-    'Monthly': 12,
-    'Quarterly': 4,
-    'Annual': 1,
-}
\ No newline at end of file
+from backend.calculations import PERIOD_MAP  # noqa: F401
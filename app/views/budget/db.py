@@ -1,9 +1,16 @@
 import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import streamlit as st
 
+from backend import calculations, schemas
+from backend.storage import TableStore
+from backend.summaries import IncomeSummary
+
+# Expenses live in ``backend``; these functions keep the session copy in sync and rerun.
+store = TableStore('data/budget_data.csv', schemas.BUDGET)
+
 
 def add_expense(category: str) -> None:
     """
@@ -18,27 +25,12 @@ def add_expense(category: str) -> None:
     # Keeps expander of the category of the added expense open.
     st.session_state[f'exp_{category}'] = True
 
-    df = st.session_state.budget_data.copy()
-    new_id = int(df['ID'].max() + 1) if not df.empty else 1
-
-    new_row = {
-        'ID': new_id,
-        'Date': datetime.date.today(),
-        'Category': category,
-        'Name': 'New Expense',
-        'Amount': 0.0,
-        'Frequency': 'Monthly',
-        'Tax Deductible': False,
-        'Notes': '',
-        'Status': 'Active',
-    }
-
-    df = pd.concat(
-        [df, pd.DataFrame([new_row])],
-        ignore_index=True,
+    store.add(
+        Date=pd.Timestamp(datetime.date.today()),
+        Category=category,
+        Name='New Expense',
     )
-    st.session_state.budget_data = df
-    _save_df()
+    st.session_state.budget_data = store.load()
     st.rerun()
 
 
@@ -68,23 +60,23 @@ def save_expense(
     Returns:
         None
     """
-    df = st.session_state.budget_data.copy()
-    mask = df['ID'] == expense_id
-    df.loc[mask, 'Name'] = name
-    df.loc[mask, 'Amount'] = amount
-    df.loc[mask, 'Frequency'] = frequency
-    df.loc[mask, 'Date'] = last_updated
-    df.loc[mask, 'Tax Deductible'] = tax_deductible
-    df.loc[mask, 'Notes'] = notes
-    df.loc[mask, 'Status'] = status
-
-    st.session_state.budget_data = df
-    _save_df()
+    store.update(
+        expense_id,
+        **{
+            'Name': name,
+            'Amount': amount,
+            'Frequency': frequency,
+            'Date': pd.Timestamp(last_updated),
+            'Tax Deductible': tax_deductible,
+            'Notes': notes,
+            'Status': status,
+        },
+    )
+    st.session_state.budget_data = store.load()
     st.success(f'Expense {expense_id} saved!')
 
     # Keeps expander of the category of the saved expense open.
-    category_of_that_id = df.loc[df['ID'] == expense_id, 'Category'].iloc[0]
-    st.session_state[f'exp_{category_of_that_id}'] = True
+    st.session_state[f'exp_{store.get(expense_id)["Category"]}'] = True
     st.rerun()
 
 
@@ -98,39 +90,20 @@ def delete_expense(expense_id: int) -> None:
     Returns:
         None
     """
-
-    df = st.session_state.budget_data.copy()
-
     # Keeps expander of the category of the deleted expense open.
-    category_of_that_id = df.loc[df['ID'] == expense_id, 'Category'].iloc[0]
-    st.session_state[f'exp_{category_of_that_id}'] = True
-
-    df = df[df['ID'] != expense_id].reset_index(drop=True)
-    st.session_state.budget_data = df
+    st.session_state[f'exp_{store.get(expense_id)["Category"]}'] = True
 
-    _save_df()
+    store.delete(expense_id)
+    st.session_state.budget_data = store.load()
 
     st.warning(f'Deleted expense {expense_id}')
     st.rerun()
 
 
-def _save_df() -> None:
-    """
-    Persist session-state DataFrame to CSV.
-
-    Returns:
-        None
-    """
-    st.session_state.budget_data.to_csv(
-        'data/budget_data.csv',
-        index=False,
-        encoding='utf-8-sig',
-    )
-
-
 def bootstrap_budget_data(
         period_map: Dict[str, float],
         filepath: str = 'data/budget_data.csv',
+        income: Optional[IncomeSummary] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame, List[str], List[str]]:
     """
     Initializes session state for budget data, computes derived budget_plan,
@@ -140,80 +113,30 @@ def bootstrap_budget_data(
         period_map (Dict[str, float]): Dictionary mapping frequency names to
             their corresponding annual-multiplier (e.g., {'Monthly': 12, 'Weekly': 52}).
         filepath (str): Path to the CSV file to load budget data from. Defaults to 'data/budget_data.csv'.
+        income (Optional[IncomeSummary]): Income the plan's '% of Pre-Tax Income' and
+            '% of After Tax Income' columns are shares of. Left empty without it.
 
     Returns:
         Tuple[pd.DataFrame, List[str], List[str]]:
             - budget_data: DataFrame containing original data.
             - budget_plan: DataFrame containing original data plus 'Annual Amount',
-              period columns, and '% of Total Budget'.
+              period columns, and its shares of the budget and of income.
             - expense_categories: List of unique non-null categories from the original data.
             - frequency_options: List of unique non-null frequency values from the original data.
     """
     # ─── Load or initialize session_state.budget_data ───────────────────────────
     if 'budget_data' not in st.session_state:
-        try:
-            st.session_state.budget_data = pd.read_csv(
-                filepath,
-                encoding='utf-8-sig',
-            )
-        except FileNotFoundError:
-            st.session_state.budget_data = pd.DataFrame(
-                columns=[
-                    'ID',
-                    'Date',
-                    'Category',
-                    'Name',
-                    'Amount',
-                    'Frequency',
-                    'Tax Deductible',
-                    'Notes',
-                    'Status',
-                ]
-            )
-
-    # ─── Create budget_plan and compute 'Annual Amount' ─────────────────────────
-    budget_plan = st.session_state.budget_data.copy()
-    budget_plan['Annual Amount'] = (
-            budget_plan['Frequency']
-            .fillna('Monthly')
-            .map(period_map)
-            .fillna(0)
-            .astype(int)
-            * budget_plan['Amount']
-    )
-
-    # ─── Compute per-period columns based on period_map ─────────────────────────
-    for period in period_map.keys():
-        budget_plan[period] = budget_plan['Annual Amount'] / period_map[period]
-
-    # ─── Compute percentage of total budget ─────────────────────────────────────
-    total_annual = budget_plan['Annual Amount'].sum()
-    budget_plan['% of Total Budget'] = (
-        budget_plan['Annual Amount'] / total_annual * 100
-        if total_annual != 0 else 0
-    )
-
-    budget_plan['Category Total'] = budget_plan.groupby('Category')['Annual Amount'].transform('sum')
-    budget_plan['% of Total Category'] = (
-        budget_plan['Annual Amount'] / budget_plan['Category Total'] * 100
-    )
-
-    # TODO: Implement theses
-    budget_plan['% of After Tax Income'] = 'N/A'
-    budget_plan['% of Pre-Tax Income'] = 'N/A'
-
-    # ─── Extract unique non-null categories and frequencies ──────────────────────
-    expense_categories = (
-        st.session_state.budget_data['Category']
-        .dropna()
-        .unique()
-        .tolist()
-    )
-    frequency_options = (
-        st.session_state.budget_data['Frequency']
-        .dropna()
-        .unique()
-        .tolist()
+        st.session_state.budget_data = TableStore(filepath, schemas.BUDGET).load()
+
+    budget_data = st.session_state.budget_data
+    return (
+        budget_data,
+        calculations.budget_plan(
+            budget_data,
+            period_map,
+            pre_tax_income=income.total_comp_pre_tax if income is not None else 0.0,
+            after_tax_income=income.total_comp_post_tax if income is not None else 0.0,
+        ),
+        calculations.unique_values(budget_data, 'Category'),
+        calculations.unique_values(budget_data, 'Frequency'),
     )
-
-    return st.session_state.budget_data, budget_plan, expense_categories, frequency_options
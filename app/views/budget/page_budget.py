@@ -1,50 +1,69 @@
 import streamlit as st
 
+from app import lazy_tabs
 from app import pages
+from app import perf
 from app.views.budget import db
 from app.views.budget.tabs import expenses
+from app.views.budget.tabs import statistics
 from app.views.budget.tabs import summary
 from app.views.budget.config import (
     PERIOD_MAP,
 )
+from backend import summaries
 
 # --- Session State Bootstrap ------------------------------------------------
 
-budget_data, budget_plan, expense_categories, frequency_options = db.bootstrap_budget_data(
-    period_map=PERIOD_MAP,
-    filepath='data/budget_data.csv',
-)
+with perf.span('load'):
+    income_summary = summaries.table_summary('data/income.csv')
+    budget_data, budget_plan, expense_categories, frequency_options = db.bootstrap_budget_data(
+        period_map=PERIOD_MAP,
+        filepath='data/budget_data.csv',
+        income=income_summary,
+    )
+    # The plan's income shares change with the income file too.
+    budget_version = (lazy_tabs.frame_version(budget_data), income_summary.version)
 
 # --- Main Layout -------------------------------------------------------------
 
 st.title(pages.budget_page.title)
 
-tabs = st.tabs(
+tabs = lazy_tabs.tabs(
     [
         'Summary',
         'Statistics',
         'Expenses',
         'Settings'
-    ]
+    ],
+    key='budget_tabs',
 )
 
-with tabs[0]:
-    st.write('# Summary - Total Budget')
+# Only the open tab is rendered.
+if lazy_tabs.is_open(tabs[0]):
+    with tabs[0], perf.span('render:summary'):
+        st.write('# Summary - Total Budget')
 
-    summary.display_budget_summary_metrics(
-        budget_plan=budget_plan,
-        period_map=PERIOD_MAP,
-        annual_amount_col='Annual Amount',
-    )
+        summary.display_budget_summary_metrics(
+            budget_summary=summaries.table_summary('data/budget_data.csv'),
+            period_map=PERIOD_MAP,
+        )
 
-    summary.display_budget_dataframe(
-        budget_plan=budget_plan,
-        period_map=PERIOD_MAP,
-    )
+        summary.display_budget_dataframe(
+            budget_plan=budget_plan,
+            period_map=PERIOD_MAP,
+            version=budget_version,
+        )
 
-with tabs[2]:
-    expenses.render_expenses_tab(
-        budget_data=budget_data,
-        expense_categories=expense_categories,
-        frequency_options=frequency_options,
-    )
+if lazy_tabs.is_open(tabs[1]):
+    with tabs[1], perf.span('render:statistics'):
+        statistics.render_statistics_tab(
+            budget_plan=budget_plan,
+        )
+
+if lazy_tabs.is_open(tabs[2]):
+    with tabs[2], perf.span('render:expenses'):
+        expenses.render_expenses_tab(
+            budget_data=budget_data,
+            expense_categories=expense_categories,
+            frequency_options=frequency_options,
+        )
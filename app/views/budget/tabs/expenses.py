@@ -1,4 +1,4 @@
-from datetime import datetime
+import datetime
 from typing import (List)
 
 import pandas as pd
@@ -11,6 +11,7 @@ from app.views.budget.db import (
     add_expense,
 )
 from app.views.budget.utils import compute_step
+from backend import search
 
 
 def render_expenses_tab(
@@ -32,13 +33,26 @@ def render_expenses_tab(
 
     st.subheader('Expenses')
 
+    query = st.text_input(
+        '🔍 Search expenses',
+        placeholder='Name, category or notes',
+        key='expense_search',
+    ).strip()
+    if query:
+        hits = search.index_for('data').search(query, datasets=['budget_data.csv'], limit=None)
+        st.caption(f'{len(hits)} matching expense{"" if len(hits) == 1 else "s"}')
+
     for category in expense_categories:
         df_cat = budget_data[budget_data['Category'] == category]
         total = df_cat['Amount'].sum().round(0)
+        if query:
+            df_cat = df_cat[df_cat['ID'].isin([hit.row_id for hit in hits])]
+            if df_cat.empty:
+                continue
 
-        # Look up the “expanded” flag in session_state
+        # Look up the “expanded” flag in session_state; search results are always shown
         exp_key = f"exp_{category}"
-        expanded_flag = st.session_state.get(exp_key, False)
+        expanded_flag = bool(query) or st.session_state.get(exp_key, False)
 
         with st.expander(
                 f'{category} – ${total:,.0f} / Month',
@@ -122,7 +136,7 @@ def render_expenses_tab(
                             amount=amount_input,
                             frequency=freq_input,
                             last_updated=date_input,
-                            tax_deductible=tax_input,
+                            tax_deductible=tax_input == 'Yes',
                             notes=notes_input,
                         )
                     if delete_btn:
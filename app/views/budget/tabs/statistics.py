@@ -0,0 +1,86 @@
+import pandas as pd
+import streamlit as st
+
+from backend.storage import TransactionStore
+from backend.variance import budget_vs_actual
+
+
+def render_statistics_tab(
+        budget_plan: pd.DataFrame,
+) -> None:
+    """
+    Render budget-vs-actual variance for a month or year-to-date, answered from
+    the transaction ledger's running per-month, per-category aggregates.
+
+    Args:
+        budget_plan (pd.DataFrame): DataFrame with 'Category' and 'Annual Amount' columns.
+
+    Returns:
+        None
+    """
+    st.subheader('Budget vs. Actual')
+
+    store = TransactionStore()
+    months = store.months()
+    if not months:
+        st.info('Import transactions on the Settings page to compare the budget with actual spending.')
+        return
+
+    cols = st.columns([1, 1, 2])
+    month = cols[0].selectbox(
+        'Month',
+        options=months[::-1],
+        key='variance_month',
+    )
+    period = cols[1].radio(
+        'Period',
+        options=['Month', 'Year to Date'],
+        horizontal=True,
+        key='variance_period',
+    )
+
+    variance = budget_vs_actual(
+        budget_plan=budget_plan,
+        aggregates=store.aggregates(),
+        month=month,
+        year_to_date=period == 'Year to Date',
+    )
+
+    totals = variance[['Budget', 'Actual', 'Variance']].sum()
+    metric_cols = st.columns(3)
+    metric_cols[0].metric('Budget', f'${totals["Budget"]:,.0f}')
+    metric_cols[1].metric('Actual', f'${totals["Actual"]:,.0f}')
+    metric_cols[2].metric(
+        'Remaining',
+        f'${totals["Variance"]:,.0f}',
+        delta=f'{totals["Variance"] / totals["Budget"] * 100:.1f}%' if totals['Budget'] else None,
+    )
+
+    import plotly.express as px
+
+    fig = px.bar(
+        variance.melt(
+            id_vars='Category',
+            value_vars=['Budget', 'Actual'],
+            var_name='Series',
+            value_name='Amount',
+        ),
+        x='Category',
+        y='Amount',
+        color='Series',
+        barmode='group',
+    )
+    fig.update_layout(margin=dict(t=20, l=0, r=0, b=0), legend_title_text='')
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.dataframe(
+        variance,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Budget': st.column_config.NumberColumn(format='$%.2f'),
+            'Actual': st.column_config.NumberColumn(format='$%.2f'),
+            'Variance': st.column_config.NumberColumn(format='$%.2f'),
+            '% Used': st.column_config.NumberColumn(format='%.1f%%'),
+        },
+    )
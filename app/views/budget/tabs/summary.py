@@ -4,24 +4,28 @@ import pandas as pd
 import pandas as pd
 import streamlit as st
 from typing import Dict
-from app.views.budget.utils import style_budget_plan_df
+from typing import Hashable, Optional
+from app import lazy_tabs
+from app import perf
+from app.views.budget.utils import budget_plan_table
+from backend import table_cache
+from backend.summaries import TableSummary
 
 
 def display_budget_summary_metrics(
-        budget_plan: pd.DataFrame,
+        budget_summary: TableSummary,
         period_map: Dict[str, float],
-        annual_amount_col: str = 'Annual Amount',
 ) -> None:
     """
     Displays summary metrics in Streamlit for each period defined in period_map,
-    calculating the total annual budget divided by each period's divisor.
+    from the budget's materialized summary record.
 
     Args:
-        budget_plan (pd.DataFrame): DataFrame containing an 'Annual Amount' column.
+        budget_summary (TableSummary): Summary record of the budget table.
         period_map (Dict[str, float]): Dictionary mapping period names (e.g., 'Weekly',
             'Monthly', etc.) to their corresponding divisors.
     """
-    total_annual = budget_plan[annual_amount_col].sum()
+    per_period = budget_summary.per_period(period_map)
     cols = st.columns(len(period_map))
 
     for idx, period in enumerate(period_map.keys()):
@@ -29,7 +33,7 @@ def display_budget_summary_metrics(
             st.write(f'### {period}')
             st.metric(
                 label='',
-                value=f'${total_annual / period_map[period]:,.0f}',
+                value=f'${per_period[period]:,.0f}',
             )
 
 
@@ -39,6 +43,7 @@ def display_budget_summary_metrics(
 def display_budget_dataframe(
         budget_plan: pd.DataFrame,
         period_map: Dict[str, float],
+        version: Optional[Hashable] = None,
 ) -> None:
     """
     Displays a styled DataFrame in Streamlit, showing only the specified columns
@@ -50,11 +55,15 @@ def display_budget_dataframe(
             'Category', 'Name', each period key in period_map, and '% of Total Budget'.
         period_map (Dict[str, float]): Dictionary whose keys correspond to period columns
             in budget_plan (e.g., 'Weekly', 'Monthly', etc.).
+        version (Optional[Hashable]): Token of the data behind budget_plan. When given,
+            the styled table is reused across reruns until it changes.
     """
     # ─── Slice off only the columns to display ────────────────────────────────────
     pct_cols = [
         '% of Total Budget',
         '% of Total Category',
+        '% of Pre-Tax Income',
+        '% of After Tax Income',
     ]
 
     display_cols = ([
@@ -71,16 +80,32 @@ def display_budget_dataframe(
                     ]
                     )
     display_df = budget_plan.loc[:, display_cols]
+    if version is not None:
+        # Lets the gradient cache key on the token instead of hashing the cells.
+        table_cache.tag(display_df, f'budget.summary_table-{version}')
 
     # ─── Apply styling and render in Streamlit ──────────────────────────────────
-    styled = style_budget_plan_df(
-        df=display_df,
-        float_cols=list(period_map.keys()),
-        percentage_cols=pct_cols
-    )
+    # Column configs format in the browser; the per-cell heatmap is opt-in.
+    heatmap = st.toggle('Heatmap', value=False, key='budget_summary_heatmap',
+                        help='Colour the percentage columns cell by cell (slower for long plans).')
+
+    def style():
+        return budget_plan_table(
+            df=display_df,
+            float_cols=list(period_map.keys()),
+            percentage_cols=pct_cols,
+            styled=heatmap,
+        )
+
+    with perf.span('style'):
+        if version is None:
+            data, column_config = style()
+        else:
+            data, column_config = lazy_tabs.cached('budget.summary_table', (version, heatmap), style)
 
     st.dataframe(
-        styled,
+        data,
         use_container_width=True,
         hide_index=True,
+        column_config=column_config,
     )
@@ -1,6 +1,26 @@
 import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 import pandas as pd
-from typing import List, Optional, Union
+from pandas.io.formats.style import Styler
+
+from app.lazy_tabs import frame_version
+from backend import table_cache
+
+# Plans longer than this are never rendered with per-cell CSS (see ``budget_plan_table``).
+STYLED_MAX_ROWS = 1_000
+
+# Colours per colormap, as matplotlib's lookup table has them.
+_LUT_SIZE = 256
+_gradient_luts: Dict[str, np.ndarray] = {}
+
+# Gradient CSS frames kept per data version.
+_GRADIENT_CACHE_SIZE = 32
+_gradient_cache: 'OrderedDict[Tuple[str, str], pd.DataFrame]' = OrderedDict()
+_gradient_lock = threading.Lock()
 
 
 def compute_step(amount: float) -> int:
@@ -18,7 +38,90 @@ def compute_step(amount: float) -> int:
     exponent = math.floor(math.log10(amount))
     return 10 ** max(exponent - 1, 0)
 
-from pandas.io.formats.style import Styler
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Gradient colours
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _gradient_lut(cmap: str) -> np.ndarray:
+    """
+    CSS for each of the colormap's 256 colours, with the text colour
+    ``Styler.background_gradient`` would pick for it.
+    """
+    lut = _gradient_luts.get(cmap)
+    if lut is None:
+        import matplotlib
+
+        rgba = matplotlib.colormaps[cmap](np.arange(_LUT_SIZE))
+        rgb = rgba[:, :3]
+        linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        dark = linear @ np.array([0.2126, 0.7152, 0.0722]) < 0.408
+        lut = np.array([
+            f'background-color: {matplotlib.colors.rgb2hex(color)};color: {"#f1f1f1" if is_dark else "#000000"};'
+            for color, is_dark in zip(rgba, dark)
+        ], dtype=object)
+        _gradient_luts[cmap] = lut
+    return lut
+
+
+
+def gradient_css(df: pd.DataFrame, columns: List[str], cmap: str = 'RdYlGn_r') -> pd.DataFrame:
+    """
+    Background-gradient CSS for every cell of ``columns``, each column scaled to its own min and max.
+
+    Gives the same colours as ``Styler.background_gradient`` column by column,
+    but with one lookup into a 256-colour table instead of a matplotlib call
+    per column. Results are cached per version of ``df`` and column names, so
+    reruns over unchanged data reuse them; a frame tagged by its store (see
+    ``table_cache.tag``) is keyed on its token, anything else by value.
+
+    Args:
+        df (pd.DataFrame): Source frame.
+        columns (List[str]): Numeric columns of ``df`` to colour.
+        cmap (str): Matplotlib colormap name.
+
+    Returns:
+        pd.DataFrame: CSS strings shaped like ``df[columns]``; empty for missing values.
+    """
+    version = table_cache.token(df) or frame_version(df[columns])
+    key = (version, tuple(columns), cmap)
+    with _gradient_lock:
+        cached = _gradient_cache.get(key)
+        if cached is not None:
+            _gradient_cache.move_to_end(key)
+            return cached
+
+    df = df[columns]
+    values = df.to_numpy(dtype=float, na_value=np.nan)
+    low = df.min().to_numpy(dtype=float)
+    span = df.max().to_numpy(dtype=float) - low
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scaled = np.where(span > 0, (values - low) / span, 0.0)
+    index = np.clip(np.nan_to_num(scaled * _LUT_SIZE), 0, _LUT_SIZE - 1).astype(np.intp)
+
+    css = _gradient_lut(cmap)[index]
+    css[np.isnan(values)] = ''
+    result = pd.DataFrame(css, index=df.index, columns=df.columns)
+
+    with _gradient_lock:
+        _gradient_cache[key] = result
+        while len(_gradient_cache) > _GRADIENT_CACHE_SIZE:
+            _gradient_cache.popitem(last=False)
+    return result
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Budget plan table
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _check_columns(df: pd.DataFrame, cols: List[str]) -> None:
+    missing = [col for col in cols if col not in df.columns]
+    if missing:
+        raise KeyError(f'The following columns were not found in the DataFrame: {missing}')
+
+
 def style_budget_plan_df(
         df: pd.DataFrame,
         float_cols: list[str],
@@ -30,19 +133,14 @@ def style_budget_plan_df(
 
     Args:
         df (pd.DataFrame): The input DataFrame.
+        float_cols (List[str]): Column names in `df` to format as currency.
         percentage_cols (List[str]): List of column names in `df` whose values range from 0 to 100 and should be treated as percentages.
-        cmap (str): The matplotlib colormap name for the background gradient. Defaults to 'RdYlGn'.
+        cmap (str): The matplotlib colormap name for the background gradient. Defaults to 'RdYlGn_r'.
 
     Returns:
         pd.io.formats.style.Styler: A Styler object with conditional formatting and percentage formatting applied.
     """
-    # Verify that all specified columns exist
-    missing = [col for col in percentage_cols + float_cols if col not in df.columns]
-    if missing:
-        raise KeyError(f'The following columns were not found in the DataFrame: {missing}')
-
-    # Create a copy of the DataFrame to avoid modifying the original
-    df_copy = df.copy()
+    _check_columns(df, percentage_cols + float_cols)
 
     # Build a formatter dict for .format()
     fmt_dict: dict[str, str] = {
@@ -52,19 +150,82 @@ def style_budget_plan_df(
     for col in float_cols:
         fmt_dict[col] = '${:,.2f}'
 
-    # Initialize Styler
-    styler = df_copy.style
+    # One precomputed CSS frame for all percentage columns instead of a
+    # background_gradient (and matplotlib call) per column.
+    css = gradient_css(df, percentage_cols, cmap)
+
+    return (
+        df.style
+        .format(fmt_dict)
+        .apply(lambda _: css, axis=None, subset=percentage_cols)
+    )
+
+
+def budget_plan_column_config(
+        df: pd.DataFrame,
+        float_cols: List[str],
+        percentage_cols: List[str],
+) -> Dict[str, Any]:
+    """
+    ``st.dataframe`` column configs that format the budget plan in the browser.
+
+    Currency columns get a dollar format and percentage columns become
+    progress bars scaled to the column's largest value.
+
+    Args:
+        df (pd.DataFrame): The frame being displayed.
+        float_cols (List[str]): Column names to format as currency.
+        percentage_cols (List[str]): Column names holding percentages (0 to 100).
 
-    # Apply percentage formatting
-    styler = styler.format(fmt_dict)
+    Returns:
+        Dict[str, Any]: Column name to column config.
+    """
+    import streamlit as st
 
+    config: Dict[str, Any] = {
+        col: st.column_config.NumberColumn(format='$%.2f') for col in float_cols
+    }
     for col in percentage_cols:
-        # Apply a background gradient only to percentage columns
-        styler = styler.background_gradient(
-            subset=col,
-            cmap=cmap,
-            vmin=df_copy[col].min(),
-            vmax=df_copy[col].max(),
+        top = df[col].max()
+        config[col] = st.column_config.ProgressColumn(
+            format='%.2f%%',
+            min_value=0.0,
+            max_value=float(top) if pd.notna(top) and top > 0 else 100.0,
         )
+    return config
+
 
-    return styler
+def budget_plan_table(
+        df: pd.DataFrame,
+        float_cols: List[str],
+        percentage_cols: List[str],
+        cmap: str = 'RdYlGn_r',
+        styled: bool = False,
+        max_styled_rows: Optional[int] = STYLED_MAX_ROWS,
+) -> Tuple[Union[Styler, pd.DataFrame], Dict[str, Any]]:
+    """
+    Data and column config to pass to ``st.dataframe`` for a budget plan.
+
+    By default the plain frame is returned and all formatting is done in the
+    browser by the column config, so nothing is serialised per cell. A
+    ``Styler`` with per-cell gradient colours from ``style_budget_plan_df`` is
+    returned only when ``styled`` is set and the plan has at most
+    ``max_styled_rows`` rows.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        float_cols (List[str]): Column names to format as currency.
+        percentage_cols (List[str]): Column names holding percentages (0 to 100).
+        cmap (str): The matplotlib colormap name for the background gradient.
+        styled (bool): Colour percentage cells with a gradient Styler.
+        max_styled_rows (Optional[int]): Largest plan rendered with per-cell
+            colours; ``None`` for no limit.
+
+    Returns:
+        Tuple[Union[Styler, pd.DataFrame], Dict[str, Any]]: ``data`` and
+        ``column_config`` for ``st.dataframe``.
+    """
+    _check_columns(df, percentage_cols + float_cols)
+    if styled and (max_styled_rows is None or len(df) <= max_styled_rows):
+        return style_budget_plan_df(df, float_cols, percentage_cols, cmap), {}
+    return df, budget_plan_column_config(df, float_cols, percentage_cols)
@@ -1,18 +1,41 @@
-import plotly.express as px
+from pathlib import Path
+
+import pandas as pd
 import streamlit as st
 
+from app import figures
+from app import lazy_tabs
 from app import pages
-from app.views.dashboard.models import Budget
+from app import perf
+from backend import summaries, table_cache
+from backend.budget import Budget
 
 st.title(pages.dashboard_page.title)
 
+# Tables each section is drawn from; a write to one drops only that section's figures.
+EXPENSE_FILES = ('budget_data.csv',)
+SUBSCRIPTION_FILES = ('subscriptions.csv',)
+
 
-@st.cache_data
-def load_budget() -> Budget:
-    return Budget.from_csv_folder('data')
+@st.cache_resource(max_entries=4)
+def load_budget(version: tuple) -> Budget:
+    # ``version`` only keys the cache, so saved edits show up on the next rerun.
+    # The disk cache keeps the loaded budget across restarts, keyed by file contents.
+    # Kept as a shared resource rather than copied per rerun: the budget is
+    # read-only, and its tables keep the version tokens the disk cache tagged
+    # them with, so the section caches below never hash them.
+    return table_cache.cached('budget', Budget.from_csv_folder, Path('data'))
 
 
-budget = load_budget()
+with perf.span('load'):
+    data_version = lazy_tabs.files_version('data')
+    budget = load_budget(data_version)
+    # Per-table versions key the section aggregates, so saving a subscription
+    # leaves the expense aggregates cached and vice versa.
+    expenses_version = lazy_tabs.files_version('data', 'budget*.csv')
+    subscriptions_version = lazy_tabs.files_version('data', 'subscriptions.csv')
+    # Top metrics come from the summary records the write paths keep current.
+    totals = summaries.budget_summary('data')
 
 
 # ── Top metrics ──────────────────────────────────────────────────────────────
@@ -25,125 +48,49 @@ def surplus_delta(val: float) -> str:
     return money(abs(val)) if val else ''
 
 
-# ── 3 : 1 split ─────────────────────────────────────────────────────────────
-left_col, right_col = st.columns([3, 1], gap='large')
-
-# ────────────────────────────────────────────────────────────────────────────
-# LEFT  ▸  Income container
-# ────────────────────────────────────────────────────────────────────────────
-with left_col:
-    with st.container(border=True):
-        st.markdown('### Income')
-
-        income_cols = {
-            'Salary': (
-                budget.income.salary_pre_tax,
-                budget.income.salary_taxes,
-                budget.income.salary_post_tax,
-            ),
-            'Bonus': (
-                budget.income.bonus_pre_tax,
-                budget.income.bonus_taxes,
-                budget.income.bonus_post_tax,
-            ),
-            'Total Comp': (
-                budget.income.total_comp_pre_tax,
-                budget.income.total_taxes,
-                budget.income.total_comp_post_tax,
-            ),
-        }
-
-        subcols = st.columns(len(income_cols))
-        for col, (hdr, vals) in zip(subcols, income_cols.items()):
-            pre, tax, post = vals
-            col.metric(f'{hdr} (Pre-Tax)', money(pre))
-            col.metric(f'{hdr} Taxes', money(tax))
-            col.metric(f'{hdr} (After)', money(post))
-
-# ────────────────────────────────────────────────────────────────────────────
-# RIGHT ▸  Budget container
-# ────────────────────────────────────────────────────────────────────────────
-with right_col:
-    with st.container(border=True):
-        st.markdown(
-            '### Budget',
-        )
-
-        st.metric('Total Comp (After Tax)',
-                  money(budget.income.total_comp_post_tax))
-
-        st.metric('Total Annual Expense',
-                  money(budget.total_expense))
-
-        surplus = budget.annual_surplus
-        st.metric(
-            label='Annual Surplus',
-            value=money(surplus),
-        )
-
-# ── Raw tables ────────────────────────────────────────────────────
-t1, t2, t3, t4 = st.tabs(['Expenses', 'Subscriptions', 'Planned Purchases', 'Income'])
-
-with t1:
-    import pandas as pd
+# Pie with % + $ on label & hover
+def make_pie(
+        df: pd.DataFrame,
+        label_col: str,
+        value_col: str = 'Annual',
+        *,
+        text_size: int = 14,  # tweak these two knobs if you like
+):
+    # Figures are cached, so plotly.express is only needed on a cache miss.
     import plotly.express as px
-    import streamlit as st
-
-    # ----------------------------------------------------------------------
-    # 1) Pull the raw table once (whatever object you already have)
-    # ----------------------------------------------------------------------
-    exp_df: pd.DataFrame = budget.expenses.table
-
-    # Ensure the key columns exist
-    required_cols = {'Super Category', 'Category', 'Annual'}
-    missing = required_cols - set(exp_df.columns)
-    if missing:
-        st.error(f'Missing columns: {missing}')
-        st.stop()
-
-
-    # ----------------------------------------------------------------------
-    # 2) Helper to build a pie with % + $ on label & hover
-    # ----------------------------------------------------------------------
-    def make_pie(
-            df: pd.DataFrame,
-            label_col: str,
-            value_col: str = 'Annual',
-            *,
-            text_size: int = 14,  # tweak these two knobs if you like
-    ):
-        fig = px.pie(
-            df,
-            names=label_col,
-            values=value_col,
-        )
 
-        fig.update_traces(
-            texttemplate=(
-                '<b>%{label}</b><br>'  # <b> makes label itself bold
-                '%{percent:.1%}<br>'
-                '$%{value:,.0f}'
-            ),
-            textfont=dict(size=text_size),  # ← bigger/bolder slice text
-            hovertemplate=(
-                '<b>%{label}</b><br>'
-                'Share of total&nbsp;: %{percent:.1%}<br>'
-                'Annual cost&nbsp;&nbsp;&nbsp;: $%{value:,.0f}<extra></extra>'
-            ),
-        )
+    fig = px.pie(
+        df,
+        names=label_col,
+        values=value_col,
+    )
 
-        fig.update_layout(
-            showlegend=False,
-            margin=dict(t=40, l=0, r=0, b=80),
-            font=dict(size=text_size),  # global font size (tooltips, etc.)
-            hoverlabel=dict(font_size=text_size + 4),  # 🔧 tooltip font bump
-        )
+    fig.update_traces(
+        texttemplate=(
+            '<b>%{label}</b><br>'  # <b> makes label itself bold
+            '%{percent:.1%}<br>'
+            '$%{value:,.0f}'
+        ),
+        textfont=dict(size=text_size),  # ← bigger/bolder slice text
+        hovertemplate=(
+            '<b>%{label}</b><br>'
+            'Share of total&nbsp;: %{percent:.1%}<br>'
+            'Annual cost&nbsp;&nbsp;&nbsp;: $%{value:,.0f}<extra></extra>'
+        ),
+    )
 
-        return fig
+    fig.update_layout(
+        showlegend=False,
+        margin=dict(t=40, l=0, r=0, b=80),
+        font=dict(size=text_size),  # global font size (tooltips, etc.)
+        hoverlabel=dict(font_size=text_size + 4),  # 🔧 tooltip font bump
+    )
+
+    return fig
 
 
-    # 3) Aggregate for super-categories and for categories *within 'Essentials'*
-    # ----------------------------------------------------------------------
+def expense_aggregates(exp_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Annual spend per super category, and per category within 'Essentials'."""
     super_df = (
         exp_df
         .groupby('Super Category', as_index=False)['Annual']
@@ -160,38 +107,14 @@ with t1:
         .groupby('Category', as_index=False)['Annual']
         .sum()
     )
+    return super_df, cat_df
 
-    # 4) Render pies side-by-side
-    # ----------------------------------------------------------------------
-    left_col, right_col = st.columns(2)
-
-    with left_col:
-        st.subheader('Budget by Super Category')
-        st.plotly_chart(
-            make_pie(super_df, 'Super Category'),
-            use_container_width=True,
-        )
-
-    with right_col:
-        st.subheader('Essentials — Breakdown by Category')
-        st.plotly_chart(
-            make_pie(cat_df, 'Category'),
-            use_container_width=True,
-        )
-
-    st.divider()
-    st.dataframe(budget.expenses.table)
 
-with t2:
-    # ── Aggregate spend per subscription ────────────────────────────────────────
-    src = (
-        budget.subscriptions.table
-        .groupby('Subscription/ Recurring Expense', as_index=False)['Annual']
-        .sum()
-    )
+def make_treemap(df: pd.DataFrame):
+    import plotly.express as px
 
     fig = px.treemap(
-        src,
+        df,
         path=['Subscription/ Recurring Expense'],
         values='Annual',
         title='Annual spend by subscription',
@@ -214,13 +137,141 @@ with t2:
         ),
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+# ── 3 : 1 split ─────────────────────────────────────────────────────────────
+left_col, right_col = st.columns([3, 1], gap='large')
+
+# ────────────────────────────────────────────────────────────────────────────
+# LEFT  ▸  Income container
+# ────────────────────────────────────────────────────────────────────────────
+with left_col:
+    with st.container(border=True):
+        st.markdown('### Income')
+
+        income_cols = {
+            'Salary': (
+                totals.income.salary_pre_tax,
+                totals.income.salary_taxes,
+                totals.income.salary_post_tax,
+            ),
+            'Bonus': (
+                totals.income.bonus_pre_tax,
+                totals.income.bonus_taxes,
+                totals.income.bonus_post_tax,
+            ),
+            'Total Comp': (
+                totals.income.total_comp_pre_tax,
+                totals.income.total_taxes,
+                totals.income.total_comp_post_tax,
+            ),
+        }
+
+        subcols = st.columns(len(income_cols))
+        for col, (hdr, vals) in zip(subcols, income_cols.items()):
+            pre, tax, post = vals
+            col.metric(f'{hdr} (Pre-Tax)', money(pre))
+            col.metric(f'{hdr} Taxes', money(tax))
+            col.metric(f'{hdr} (After)', money(post))
+
+# ────────────────────────────────────────────────────────────────────────────
+# RIGHT ▸  Budget container
+# ────────────────────────────────────────────────────────────────────────────
+with right_col:
+    with st.container(border=True):
+        st.markdown(
+            '### Budget',
+        )
+
+        st.metric('Total Comp (After Tax)',
+                  money(totals.income.total_comp_post_tax))
+
+        st.metric('Total Annual Expense',
+                  money(totals.total_expense))
 
-    st.dataframe(budget.subscriptions.table)
+        surplus = totals.annual_surplus
+        st.metric(
+            label='Annual Surplus',
+            value=money(surplus),
+        )
+
+# ── Raw tables ────────────────────────────────────────────────────
+t1, t2, t3, t4 = lazy_tabs.tabs(
+    ['Expenses', 'Subscriptions', 'Planned Purchases', 'Income'],
+    key='dashboard_tabs',
+)
+
+# Only the open tab is computed and rendered; its aggregates are kept per data version.
+if lazy_tabs.is_open(t1):
+    with t1, perf.span('render:expenses'):
+        # ----------------------------------------------------------------------
+        # 1) Pull the raw table once (whatever object you already have)
+        # ----------------------------------------------------------------------
+        exp_df: pd.DataFrame = budget.expenses.table
+
+        # Ensure the key columns exist
+        required_cols = {'Super Category', 'Category', 'Annual'}
+        missing = required_cols - set(exp_df.columns)
+        if missing:
+            st.error(f'Missing columns: {missing}')
+            st.stop()
+
+        # 2) Aggregate for super-categories and for categories *within 'Essentials'*
+        # ----------------------------------------------------------------------
+        super_df, cat_df = lazy_tabs.cached(
+            'dashboard.expenses',
+            expenses_version,
+            lambda: table_cache.cached('dashboard.expense_aggregates', expense_aggregates, exp_df),
+        )
+
+        # 3) Render pies side-by-side
+        # ----------------------------------------------------------------------
+        left_col, right_col = st.columns(2)
+
+        with left_col:
+            st.subheader('Budget by Super Category')
+            st.plotly_chart(
+                figures.cached_figure('dashboard.pie', super_df, make_pie, label_col='Super Category',
+                                      depends_on=EXPENSE_FILES),
+                use_container_width=True,
+                key='super_category_pie',
+            )
+
+        with right_col:
+            st.subheader('Essentials — Breakdown by Category')
+            st.plotly_chart(
+                figures.cached_figure('dashboard.pie', cat_df, make_pie, label_col='Category',
+                                      depends_on=EXPENSE_FILES),
+                use_container_width=True,
+                key='category_pie',
+            )
+
+        st.divider()
+        st.dataframe(budget.expenses.table)
+
+if lazy_tabs.is_open(t2):
+    with t2, perf.span('render:subscriptions'):
+        # ── Aggregate spend per subscription ────────────────────────────────────
+        src = lazy_tabs.cached(
+            'dashboard.subscriptions',
+            subscriptions_version,
+            lambda: (
+                budget.subscriptions.table
+                .groupby('Subscription/ Recurring Expense', as_index=False)['Annual']
+                .sum()
+            ),
+        )
 
-t3.dataframe(budget.planned_purchases.table)
-t4.dataframe(budget.income.table)
+        fig = figures.cached_figure('dashboard.treemap', src, make_treemap,
+                                    depends_on=SUBSCRIPTION_FILES)
 
+        st.plotly_chart(fig, use_container_width=True)
 
+        st.dataframe(budget.subscriptions.table)
 
+if lazy_tabs.is_open(t3):
+    t3.dataframe(budget.planned_purchases.table)
 
+if lazy_tabs.is_open(t4):
+    t4.dataframe(budget.income.table)
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app import figures
+from app import lazy_tabs
+from app import pages
+from app import perf
+from backend import debt, schemas, summaries
+from backend.storage import TableStore
+
+st.title(pages.debts_page.title)
+
+store = TableStore('data/debts.csv', schemas.DEBTS)
+
+# Extra payments swept for the payoff-time chart.
+SWEEP_STEPS = 41
+
+with perf.span('load'):
+    debts = store.load()
+    monthly_surplus = summaries.budget_summary('data').annual_surplus / 12
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+def months_label(months: float) -> str:
+    return 'Never' if np.isnan(months) else f'{months:.0f} months'
+
+
+def debt_free_date(months: float) -> str:
+    if np.isnan(months):
+        return f'Not within {debt.MAX_MONTHS // 12} years'
+    return f'Debt-free by {pd.Timestamp.today() + pd.DateOffset(months=int(months)):%b %Y}'
+
+
+def make_sweep_chart(df: pd.DataFrame):
+    import plotly.express as px
+
+    fig = px.line(df, x='Extra Payment', y='Months', color='Strategy',
+                  hover_data={'Interest': ':$,.0f', 'Extra Payment': ':$,.0f'})
+    fig.update_layout(height=400, margin=dict(t=30, b=30), xaxis_tickprefix='$')
+    return fig
+
+
+def make_balance_chart(df: pd.DataFrame):
+    import plotly.express as px
+
+    fig = px.line(df, x='Month', y='Balance', color='Strategy')
+    fig.update_layout(height=400, margin=dict(t=30, b=30), yaxis_tickprefix='$')
+    return fig
+
+
+tabs = lazy_tabs.tabs(['Payoff Plan', 'Debts'], key='debts_tabs')
+
+if lazy_tabs.is_open(tabs[0]):
+    with tabs[0], perf.span('render:plan'):
+        if debts.empty:
+            st.info('Add your debts in the Debts tab to plan their payoff.')
+        else:
+            default_extra = float(max(round(monthly_surplus, -1), 0.0))
+            cols = st.columns(2)
+            with cols[0]:
+                extra = st.number_input('Extra Monthly Payment', min_value=0.0, value=default_extra, step=50.0,
+                                        key='debt_extra')
+                st.caption(f'Budget surplus: ${monthly_surplus:,.0f} per month')
+            with cols[1]:
+                sweep_max = st.number_input('Compare Extra Payments Up To', min_value=100.0,
+                                            value=float(max(1_000.0, round(2 * default_extra, -2))), step=100.0,
+                                            key='debt_sweep_max')
+
+            # Every strategy at every swept extra payment, plus the chosen one, in one simulation
+            extras = np.unique(np.append(np.linspace(0, sweep_max, SWEEP_STEPS), extra))
+            with perf.span('simulate'):
+                plan = lazy_tabs.cached(
+                    'debts.plan',
+                    (lazy_tabs.frame_version(debts), extras.tobytes()),
+                    lambda: debt.simulate(debts, extras),
+                )
+            chosen = int(np.searchsorted(plan.extras, extra))
+
+            for col, (i, strategy) in zip(st.columns(len(plan.strategies)), enumerate(plan.strategies)):
+                with col:
+                    st.metric(label=strategy, value=months_label(plan.months[i, chosen]),
+                              delta=f'${plan.interest[i, chosen]:,.0f} interest', delta_color='inverse')
+                    st.caption(debt_free_date(plan.months[i, chosen]))
+
+            st.subheader('Months to Payoff by Extra Payment')
+            st.plotly_chart(
+                figures.cached_figure('debts.sweep', plan.summary(), make_sweep_chart, depends_on=('debts.csv',)),
+                use_container_width=True,
+            )
+
+            st.subheader(f'Total Balance with ${extra:,.0f} Extra per Month')
+            balance = plan.balance[:, chosen, :]
+            balance_df = pd.DataFrame({
+                'Strategy': np.repeat(plan.strategies, balance.shape[1]),
+                'Month': np.tile(np.arange(1, balance.shape[1] + 1), len(plan.strategies)),
+                'Balance': balance.ravel(),
+            })
+            st.plotly_chart(
+                figures.cached_figure('debts.balance', balance_df, make_balance_chart, depends_on=('debts.csv',)),
+                use_container_width=True,
+            )
+
+            st.subheader('Payoff Order')
+            strategy = st.radio('Strategy', plan.strategies, horizontal=True, key='debt_strategy')
+            payoff = debts[['Name', 'Balance', 'APR', 'Minimum Payment']].assign(
+                APR=debts['APR'] * 100,
+                **{'Paid Off In (Months)': plan.payoff_month[plan.strategies.index(strategy), chosen]},
+            )
+            st.dataframe(
+                payoff.sort_values('Paid Off In (Months)', na_position='last'),
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    'Balance': st.column_config.NumberColumn(format='$%.2f'),
+                    'APR': st.column_config.NumberColumn(format='%.2f%%'),
+                    'Minimum Payment': st.column_config.NumberColumn(format='$%.2f'),
+                },
+            )
+            st.caption('Avalanche pays the highest APR first, snowball the smallest balance first and custom '
+                       'follows each debt\'s priority. Minimums of paid-off debts roll into the extra payment.')
+
+if lazy_tabs.is_open(tabs[1]):
+    with tabs[1], perf.span('render:debts'):
+        # APR is stored as a fraction and edited as a percentage.
+        edited = st.data_editor(
+            debts.assign(APR=debts['APR'] * 100),
+            num_rows='dynamic',
+            hide_index=True,
+            use_container_width=True,
+            key='debts_editor',
+            column_config={
+                'ID': None,
+                'Balance': st.column_config.NumberColumn(format='$%.2f', min_value=0.0),
+                'APR': st.column_config.NumberColumn('APR (%)', format='%.2f', min_value=0.0),
+                'Minimum Payment': st.column_config.NumberColumn(format='$%.2f', min_value=0.0),
+                'Priority': st.column_config.NumberColumn(help='Payoff order for the custom strategy (1 = first)',
+                                                          min_value=1, step=1),
+            },
+        )
+        if st.button('💾 Save Debts', type='primary'):
+            store.save(edited.dropna(subset=['Name']).assign(APR=edited['APR'] / 100))
+            st.success('Debts saved.')
+            st.rerun()
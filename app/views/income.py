@@ -1,17 +1,112 @@
+import datetime
 import streamlit as st
+import numpy as np
 import pandas as pd
 import os
 from pathlib import Path
-import plotly.express as px
+from app import figures
+from app import lazy_tabs
 from app import pages
+from app import perf
+from backend import paycheck, schemas, summaries
+from backend.income import IncomeStore
+from backend.storage import TableStore
+from backend.whatif import AXES, WhatIfGrid, grid_slice
 
 st.title(pages.income_page.title)
 
 # Construct the correct file path
 file_path = Path(os.getcwd()) / "data" / "income.csv"
 
-# Read the CSV file
-income_data = pd.read_csv(file_path)
+# Cached per file version; every write through the store refreshes it
+store = IncomeStore(file_path)
+
+with perf.span('load'):
+    income_data = store.load()
+    income_metrics = store.metrics()
+
+# Slice colours for the after-tax compensation breakdowns
+CUSTOM_COLORS = {
+    "After Tax Salary": "#1f77b4",  # Blue
+    "After Tax Bonus": "#aec7e8",  # Orange
+    "Salary Tax": "#d62728",  # Green
+    "Bonus Tax": "#ff9896",  # Red
+}
+
+
+def make_pie(df, title, color_map=None):
+    """Pie of ``df['Amount']`` by ``df['Category']`` with the legend below the chart."""
+    # Figures are cached, so plotly.express is only needed on a cache miss.
+    import plotly.express as px
+
+    color_kwargs = dict(color="Category", color_discrete_map=color_map) if color_map else {}
+    fig = px.pie(df, names="Category", values="Amount", title=title, **color_kwargs)
+    fig.update_layout(height=400, width=400, legend=dict(
+        orientation="h",  # Horizontal legend
+        yanchor="top",  # Align from the top
+        y=-0.3,  # Adjust this value downward if overlapping occurs (e.g., -0.4)
+        xanchor="center",
+        x=0.5
+    ),
+                      margin=dict(t=50, b=100))
+    return fig
+
+
+def annual_expense():
+    """Total annual expense from the summary records, or ``None`` before any budget is saved."""
+    totals = summaries.budget_summary('data')
+    return totals.total_expense if totals.expenses.version != (0, 0) else None
+
+
+# Display format for each what-if axis
+AXIS_FORMATS = {"Salary": "${:,.0f}", "Bonus": "${:,.0f}", "Raise": "{:.0%}", "Tax Rate": "{:.1%}"}
+
+
+def whatif_axes(base_salary, base_bonus):
+    """Values swept along each axis, centred on the selected sources' pay."""
+    base_salary = base_salary or 100_000
+    base_bonus = base_bonus or 0.1 * base_salary
+    return {
+        "Salary": np.round(np.linspace(0.5, 1.5, 41) * base_salary, -2),
+        "Bonus": np.round(np.linspace(0, 2, 21) * base_bonus, -2),
+        "Raise": np.linspace(0, 0.2, 11),
+        "Tax Rate": np.linspace(0.1, 0.5, 21),
+    }
+
+
+def make_heatmap(df, measure):
+    """Heatmap of ``df`` (rows on the y axis); surplus is centred on zero."""
+    import plotly.express as px
+
+    midpoint = dict(color_continuous_midpoint=0) if measure == "Annual Surplus" else {}
+    fig = px.imshow(df, aspect="auto", origin="lower", color_continuous_scale="RdYlGn",
+                    labels=dict(x=df.columns.name, y=df.index.name, color=measure), **midpoint)
+    fig.update_layout(height=500, margin=dict(t=30, b=30))
+    return fig
+
+
+# Tables the paycheck schedule is drawn from
+PAYCHECK_FILES = ("income.csv", "budget_data.csv", "subscriptions.csv")
+
+
+def paycheck_plan(sources, expenses, subscriptions, frequency, pretax_rate, year):
+    """Paycheck schedule of the selected sources and the bills each payday covers."""
+    schedule = paycheck.paycheck_schedule(sources, paycheck.pay_dates(year, frequency), pretax_rate)
+    bills = paycheck.due_dates(paycheck.recurring_items(expenses, subscriptions), year)
+    coverage, bills = paycheck.allocate(schedule, bills)
+    return schedule, coverage, bills
+
+
+def make_coverage_bar(df):
+    """Bars of what each payday leaves after the bills it covers; short paydays in red."""
+    import plotly.express as px
+
+    fig = px.bar(df, x="Pay Date", y="Left Over", color=np.where(df["Left Over"] < 0, "Short", "Covered"),
+                 color_discrete_map={"Covered": "#2ca02c", "Short": "#d62728"},
+                 hover_data={"Net": ":$,.0f", "Due": ":$,.0f", "Bills": True})
+    fig.update_layout(height=400, margin=dict(t=30, b=30), legend_title_text="")
+    return fig
+
 
 lhs_col, rhs_col = st.columns([3, 1])
 
@@ -23,8 +118,14 @@ with rhs_col:
     if "income_values" not in st.session_state:
         st.session_state.income_values = {}
 
-    # Convert DataFrame column to a list for selectbox options
-    job_titles = income_data["Job Title"].tolist()
+    # Selections hold income IDs; job titles are only labels
+    income_ids = income_metrics.index.tolist()
+    job_titles = income_metrics["Job Title"].to_dict()
+    default_id = income_ids[0] if income_ids else None
+
+
+    def job_title(income_id):
+        return job_titles.get(income_id, "")
 
 
     # Function to add a new income source dynamically
@@ -50,14 +151,12 @@ with rhs_col:
     # Function to reset income sources
     def reset_income_sources():
         st.session_state.income_sources = [1]  # Reset to only Income 1
-        st.session_state.income_values = {"income_1": job_titles[0]}  # Reset to default value
+        st.session_state.income_values = {"income_1": default_id}  # Reset to default value
 
 
     @st.dialog(title='Create Income Source')
     def create_new_income_source():
 
-        existing_income_data = pd.read_csv(file_path)
-
         new_job_title = st.text_input('Job Title')
         new_salary = st.number_input('Salary', min_value=0, step=1_000)
         new_bonus = st.number_input('Bonus', min_value=0, step=1_000)
@@ -73,98 +172,45 @@ with rhs_col:
             save_and_add = st.button('Add Income Source')
 
         if save_and_close or save_and_add:
-            new_income_data = pd.DataFrame(
-                [
-                    {
-                        "Job Title": new_job_title,
-                        "Salary": new_salary,
-                        "Bonus": new_bonus,
-                        "Total Compensation": new_salary + new_bonus,
-                        "Salary Effective Tax Rate": default_tax_rate * 100,  # Convert back to percentage
-                        "Total Compensation Effective Tax Rate": default_tax_rate * 100,
-                        "After Tax Salary": (1 - default_tax_rate) * new_salary,
-                        "After Tax Bonus": (1 - default_tax_rate) * new_bonus,
-                        "After Tax Total Compensation": (1 - default_tax_rate) * (new_salary + new_bonus),
-                        # "Notes": new_notes  # Include notes field
-                    }
-                ]
-            )
-
-            existing_income_data = pd.concat(
-                [
-                    existing_income_data,
-                    new_income_data
-                ]
-            )
-
-            existing_income_data.to_csv(file_path)
-
+            store.add(new_job_title, new_salary, new_bonus, default_tax_rate)
             st.rerun()
 
 
-    def save_data(data):
-        data.to_csv(file_path, index=False)
-
-
     @st.dialog(title="Edit Income Source")
     def edit_income_source():
         if income_data.empty:
             st.warning("No income sources available.")
             return
 
-        selected_job = st.selectbox("Select an income source to edit:", income_data["Job Title"].unique())
+        selected_id = st.selectbox("Select an income source to edit:", income_ids, format_func=job_title)
 
-        if selected_job:
-            row_data = income_data[income_data["Job Title"] == selected_job].iloc[0]
+        if selected_id is not None:
+            row_data = store.get(selected_id)
 
             # Editable Fields
             edit_job_title = st.text_input("Job Title", value=row_data["Job Title"])
             edit_salary = st.number_input("Salary", min_value=0, step=1_000, value=int(row_data["Salary"]))
             edit_bonus = st.number_input("Bonus", min_value=0, step=1_000, value=int(row_data["Bonus"]))
             edit_tax_rate = st.number_input("Tax Rate (%)",
-                                            value=float(row_data["Salary Effective Tax Rate"])) / 100
+                                            value=float(row_data["Salary Effective Tax Rate"]) * 100) / 100
             edit_notes = st.text_area("Notes")
 
             update_delete_cols = st.columns(2)
 
             with update_delete_cols[0]:
                 if st.button("💾 Save Changes"):
-                    # Update DataFrame
-                    income_data.loc[income_data["Job Title"] == selected_job, ["Job Title", "Salary", "Bonus",
-                                                                               "Total Compensation",
-                                                                               "Salary Effective Tax Rate",
-                                                                               "Total Compensation Effective Tax Rate",
-                                                                               "After Tax Salary",
-                                                                               "After Tax Bonus",
-                                                                               "After Tax Total Compensation"]] = [
-                        edit_job_title, edit_salary, edit_bonus,
-                        edit_salary + edit_bonus,
-                        edit_tax_rate * 100, edit_tax_rate * 100,
-                        (1 - edit_tax_rate) * edit_salary,
-                        (1 - edit_tax_rate) * edit_bonus,
-                        (1 - edit_tax_rate) * (edit_salary + edit_bonus)
-                    ]
-                    save_data(income_data)
+                    store.update(selected_id, edit_job_title, edit_salary, edit_bonus, edit_tax_rate)
                     st.success("Income source updated successfully!")
                     st.session_state.dialog_open = False  # Close dialog
                     st.rerun()
 
             with update_delete_cols[1]:
                 if st.button("🗑️ Delete Income Source"):
-                    # Remove the selected row
-                    income_data.drop(income_data[income_data["Job Title"] == selected_job].index, inplace=True)
-                    save_data(income_data)
+                    store.delete(selected_id)
                     st.success("Income source deleted successfully!")
                     st.session_state.dialog_open = False  # Close dialog
                     st.rerun()
 
-    st.link_button(
-        label='Paycheck Calculator',
-        url='https://smartasset.com/taxes/paycheck-calculator',
-        type='primary',
-        use_container_width=True
-    )
-
     st.title('Tax Rates')
 
     cols = st.columns(2)
@@ -180,11 +226,12 @@ with rhs_col:
         cols = st.columns([4, 1])  # Adjust column width: 4x for selectbox, 1x for button
 
         with cols[0]:  # Selectbox column
-            default_value = st.session_state.income_values.get(f"income_{income_id}", job_titles[0])
+            default_value = st.session_state.income_values.get(f"income_{income_id}", default_id)
             selected_value = st.selectbox(
                 label=f"Income {income_id}",
-                options=job_titles,
-                index=job_titles.index(default_value) if default_value in job_titles else 0,
+                options=income_ids,
+                index=income_ids.index(default_value) if default_value in income_ids else 0,
+                format_func=job_title,
                 key=f"income_{income_id}"
             )
             st.session_state.income_values[f"income_{income_id}"] = selected_value  # Store selection persistently
@@ -205,9 +252,10 @@ with rhs_col:
         st.button("🔄 Reset", on_click=reset_income_sources, use_container_width=True)
         st.button("✏️ Edit", on_click=edit_income_source, use_container_width=True)
 
-with lhs_col:
-    incomes = list(st.session_state.income_values.values())
-    incomes_df = income_data[income_data['Job Title'].isin(incomes)]
+with lhs_col, perf.span('render:income'):
+    # Selected IDs that still exist, each once, in selection order
+    incomes = [i for i in dict.fromkeys(st.session_state.income_values.values()) if i in income_metrics.index]
+    incomes_df = income_metrics.loc[incomes]
 
     with st.expander(label="📊 **Total Income**", expanded=True):
         st.title('Total Income')
@@ -245,8 +293,8 @@ with lhs_col:
         })
 
         # Create category labels for Salary and Bonus
-        salary_categories = [f"Salary: {income}" for income in incomes]
-        bonus_categories = [f"Bonus: {income}" for income in incomes]
+        salary_categories = [f"Salary: {income}" for income in incomes_df["Job Title"]]
+        bonus_categories = [f"Bonus: {income}" for income in incomes_df["Job Title"]]
 
         # Combine categories
         income_categories = salary_categories + bonus_categories
@@ -271,8 +319,8 @@ with lhs_col:
         })
 
         # Create category labels for After-Tax Salary and After-Tax Bonus
-        after_tax_salary_categories = [f"After Tax Salary: {income}" for income in incomes]
-        after_tax_bonus_categories = [f"After Tax Bonus: {income}" for income in incomes]
+        after_tax_salary_categories = [f"After Tax Salary: {income}" for income in incomes_df["Job Title"]]
+        after_tax_bonus_categories = [f"After Tax Bonus: {income}" for income in incomes_df["Job Title"]]
 
         # Combine categories
         after_tax_income_categories = after_tax_salary_categories + after_tax_bonus_categories
@@ -295,57 +343,31 @@ with lhs_col:
         col1, col2 = st.columns(2)
 
         with col1:
-            custom_colors = {
-                "After Tax Salary": "#1f77b4",  # Blue
-                "After Tax Bonus": "#aec7e8",  # Orange
-                "Salary Tax": "#d62728",  # Green
-                "Bonus Tax": "#ff9896",  # Red
-            }
-
-            fig3 = px.pie(pie_data_after_tax, names="Category", values="Amount", title="Compensation Breakdown",
-                          color="Category",  # Match color mapping
-                          color_discrete_map=custom_colors)
-            fig3.update_layout(height=400, width=400, legend=dict(
-                orientation="h",  # Horizontal legend
-                yanchor="top",  # Align from the top
-                y=-0.3,  # Adjust this value downward if overlapping occurs (e.g., -0.4)
-                xanchor="center",
-                x=0.5
-            ),
-                               margin=dict(t=50, b=100))
+            fig3 = figures.cached_figure('income.pie', pie_data_after_tax, make_pie,
+                                         title="Compensation Breakdown", color_map=CUSTOM_COLORS,
+                                         depends_on=("income.csv",))
             st.plotly_chart(fig3, use_container_width=True)
 
         with col2:
-            fig4 = px.pie(pie_data_after_tax_breakdown, names="Category", values="Amount",
-                          title="After-Tax Compensation Breakdown")
-            fig4.update_layout(height=400, width=400, legend=dict(
-                orientation="h",  # Horizontal legend
-                yanchor="top",  # Align from the top
-                y=-0.3,  # Adjust this value downward if overlapping occurs (e.g., -0.4)
-                xanchor="center",
-                x=0.5
-            ),
-                               margin=dict(t=50, b=100))
+            fig4 = figures.cached_figure('income.pie', pie_data_after_tax_breakdown, make_pie,
+                                         title="After-Tax Compensation Breakdown",
+                                         depends_on=("income.csv",))
             st.plotly_chart(fig4, use_container_width=True)
 
-    for income in incomes:
-        with st.expander(label=f'💸 **{income}**', expanded=True):
-            st.title(income)
-
-            income_df = income_data[income_data['Job Title'] == income]
-
-            # Calculate metrics
-            salary = income_df['Salary'].item()
-            bonus = income_df['Bonus'].item()
-            total_compensation = income_df['Total Compensation'].item()
-            after_tax_salary = income_df['After Tax Salary'].item()
-            after_tax_bonus = income_df['After Tax Bonus'].item()
-            after_tax_total_compensation = income_df['After Tax Total Compensation'].item()
-
-            # Calculate taxes
-            salary_tax = salary - after_tax_salary
-            bonus_tax = bonus - after_tax_bonus
-            total_comp_tax = total_compensation - after_tax_total_compensation
+    for income_id, income in incomes_df.iterrows():
+        with st.expander(label=f'💸 **{income["Job Title"]}**', expanded=True):
+            st.title(income["Job Title"])
+
+            # Metrics and taxes come precomputed for every source
+            salary = income['Salary']
+            bonus = income['Bonus']
+            total_compensation = income['Total Compensation']
+            after_tax_salary = income['After Tax Salary']
+            after_tax_bonus = income['After Tax Bonus']
+            after_tax_total_compensation = income['After Tax Total Compensation']
+            salary_tax = income['Salary Tax']
+            bonus_tax = income['Bonus Tax']
+            total_comp_tax = income['Total Compensation Tax']
 
             # Display metrics with deltas for tax impact
             cols = st.columns(3)
@@ -365,27 +387,143 @@ with lhs_col:
 
             # Visualization - Pie Chart for Income Breakdown
 
-            custom_colors = {
-                "After Tax Salary": "#1f77b4",  # Blue
-                "After Tax Bonus": "#aec7e8",  # Orange
-                "Salary Tax": "#d62728",  # Green
-                "Bonus Tax": "#ff9896",  # Red
-            }
-
             pie_data_after_tax = pd.DataFrame({
                 "Category": ["After Tax Salary", "After Tax Bonus", 'Salary Tax', 'Bonus Tax'],
                 "Amount": [after_tax_salary, after_tax_bonus, salary_tax, bonus_tax]
             })
 
-            fig2 = px.pie(pie_data_after_tax, names="Category", values="Amount",
-                          title="Compensation Breakdown", color="Category",  # Match color mapping
-                          color_discrete_map=custom_colors)
-            fig2.update_layout(height=400, width=400, legend=dict(
-                orientation="h",  # Horizontal legend
-                yanchor="top",  # Align from the top
-                y=-0.3,  # Adjust this value downward if overlapping occurs (e.g., -0.4)
-                xanchor="center",
-                x=0.5
-            ),
-                               margin=dict(t=50, b=100))
+            fig2 = figures.cached_figure('income.pie', pie_data_after_tax, make_pie,
+                                         title="Compensation Breakdown", color_map=CUSTOM_COLORS,
+                                         depends_on=("income.csv",))
             st.plotly_chart(fig2, use_container_width=True)
+
+    with st.expander(label="🗓️ **Paycheck Schedule**", expanded=False):
+        st.title('Paycheck Schedule')
+
+        cols = st.columns(3)
+        with cols[0]:
+            pay_frequency = st.selectbox("Pay Frequency", list(paycheck.PAY_FREQUENCIES), index=1,
+                                         key="paycheck_frequency")
+        with cols[1]:
+            pretax_rate = st.number_input("Pre-Tax Deductions (%)", min_value=0.0, max_value=100.0, value=0.0,
+                                          step=1.0, key="paycheck_pretax") / 100
+        with cols[2]:
+            pay_year = int(st.number_input("Year", value=datetime.date.today().year, step=1, key="paycheck_year"))
+
+        if not incomes:
+            st.info("Select an income source to see its paychecks.")
+        else:
+            sources = income_data[income_data["ID"].isin(incomes)]
+            expenses = TableStore("data/budget_data.csv", schemas.BUDGET).load()
+            subscriptions = TableStore("data/subscriptions.csv", schemas.SUBSCRIPTIONS).load()
+
+            # Stored tables carry version tokens, so the key costs nothing to build
+            version = (
+                lazy_tabs.frame_version(sources),
+                lazy_tabs.frame_version(expenses),
+                lazy_tabs.frame_version(subscriptions),
+                pay_frequency,
+                pretax_rate,
+                pay_year,
+            )
+            try:
+                with perf.span('paycheck:compute'):
+                    schedule, coverage, bills = lazy_tabs.cached(
+                        "income.paychecks",
+                        version,
+                        lambda: paycheck_plan(sources, expenses, subscriptions, pay_frequency, pretax_rate, pay_year),
+                    )
+            except ValueError as err:
+                st.error(str(err))
+                st.stop()
+
+            short = coverage["Left Over"] < 0
+            cols = st.columns(3)
+            with cols[0]:
+                st.metric(label="Paydays", value=f"{len(coverage)}")
+            with cols[1]:
+                st.metric(label="Average Net per Payday", value=f"${coverage['Net'].mean():,.0f}")
+            with cols[2]:
+                st.metric(label="Short Paydays", value=f"{short.sum()}",
+                          delta=f"-${-coverage.loc[short, 'Left Over'].sum():,.0f}" if short.any() else None)
+
+            st.plotly_chart(
+                figures.cached_figure("income.paychecks", coverage, make_coverage_bar, depends_on=PAYCHECK_FILES),
+                use_container_width=True,
+            )
+
+            money = st.column_config.NumberColumn(format="$%.2f")
+            due = st.column_config.DateColumn(format="YYYY-MM-DD")
+            payday = st.selectbox("Payday", coverage["Pay Date"], format_func=lambda d: f"{d:%b %d, %Y}",
+                                  key="paycheck_payday")
+            st.dataframe(
+                schedule[schedule["Pay Date"] == payday].drop(columns="Pay Date"),
+                hide_index=True,
+                use_container_width=True,
+                column_config={c: money for c in ["Gross", "Pre-Tax Deductions", "Taxable", "Withholding", "Net"]},
+            )
+            st.caption("Bills this paycheck covers")
+            st.dataframe(
+                bills.loc[bills["Pay Date"] == payday, paycheck.BILL_COLUMNS],
+                hide_index=True,
+                use_container_width=True,
+                column_config={"Amount": money, "Due Date": due},
+            )
+            st.caption("Salary is split evenly over the year's paydays and withheld at each source's effective "
+                       "tax rate after pre-tax deductions; each bill is paid from the last paycheck before it "
+                       "is due.")
+
+    with st.expander(label="🧮 **What-If Grid**", expanded=False):
+        st.title('What-If Grid')
+
+        grid_axes = whatif_axes(total_salary, total_bonus)
+        expense = annual_expense()
+
+        # The grid keeps its intermediate arrays, so a rerun only recomputes
+        # the stages whose axes (or the expense total) changed
+        grid = st.session_state.setdefault("whatif_grid", WhatIfGrid())
+        with perf.span('whatif:compute'):
+            after_tax = grid.after_tax(*grid_axes.values())
+            values = grid.surplus(*grid_axes.values(), expense or 0.0)
+
+        cols = st.columns(3)
+        with cols[0]:
+            x_axis = st.selectbox("X Axis", AXES, index=0, key="whatif_x")
+        with cols[1]:
+            y_axis = st.selectbox("Y Axis", [a for a in AXES if a != x_axis], index=2, key="whatif_y")
+        with cols[2]:
+            measure = st.radio("Show", ["Annual Surplus", "After-Tax Income"], key="whatif_measure",
+                               disabled=expense is None)
+        if expense is None:
+            measure = "After-Tax Income"
+            st.caption("No budget saved yet; showing after-tax income only.")
+
+        # Hold every other axis at one value, starting from the current selection
+        current = {"Salary": total_salary, "Bonus": total_bonus, "Raise": 0.0, "Tax Rate": total_comp_tax_rate}
+        fixed = {}
+        fixed_axes = [a for a in AXES if a not in (x_axis, y_axis)]
+        for col, axis in zip(st.columns(len(fixed_axes)), fixed_axes):
+            axis_values = grid_axes[axis]
+            with col:
+                fixed[axis] = st.select_slider(
+                    axis,
+                    options=list(range(len(axis_values))),
+                    value=int(np.abs(axis_values - current[axis]).argmin()),
+                    format_func=lambda i, v=axis_values, f=AXIS_FORMATS[axis]: f.format(v[i]),
+                    key=f"whatif_{axis}",
+                )
+
+        z = grid_slice(values if measure == "Annual Surplus" else after_tax, x_axis, y_axis, fixed)
+        heatmap_df = pd.DataFrame(
+            z,
+            index=pd.Index([AXIS_FORMATS[y_axis].format(v) for v in grid_axes[y_axis]], name=y_axis),
+            columns=pd.Index([AXIS_FORMATS[x_axis].format(v) for v in grid_axes[x_axis]], name=x_axis),
+        )
+        fig = figures.cached_figure('income.whatif', heatmap_df, make_heatmap, measure=measure,
+                                    depends_on=tuple(summaries.DATASETS))
+        st.plotly_chart(fig, use_container_width=True)
+
+        caption = f"{values.size:,} scenarios; tax is one effective rate on total compensation."
+        if expense is not None:
+            caption += f" Annual expenses: ${expense:,.0f}."
+        st.caption(caption)
@@ -1,15 +1,17 @@
 import streamlit as st
-import pandas as pd
 import os
 from pathlib import Path
 from app import pages
+from app import perf
+from backend import schemas
 
 st.title(pages.planned_purchases.title)
 
 file_path = Path(os.getcwd()) / "data" / "planned_purchases.csv"
 
-# Read the CSV file
-planned_purchases_data = pd.read_csv(file_path)
+# Read and normalize the CSV file
+with perf.span('load'):
+    planned_purchases_data = schemas.read_table(file_path, schemas.PLANNED_PURCHASES)
 
 tabs = st.tabs(['Summary', 'Statistics', 'Planned Purchases', 'Settings'])
 
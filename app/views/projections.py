@@ -1,4 +1,154 @@
+import numpy as np
+import pandas as pd
 import streamlit as st
+
+from app import figures
 from app import pages
+from app import perf
+from backend import summaries
+from backend.projection import ACCOUNT_TYPES, Account, allocate_surplus, project
+
+st.title(pages.projections_page.title)
+
+# Return assumptions evaluated together; the sliders only pick among them.
+RETURNS = np.round(np.arange(0, 0.12001, 0.0025), 4)
+
+ACCOUNT_COLUMNS = ['Name', 'Type', 'Balance', 'Contribution', 'Contribution Growth (%)',
+                   'Employer Match (%)', 'Match Cap (% of Salary)']
+
+with perf.span('load'):
+    totals = summaries.budget_summary('data')
+    salary = totals.income.salary_pre_tax
+    tax_rate = totals.income.total_taxes / totals.income.total_comp_pre_tax if totals.income.total_comp_pre_tax else 0.0
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+def default_accounts() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            ['Work 401(k)', '401(k)', 0.0, round(0.06 * salary, -2), 3.0, 50.0, 6.0],
+            ['Roth IRA', 'Roth IRA', 0.0, ACCOUNT_TYPES['Roth IRA'].annual_limit, 0.0, 0.0, 0.0],
+            ['Emergency Fund', 'Cash', 0.0, 0.0, 0.0, 0.0, 0.0],
+        ],
+        columns=ACCOUNT_COLUMNS,
+    )
+
+
+def to_accounts(df: pd.DataFrame) -> tuple:
+    rows = df.dropna(subset=['Name', 'Type']).fillna(0)
+    return tuple(
+        Account(
+            name=row['Name'],
+            kind=row['Type'],
+            balance=float(row['Balance']),
+            contribution=float(row['Contribution']),
+            contribution_growth=float(row['Contribution Growth (%)']) / 100,
+            match_rate=float(row['Employer Match (%)']) / 100,
+            match_cap=float(row['Match Cap (% of Salary)']) / 100,
+        )
+        for _, row in rows.iterrows()
+    )
+
+
+def make_area(df: pd.DataFrame):
+    import plotly.express as px
+
+    fig = px.area(df, x='Year', y='Balance', color='Account')
+    fig.update_layout(height=450, margin=dict(t=30, b=30), yaxis_tickprefix='$', legend_title_text='')
+    return fig
+
+
+def make_fan(df: pd.DataFrame):
+    import plotly.express as px
+
+    fig = px.line(df, x='Year', y='Net Worth', color='Scenario',
+                  color_discrete_sequence=['#d62728', '#1f77b4', '#2ca02c'])
+    fig.update_layout(height=450, margin=dict(t=30, b=30), yaxis_tickprefix='$', legend_title_text='')
+    return fig
+
+
+# ── Assumptions ──────────────────────────────────────────────────────────────
+cols = st.columns(3)
+with cols[0]:
+    horizon = st.slider('Years', min_value=5, max_value=50, value=30, key='proj_years')
+    expected = st.select_slider('Expected Return', options=RETURNS.tolist(), value=0.07,
+                                format_func=lambda r: f'{r:.2%}', key='proj_return')
+with cols[1]:
+    spread = st.select_slider('Return Range (±)', options=[0.0, 0.005, 0.01, 0.015, 0.02, 0.03, 0.04], value=0.02,
+                              format_func=lambda r: f'{r:.1%}', key='proj_spread')
+    salary_growth = st.number_input('Salary Growth (%)', min_value=0.0, max_value=20.0, value=3.0, step=0.5,
+                                    key='proj_salary_growth') / 100
+with cols[2]:
+    inflation = st.number_input('Inflation (%)', min_value=0.0, max_value=15.0, value=2.5, step=0.25,
+                                key='proj_inflation') / 100
+    real = st.toggle("In Today's Dollars", value=True, key='proj_real')
+    invest_surplus = st.toggle('Invest Remaining Surplus', value=True, key='proj_invest_surplus',
+                               help='Put the part of the annual budget surplus the accounts do not use '
+                                    'into a taxable brokerage account.')
+
+st.subheader('Accounts')
+if 'proj_accounts' not in st.session_state:
+    st.session_state.proj_accounts = default_accounts()
+edited = st.data_editor(
+    st.session_state.proj_accounts,
+    num_rows='dynamic',
+    hide_index=True,
+    use_container_width=True,
+    key='proj_accounts_editor',
+    column_config={
+        'Type': st.column_config.SelectboxColumn(options=list(ACCOUNT_TYPES), required=True),
+        'Balance': st.column_config.NumberColumn(format='$%.0f', min_value=0.0),
+        'Contribution': st.column_config.NumberColumn('Yearly Contribution', format='$%.0f', min_value=0.0),
+    },
+)
+st.caption(f'Annual budget surplus: ${totals.annual_surplus:,.0f}. Yearly limits apply to 401(k), Roth IRA '
+           f'and HSA contributions; cash earns {ACCOUNT_TYPES["Cash"].fixed_return:.0%}.')
+
+# ── Projection ───────────────────────────────────────────────────────────────
+accounts = to_accounts(edited)
+if invest_surplus:
+    accounts = allocate_surplus(accounts, totals.annual_surplus, tax_rate)
+
+if not accounts:
+    st.info('Add an account to project its growth.')
+    st.stop()
+
+with perf.span('project'):
+    projection = project(accounts, RETURNS, horizon, salary=salary, salary_growth=salary_growth,
+                         inflation=inflation if real else 0.0)
+
+net_worth = projection.net_worth()
+low, mid, high = (int(np.abs(RETURNS - r).argmin()) for r in (expected - spread, expected, expected + spread))
+
+cols = st.columns(3)
+with cols[0]:
+    st.metric(label=f'Net Worth in {horizon} Years', value=f'${net_worth[mid, -1]:,.0f}')
+    st.caption(f'${net_worth[low, -1]:,.0f} – ${net_worth[high, -1]:,.0f} at '
+               f'{RETURNS[low]:.1%} – {RETURNS[high]:.1%} returns')
+with cols[1]:
+    st.metric(label='Your Contributions', value=f'${projection.contributions.sum():,.0f}')
+with cols[2]:
+    st.metric(label='Employer Match', value=f'${projection.match.sum():,.0f}')
+
+st.subheader('Net Worth')
+fan = pd.DataFrame({
+    'Year': np.tile(projection.years, 3),
+    'Scenario': np.repeat([f'{RETURNS[i]:.1%} return' for i in (low, mid, high)], len(projection.years)),
+    'Net Worth': net_worth[[low, mid, high]].ravel(),
+})
+st.plotly_chart(
+    figures.cached_figure('projections.fan', fan, make_fan, depends_on=tuple(summaries.DATASETS)),
+    use_container_width=True,
+)
+
+st.subheader(f'Accounts at {expected:.2%} Return')
+st.plotly_chart(
+    figures.cached_figure('projections.accounts', projection.frame(mid), make_area,
+                          depends_on=tuple(summaries.DATASETS)),
+    use_container_width=True,
+)
 
-st.title(pages.projections_page.title)
\ No newline at end of file
+caption = 'Contributions are made at each year end and grow with their own rate.'
+if real:
+    caption += f' Balances are deflated by {inflation:.2%} a year.'
+st.caption(caption)
@@ -1,4 +1,115 @@
 import streamlit as st
 from app import pages
+from app.views.budget import db
+from app.views.budget.config import PERIOD_MAP
+from backend import importer
+from backend.categorize import RuleSet, check_rules, rules_from_frame
+from backend.storage import TransactionStore
 
-st.title(pages.settings_page.title)
\ No newline at end of file
+st.title(pages.settings_page.title)
+
+_, _, expense_categories, _ = db.bootstrap_budget_data(
+    period_map=PERIOD_MAP,
+    filepath='data/budget_data.csv',
+)
+rule_set = RuleSet.load()
+store = TransactionStore()
+
+try:
+    check_rules(rule_set.rules)
+except ValueError as err:
+    st.error(f'{err}. Fix them below before importing or categorizing.')
+
+# --- Import ------------------------------------------------------------------
+
+st.subheader('Import Transactions')
+
+uploads = st.file_uploader(
+    label='Bank or card statements',
+    type=['csv', 'ofx', 'qfx'],
+    accept_multiple_files=True,
+)
+account = st.text_input(
+    'Account',
+    value='',
+    placeholder='Optional: overrides the account found in the export',
+)
+
+if uploads and st.button('📥 Import', use_container_width=True):
+    for upload in uploads:
+        try:
+            result = importer.import_statement(
+                upload,
+                store,
+                account=account.strip() or None,
+                rules=rule_set,
+            )
+        except ValueError as err:
+            st.error(f'{upload.name}: {err}')
+            continue
+        st.success(
+            f'{upload.name}: imported {result.rows_imported:,} of {result.rows_read:,} rows '
+            f'({result.duplicates:,} duplicates, {result.rejected:,} rejected)'
+        )
+
+# --- Categorization ----------------------------------------------------------
+
+st.subheader('Categorization Rules')
+st.caption('Rules are checked top to bottom; the first match wins. Amount bounds apply to the absolute amount.')
+
+edited_rules = st.data_editor(
+    rule_set.to_frame(),
+    num_rows='dynamic',
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        'Category': st.column_config.SelectboxColumn(options=expense_categories, required=True),
+        'Kind': st.column_config.SelectboxColumn(options=['substring', 'regex'], default='substring'),
+        'Min Amount': st.column_config.NumberColumn(format='$%.2f'),
+        'Max Amount': st.column_config.NumberColumn(format='$%.2f'),
+        'Source': st.column_config.TextColumn(disabled=True, default='user'),
+    },
+    key='category_rules_editor',
+)
+
+if st.button('💾 Save Rules and Categorize', use_container_width=True):
+    rule_set.rules = rules_from_frame(edited_rules)
+    try:
+        rule_set.save()
+    except ValueError as err:
+        st.error(str(err))
+        st.stop()
+    # Imports clear categories before applying rules and manual choices are saved as override
+    # rules, so every stored category is rule-assigned: re-run the rules over all of them so
+    # edited or removed rules take effect.
+    saved = RuleSet.load()
+    store.rewrite(lambda part: saved.categorize(part, overwrite=True))
+    st.rerun()
+
+# Scan in blocks: only the count and the rows shown are kept in memory.
+uncategorized_count, uncategorized = store.uncategorized(['ID', 'Date', 'Description', 'Amount', 'Category'], 200)
+
+st.subheader(f'Uncategorized Transactions ({uncategorized_count:,})')
+
+if not uncategorized.empty:
+    corrected = st.data_editor(
+        uncategorized,
+        use_container_width=True,
+        hide_index=True,
+        disabled=['ID', 'Date', 'Description', 'Amount'],
+        column_config={
+            'Category': st.column_config.SelectboxColumn(options=expense_categories),
+        },
+        key='uncategorized_editor',
+    )
+
+    if st.button('🧠 Learn Categories', use_container_width=True):
+        # Manual choices become override rules, then re-run the rules over every transaction.
+        rule_set.learn_many(corrected[corrected['Category'].fillna('').ne('')])
+        try:
+            rule_set.save()
+        except ValueError as err:
+            st.error(str(err))
+            st.stop()
+        store.rewrite(lambda part: rule_set.categorize(part, overwrite=True))
+        st.rerun()
@@ -1,8 +1,11 @@
 import streamlit as st
-import pandas as pd
 import os
 from pathlib import Path
 from app import pages
+from app import perf
+from backend import schemas
+from backend.storage import TableStore
+from app.views.subscriptions.tabs import statistics
 from app.views.subscriptions.tabs import subscriptions
 
 st.title(pages.subscriptions_page.title)
@@ -10,8 +13,9 @@ st.title(pages.subscriptions_page.title)
 # Construct the correct file path
 file_path = Path(os.getcwd()) / "data" / "subscriptions.csv"
 
-# Read the CSV file
-subscription_data = pd.read_csv(file_path)
+# Read and normalize the CSV file; cached per file version
+with perf.span('load'):
+    subscription_data = TableStore(file_path, schemas.SUBSCRIPTIONS).load()
 
 tabs = st.tabs(
     [
@@ -34,6 +38,10 @@ with tabs[0]:
         hide_index=True
     )
 
+with tabs[1], perf.span('render:statistics'):
+    statistics.render_statistics_tab(
+        subscription_data=subscription_data,
+    )
 
 with tabs[2]:
     subscriptions.render_subscriptions_tab(
@@ -0,0 +1,57 @@
+import pandas as pd
+import streamlit as st
+
+from app.views.subscriptions.db import add_detected_subscriptions
+from backend.recurring import RecurringDetector
+from backend.storage import TransactionStore
+
+
+@st.cache_resource
+def _detector() -> RecurringDetector:
+    return RecurringDetector()
+
+
+def render_statistics_tab(
+        subscription_data: pd.DataFrame,
+) -> None:
+    """
+    Render recurring charges detected in imported transactions that are not yet
+    tracked as subscriptions, with the option to add them.
+
+    Args:
+        subscription_data (pd.DataFrame): Current subscriptions.
+
+    Returns:
+        None
+    """
+    st.subheader('Detected Recurring Charges')
+
+    detector = _detector()
+    # Only month partitions written since the last rerun are read.
+    detector.sync(TransactionStore())
+
+    proposals = detector.propose(subscription_data['Subscription/ Recurring Expense'].dropna())
+
+    if proposals.empty:
+        st.info('No untracked recurring charges found in imported transactions.')
+        return
+
+    selection = st.data_editor(
+        proposals.assign(Add=False),
+        use_container_width=True,
+        hide_index=True,
+        disabled=[col for col in proposals.columns if col not in ('Subscription/ Recurring Expense', 'Amount')],
+        column_config={
+            'Amount': st.column_config.NumberColumn(format='$%.2f'),
+            'Confidence': st.column_config.ProgressColumn(min_value=0, max_value=1),
+        },
+        key='detected_subscriptions_editor',
+    )
+
+    chosen = selection[selection['Add']]
+    if st.button(
+            f'➕ Add {len(chosen)} Subscription(s)',
+            disabled=chosen.empty,
+            use_container_width=True,
+    ):
+        add_detected_subscriptions(chosen)
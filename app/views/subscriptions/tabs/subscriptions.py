@@ -5,12 +5,13 @@ import pandas as pd
 import streamlit as st
 from app.config import FREQUENCIES
 
-from app.views.budget.db import (
-    save_expense,
-    delete_expense,
-    add_expense,
+from app.views.subscriptions.db import (
+    save_subscription,
+    delete_subscription,
+    add_subscription,
 )
 from app.views.budget.utils import compute_step
+from backend import search
 
 
 def render_subscriptions_tab(
@@ -30,6 +31,20 @@ def render_subscriptions_tab(
 
     st.subheader('Subscriptions')
 
+    query = st.text_input(
+        '🔍 Search subscriptions',
+        placeholder='Name or notes',
+        key='subscription_search',
+    ).strip()
+    if query:
+        # Best matches first
+        hits = search.index_for('data').search(query, datasets=['subscriptions.csv'], limit=None)
+        rank = {hit.row_id: i for i, hit in enumerate(hits)}
+        subscription_data = subscription_data[subscription_data['ID'].isin(rank)].sort_values(
+            'ID', key=lambda ids: ids.map(rank),
+        )
+        st.caption(f'{len(hits)} matching subscription{"" if len(hits) == 1 else "s"}')
+
     cols_layout = [1, 1, 1, 1, 2]
 
     for _, row in subscription_data.iterrows():
@@ -91,8 +106,8 @@ def render_subscriptions_tab(
             delete_btn = delete_col.form_submit_button('❌ Delete', use_container_width=True)
 
             if save_btn:
-                save_expense(
-                    expense_id=int(row.ID),
+                save_subscription(
+                    subscription_id=int(row.ID),
                     name=name_input,
                     amount=amount_input,
                     frequency=freq_input,
@@ -100,7 +115,7 @@ def render_subscriptions_tab(
                     notes=notes_input,
                 )
             if delete_btn:
-                delete_expense(int(row.ID))
+                delete_subscription(int(row.ID))
 
-    if st.button('➕ Add Expense', key=f'add-{'test'}', use_container_width=True):
-        add_expense('test')
+    if st.button('➕ Add Subscription', key='add-subscription', use_container_width=True):
+        add_subscription()
@@ -4,7 +4,7 @@ import pandas as pd
 import pandas as pd
 import streamlit as st
 from typing import Dict
-from app.views.budget.utils import style_budget_plan_df
+from app.views.budget.utils import budget_plan_table
 
 
 def display_budget_summary_metrics(
@@ -73,14 +73,15 @@ def display_budget_dataframe(
     display_df = budget_plan.loc[:, display_cols]
 
     # ─── Apply styling and render in Streamlit ──────────────────────────────────
-    styled = style_budget_plan_df(
+    data, column_config = budget_plan_table(
         df=display_df,
         float_cols=list(period_map.keys()),
         percentage_cols=pct_cols
     )
 
     st.dataframe(
-        styled,
+        data,
         use_container_width=True,
         hide_index=True,
+        column_config=column_config,
     )
@@ -0,0 +1,74 @@
+import importlib
+import logging
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+logger = logging.getLogger('budgeting_app.warmup')
+
+# Heavy modules the pages import, roughly in the order users reach them.
+MODULES = (
+    'numpy',
+    'pandas',
+    'plotly.express',
+    'plotly.graph_objects',
+    'matplotlib',
+    'backend.schemas',
+    'backend.search',
+    'backend.storage',
+    'backend.paycheck',
+    'backend.projection',
+    'backend.summaries',
+    'backend.variance',
+)
+
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+# Module -> seconds its import took on the warm-up thread.
+_timings: Dict[str, float] = {}
+
+
+def _preload(modules: Sequence[str]) -> None:
+    for name in modules:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as exc:
+            logger.info('warm-up skipped %s: %s', name, exc)
+            continue
+        _timings[name] = time.perf_counter() - start
+
+
+def start(modules: Sequence[str] = MODULES) -> bool:
+    """
+    Import ``modules`` on a background thread, once per process.
+
+    Call after the first page has been drawn: pages that need a module still
+    import it themselves, but usually find it already loaded.
+
+    Returns:
+        True if this call started the warm-up.
+    """
+    global _thread
+
+    with _lock:
+        if _thread is not None:
+            return False
+        _thread = threading.Thread(target=_preload, args=(tuple(modules),), name='module-warmup', daemon=True)
+        _thread.start()
+    return True
+
+
+def wait(timeout: Optional[float] = None) -> bool:
+    """Block until the warm-up finishes; True if it has (or never started)."""
+    thread = _thread
+    if thread is None:
+        return True
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def timings() -> Dict[str, float]:
+    """Seconds each module took to import on the warm-up thread (0 if already loaded)."""
+    return dict(_timings)
@@ -0,0 +1,274 @@
+"""
+Headless budget report over many data folders.
+
+Every folder is loaded the way the dashboard loads ``data/``
+(``Budget.from_csv_folder``) on a process pool, and one summary row per folder
+is streamed to a CSV or Parquet file as soon as it is ready.
+
+Finished folders are recorded in ``<output>.checkpoint.jsonl``. Rerunning the
+same command after an interruption rewrites those rows and processes only the
+remaining folders. The checkpoint is removed once every folder succeeded.
+
+Usage:
+    python -m backend.batch clients/*/data --output report.csv
+    python -m backend.batch clients/*/data --output report.parquet --workers 8 --years 1 5 10 --return-rate 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+from backend import calculations
+from backend.budget import Budget
+
+DEFAULT_YEARS = (1, 5, 10)
+
+# Parquet rows buffered per row group.
+PARQUET_BATCH_ROWS = 256
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Per-folder summary
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def result_columns(years: Sequence[int]) -> List[str]:
+    """Output columns, in order, for the given projection horizons."""
+    return [
+        'Folder',
+        'Income After Tax',
+        'Expenses',
+        'Subscriptions',
+        'Planned Purchases',
+        'Total Expense',
+        'Annual Surplus',
+        'Savings Rate',
+        *(f'Projected Savings {n}y' for n in years),
+        'Category Totals',
+        'Error',
+    ]
+
+
+def summarize(folder: str, years: Sequence[int] = DEFAULT_YEARS, return_rate: float = 0.0) -> Dict[str, Any]:
+    """
+    Surplus, category rollup and savings projections for one data folder.
+
+    Never raises: a folder that cannot be loaded gets a row with only
+    ``'Folder'`` and ``'Error'`` set.
+    """
+    row: Dict[str, Any] = dict.fromkeys(result_columns(years))
+    row['Folder'] = folder
+    try:
+        budget = Budget.from_csv_folder(folder)
+    except Exception as exc:  # one bad folder must not stop the batch
+        row['Error'] = f'{type(exc).__name__}: {exc}'
+        return row
+
+    income = float(budget.income.total_comp_post_tax)
+    surplus = float(budget.annual_surplus)
+    row.update({
+        'Income After Tax': income,
+        'Expenses': float(budget.expenses.annual_total),
+        'Subscriptions': float(budget.subscriptions.annual_total),
+        'Planned Purchases': float(budget.planned_purchases.annual_total),
+        'Total Expense': float(budget.total_expense),
+        'Annual Surplus': surplus,
+        'Savings Rate': surplus / income if income else None,
+        'Category Totals': json.dumps(calculations.category_totals(budget.expenses.table)),
+    })
+    for n in years:
+        row[f'Projected Savings {n}y'] = calculations.project_savings(surplus, n, return_rate)
+    return row
+
+
+def run(
+        folders: Sequence[str],
+        *,
+        years: Sequence[int] = DEFAULT_YEARS,
+        return_rate: float = 0.0,
+        workers: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Summarize ``folders``, yielding rows in completion order.
+
+    Args:
+        folders: Data folders, each laid out like ``data/``.
+        years: Projection horizons in years.
+        return_rate: Annual return on saved surplus for the projections.
+        workers: Worker processes; ``1`` runs in this process. Defaults to the CPU count.
+    """
+    task = partial(summarize, years=tuple(years), return_rate=return_rate)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(folders) <= 1:
+        yield from map(task, folders)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(folders))) as pool:
+        futures = [pool.submit(task, folder) for folder in folders]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Output
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, columns: List[str]) -> None:
+        import csv
+
+        self._file = open(path, 'w', newline='', encoding='utf-8-sig')
+        self._writer = csv.DictWriter(self._file, fieldnames=columns)
+        self._writer.writeheader()
+
+    def write(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, columns: List[str]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        fields = [pa.field(col, pa.string() if col in ('Folder', 'Category Totals', 'Error') else pa.float64())
+                  for col in columns]
+        self._schema = pa.schema(fields)
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._pending: List[Dict[str, Any]] = []
+
+    def write(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self._pending.extend(rows)
+        if len(self._pending) >= PARQUET_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        import pyarrow as pa
+
+        if self._pending:
+            self._writer.write_table(pa.Table.from_pylist(self._pending, schema=self._schema))
+            self._pending = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+def open_writer(path: Path, columns: List[str], fmt: Optional[str] = None):
+    """Streaming writer for ``path``; the format comes from ``fmt`` or the file suffix."""
+    fmt = fmt or path.suffix.lstrip('.').lower()
+    if fmt == 'csv':
+        return _CsvWriter(path, columns)
+    if fmt == 'parquet':
+        return _ParquetWriter(path, columns)
+    raise ValueError(f"Unsupported output format '{fmt}'; use csv or parquet")
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Checkpoints
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def checkpoint_path(output: Path) -> Path:
+    return output.with_name(output.name + '.checkpoint.jsonl')
+
+
+def read_checkpoint(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Folder -> result row for every folder completed by an earlier run."""
+    done: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return done
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:  # last line cut off by the interruption
+                continue
+            done[row['Folder']] = row
+    return done
+
+
+class _Progress:
+    def __init__(self, total: int, stream: TextIO = sys.stderr) -> None:
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self._stream = stream
+        self._start = time.perf_counter()
+
+    def update(self, row: Dict[str, Any]) -> None:
+        self.done += 1
+        self.failed += row['Error'] is not None
+        elapsed = time.perf_counter() - self._start
+        rate = self.done / elapsed if elapsed else 0.0
+        eta = (self.total - self.done) / rate if rate else 0.0
+        self._stream.write(
+            f'\r[{self.done:>{len(str(self.total))}}/{self.total}] {self.done / self.total:6.1%}'
+            f'  {rate:6.1f} folders/s  eta {eta:5.0f}s  failed {self.failed}'
+        )
+        self._stream.flush()
+
+    def close(self) -> None:
+        if self.total:
+            self._stream.write('\n')
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Budget summary for many data folders, one row per folder.')
+    parser.add_argument('folders', nargs='+', help='Data folders laid out like data/ (income.csv, budget_data.csv, ...).')
+    parser.add_argument('--output', type=Path, required=True, help='Result file, .csv or .parquet.')
+    parser.add_argument('--format', choices=('csv', 'parquet'), help='Output format (default: from the suffix).')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count; 1 runs inline).')
+    parser.add_argument('--years', type=int, nargs='+', default=list(DEFAULT_YEARS), help='Projection horizons.')
+    parser.add_argument('--return-rate', type=float, default=0.0, help='Annual return on saved surplus, e.g. 0.05.')
+    parser.add_argument('--fresh', action='store_true', help='Ignore an existing checkpoint and start over.')
+    args = parser.parse_args(argv)
+
+    folders = list(dict.fromkeys(str(Path(folder)) for folder in args.folders))
+    columns = result_columns(args.years)
+    checkpoint = checkpoint_path(args.output)
+    if args.fresh:
+        checkpoint.unlink(missing_ok=True)
+
+    done = {folder: row for folder, row in read_checkpoint(checkpoint).items() if folder in folders}
+    pending = [folder for folder in folders if folder not in done]
+    if done:
+        print(f'Resuming: {len(done)} folder(s) already done, {len(pending)} to go', file=sys.stderr)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    writer = open_writer(args.output, columns, args.format)
+    progress = _Progress(len(pending))
+    try:
+        # Rows from the checkpoint first, so the output never holds a row twice.
+        writer.write([{col: row.get(col) for col in columns} for row in done.values()])
+        with open(checkpoint, 'a', encoding='utf-8') as log:
+            for row in run(pending, years=args.years, return_rate=args.return_rate, workers=args.workers):
+                writer.write([row])
+                if row['Error'] is None:  # failed folders are retried on the next run
+                    log.write(json.dumps(row) + '\n')
+                    log.flush()
+                progress.update(row)
+    finally:
+        progress.close()
+        writer.close()
+
+    print(f'Saved {args.output} ({len(folders)} folders, {progress.failed} failed)', file=sys.stderr)
+    if progress.failed:
+        return 1
+    checkpoint.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
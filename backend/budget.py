@@ -2,70 +2,35 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
 
 import pandas as pd
 
+from backend import schemas
+from backend.calculations import add_frequency_cols
+
 # ────────────────────────────────────────────────────────────────────────────────
 # Shared helpers
 # ────────────────────────────────────────────────────────────────────────────────
 
-PERIOD_MAP: Dict[str, float] = {
-    'Weekly': 52,
-    'Semi-Monthly': 24,
-    'Monthly': 12,
-    'Quarterly': 4,
-    'Annual': 1,
-}
-
 
 def _read_csv(file_name: str, *, data_dir: str | Path = 'data') -> pd.DataFrame:
     """
-    Load a CSV file with UTF-8-SIG encoding (preserves emojis).
+    Load a CSV file with UTF-8-SIG encoding (preserves emojis) and normalize it
+    against its registered schema.
 
     Args:
         file_name: The CSV name, e.g. ``'income.csv'``.
         data_dir: Directory containing the file.
 
     Returns:
-        DataFrame with raw data.
+        DataFrame with validated, typed data.
     """
     path = Path(data_dir) / file_name
-    return pd.read_csv(path, encoding='utf-8-sig')
-
-
-def _add_frequency_cols(
-        df: pd.DataFrame,
-        *,
-        amount_col: str,
-        frequency_col: str,
-        annual_col: str,
-) -> pd.DataFrame:
-    """
-    Add an annualised column plus one column per period in ``PERIOD_MAP``.
-
-    Args:
-        df: Original DataFrame.
-        amount_col: Monetary column name.
-        frequency_col: Frequency label column.
-        annual_col: Name for the derived annual figure.
-
-    Returns:
-        DataFrame with the new columns; original columns left intact.
-    """
-    out = df.copy()
-
-    out[annual_col] = (
-        out[frequency_col]
-        .map(PERIOD_MAP)
-        .astype(float)
-        * out[amount_col].astype(float)
-    )
-
-    for period, mult in PERIOD_MAP.items():
-        out[period] = out[annual_col] / mult
+    schema = schemas.schema_for(file_name)
+    if schema is None:
+        return pd.read_csv(path, encoding='utf-8-sig')
+    return schemas.read_table(path, schema)
 
-    return out
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Domain objects
@@ -133,7 +98,7 @@ class Income:
     ) -> 'Income':
         raw = _read_csv(file_name, data_dir=data_dir)
 
-        enriched = _add_frequency_cols(
+        enriched = add_frequency_cols(
             raw,
             amount_col='Salary',
             frequency_col='Frequency',
@@ -165,7 +130,7 @@ class Expenses:
     ) -> 'Expenses':
         raw = _read_csv(file_name, data_dir=data_dir)
 
-        enriched = _add_frequency_cols(
+        enriched = add_frequency_cols(
             raw,
             amount_col='Amount',
             frequency_col='Frequency',
@@ -190,7 +155,7 @@ class Subscriptions(Expenses):
     ) -> 'Subscriptions':
         raw = _read_csv(file_name, data_dir=data_dir)
 
-        enriched = _add_frequency_cols(
+        enriched = add_frequency_cols(
             raw,
             amount_col='Amount',
             frequency_col='Frequency',
@@ -214,7 +179,7 @@ class PlannedPurchases(Expenses):
     ) -> 'PlannedPurchases':
         raw = _read_csv(file_name, data_dir=data_dir)
 
-        enriched = _add_frequency_cols(
+        enriched = add_frequency_cols(
             raw,
             amount_col='Cost',
             frequency_col='Amortization Method',
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import Dict, List, Mapping
+
+import pandas as pd
+
+# Payments per year for each frequency label shown as a per-period column.
+PERIOD_MAP: Dict[str, float] = {
+    'Weekly': 52,
+    'Semi-Monthly': 24,
+    'Monthly': 12,
+    'Quarterly': 4,
+    'Annual': 1,
+}
+
+# Payments per year for every canonical frequency label (see ``schemas.FREQUENCY_ALIASES``).
+PAYMENTS_PER_YEAR: Dict[str, float] = {
+    'Weekly': 52,
+    'Bi-Weekly': 26,
+    'Semi-Monthly': 24,
+    'Monthly': 12,
+    'Quarterly': 4,
+    'Semester': 2,
+    'Semi-Annually': 2,
+    'Annual': 1,
+}
+
+
+def annual_amount(amount: pd.Series, frequency: pd.Series) -> pd.Series:
+    """
+    Yearly total of amounts paid at each row's frequency.
+
+    The one annualisation behind the budget plan, the frequency columns and
+    the materialized summaries, so they always agree.
+
+    Returns:
+        ``amount`` times ``PAYMENTS_PER_YEAR`` of the frequency; NaN where the
+        frequency is missing or unknown.
+    """
+    return frequency.map(PAYMENTS_PER_YEAR).astype(float) * amount.astype(float)
+
+
+def add_frequency_cols(
+        df: pd.DataFrame,
+        *,
+        amount_col: str,
+        frequency_col: str,
+        annual_col: str,
+) -> pd.DataFrame:
+    """
+    Add an annualised column plus one column per period in ``PERIOD_MAP``.
+
+    Args:
+        df: Original DataFrame.
+        amount_col: Monetary column name.
+        frequency_col: Frequency label column.
+        annual_col: Name for the derived annual figure.
+
+    Returns:
+        DataFrame with the new columns; original columns left intact.
+    """
+    out = df.copy()
+
+    out[annual_col] = annual_amount(out[amount_col], out[frequency_col])
+
+    for period, mult in PERIOD_MAP.items():
+        out[period] = out[annual_col] / mult
+
+    return out
+
+
+def budget_plan(
+        budget_data: pd.DataFrame,
+        period_map: Mapping[str, float] = PERIOD_MAP,
+        pre_tax_income: float = 0.0,
+        after_tax_income: float = 0.0,
+) -> pd.DataFrame:
+    """
+    Expenses with their annual amount, per-period amounts and shares of the budget.
+
+    Args:
+        budget_data: Normalized ``BUDGET`` table.
+        period_map: Period name -> payments per year, one displayed column per
+            entry. Annual amounts use ``PAYMENTS_PER_YEAR`` whatever periods
+            are displayed.
+        pre_tax_income: Annual income before taxes.
+        after_tax_income: Annual income after taxes.
+
+    Returns:
+        Copy of ``budget_data`` plus 'Annual Amount', one column per period,
+        '% of Total Budget', 'Category Total', '% of Total Category',
+        '% of Pre-Tax Income' and '% of After Tax Income'. The income shares
+        are NaN when that income is not positive.
+    """
+    # ─── Annual Amount ──────────────────────────────────────────────────────────
+    plan = budget_data.copy()
+    plan['Annual Amount'] = annual_amount(plan['Amount'], plan['Frequency'].fillna('Monthly')).fillna(0)
+
+    # ─── Per-period columns ─────────────────────────────────────────────────────
+    for period in period_map.keys():
+        plan[period] = plan['Annual Amount'] / period_map[period]
+
+    # ─── Shares of the total and of each category ───────────────────────────────
+    total_annual = plan['Annual Amount'].sum()
+    plan['% of Total Budget'] = (
+        plan['Annual Amount'] / total_annual * 100
+        if total_annual != 0 else 0
+    )
+
+    plan['Category Total'] = plan.groupby('Category')['Annual Amount'].transform('sum')
+    plan['% of Total Category'] = (
+        plan['Annual Amount'] / plan['Category Total'] * 100
+    )
+
+    # ─── Shares of income ───────────────────────────────────────────────────────
+    plan['% of Pre-Tax Income'] = (
+        plan['Annual Amount'] / pre_tax_income * 100
+        if pre_tax_income > 0 else float('nan')
+    )
+    plan['% of After Tax Income'] = (
+        plan['Annual Amount'] / after_tax_income * 100
+        if after_tax_income > 0 else float('nan')
+    )
+
+    return plan
+
+
+def unique_values(df: pd.DataFrame, column: str) -> List[str]:
+    """Distinct non-null values of ``column``, in order of first appearance."""
+    return df[column].dropna().unique().tolist()
+
+
+def category_totals(table: pd.DataFrame, *, amount_col: str = 'Annual Amount') -> Dict[str, float]:
+    """Sum of ``amount_col`` per category, largest first."""
+    totals = table.groupby('Category')[amount_col].sum().sort_values(ascending=False)
+    return {str(category): float(total) for category, total in totals.items()}
+
+
+def project_savings(annual_surplus: float, years: int, return_rate: float = 0.0) -> float:
+    """
+    Savings after ``years`` of putting the annual surplus aside at year end.
+
+    Args:
+        annual_surplus: Amount saved each year (negative when spending exceeds income).
+        years: Number of years.
+        return_rate: Annual return on the savings, as a fraction.
+
+    Returns:
+        Future value of the yearly contributions.
+    """
+    if return_rate == 0:
+        return annual_surplus * years
+    return annual_surplus * ((1 + return_rate) ** years - 1) / return_rate
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend import schemas
+
+RULE_KINDS = ('substring', 'regex')
+
+# Rank used for "no rule matched"; larger than any real rule index.
+_NO_MATCH = np.iinfo(np.int64).max
+
+# Regex constructs that change meaning or fail inside the combined alternation:
+# backreferences and conditionals (group numbers shift), named groups (names
+# may clash) and inline flags (only allowed at the start of a pattern).
+_NOT_COMBINABLE = re.compile(r'\\[1-9]|\(\?P[<=]|\(\?\(|\(\?[aiLmsux]+[):]|\(\?-')
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """
+    Assign ``category`` to transactions whose description matches ``pattern``
+    and whose absolute amount lies within ``[min_amount, max_amount]``.
+
+    An empty pattern matches every description; a missing bound is open.
+    """
+
+    category: str
+    pattern: str = ''
+    kind: str = 'substring'
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+    source: str = 'user'
+
+    @property
+    def has_amount_range(self) -> bool:
+        return self.min_amount is not None or self.max_amount is not None
+
+    def regex(self) -> str:
+        """Case-insensitive regex source equivalent to this rule's pattern."""
+        if self.kind == 'regex':
+            return self.pattern
+        return re.escape(_normalize_text(self.pattern))
+
+
+def check_rules(rules: Sequence[Rule]) -> None:
+    """
+    Raises:
+        ValueError: A rule has an unknown kind or a regex that does not
+            compile; the message names every such rule by its position.
+    """
+    problems = []
+    for n, rule in enumerate(rules, start=1):
+        if rule.kind not in RULE_KINDS:
+            problems.append(f'rule {n} ({rule.category}): kind must be one of {RULE_KINDS}, got {rule.kind!r}')
+            continue
+        try:
+            re.compile(rule.regex(), re.IGNORECASE)
+        except re.error as err:
+            problems.append(f'rule {n} ({rule.category}): invalid regex {rule.pattern!r}: {err}')
+    if problems:
+        raise ValueError('Invalid categorization rules: ' + '; '.join(problems))
+
+
+def normalize_description(s: pd.Series) -> pd.Series:
+    """Lower-case and collapse whitespace so rules match regardless of formatting."""
+    return s.fillna('').astype(str).str.lower().str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def _normalize_text(text: str) -> str:
+    return ' '.join(text.lower().split())
+
+
+class _AhoCorasick:
+    """
+    Multi-substring automaton reporting the lowest rule index found in a text.
+
+    Cost per text is linear in its length, independent of the number of patterns.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, int]]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        best: List[int] = [_NO_MATCH]
+
+        for text, rank in patterns:
+            state = 0
+            for ch in text:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    best.append(_NO_MATCH)
+                    goto[state][ch] = nxt
+                state = nxt
+            best[state] = min(best[state], rank)
+
+        # Breadth-first failure links; each state inherits the best rank of its
+        # longest proper suffix so a search only has to look at the current state.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                best[nxt] = min(best[nxt], best[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._best = best
+
+    def search(self, text: str) -> int:
+        goto, fail, best = self._goto, self._fail, self._best
+        state = 0
+        found = best[0]
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if best[state] < found:
+                found = best[state]
+        return found
+
+
+class CompiledRules:
+    """
+    All rules compiled into a single matcher.
+
+    Description-only substring rules share one Aho-Corasick automaton and
+    description-only regex rules share one anchored alternation of look-aheads,
+    ``^(?:(?=.*?(?P<_r0>p0))|(?=.*?(?P<_r1>p1))|...)``. Each *unique*
+    description is scanned once by each, yielding the highest-priority match.
+    Rules with amount ranges, and regexes that cannot be embedded in the
+    alternation (backreferences, named groups, inline flags), are evaluated
+    one by one as vectorized masks on top.
+
+    Raises:
+        ValueError: See ``check_rules``.
+    """
+
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        check_rules(rules)
+        self.rules = list(rules)
+        self.categories = np.array([rule.category for rule in self.rules] + [''], dtype=object)
+
+        def combinable(rule: Rule) -> bool:
+            return not rule.has_amount_range and not (
+                rule.kind == 'regex' and _NOT_COMBINABLE.search(rule.pattern)
+            )
+
+        plain = [(i, rule) for i, rule in enumerate(self.rules) if combinable(rule)]
+        self._ranged = [(i, rule, re.compile(rule.regex(), re.IGNORECASE))
+                        for i, rule in enumerate(self.rules) if not combinable(rule)]
+
+        substrings = [(_normalize_text(rule.pattern), i) for i, rule in plain if rule.kind == 'substring']
+        self._automaton = _AhoCorasick(substrings) if substrings else None
+
+        regexes = [(i, rule) for i, rule in plain if rule.kind == 'regex']
+        self._matcher = None
+        if regexes:
+            alternatives = '|'.join(
+                f'(?=.*?(?P<_r{i}>{rule.regex()}))' for i, rule in regexes
+            )
+            self._matcher = re.compile(f'^(?:{alternatives})', re.IGNORECASE | re.DOTALL)
+
+    def _plain_ranks(self, uniques: Sequence[str]) -> np.ndarray:
+        """Index of the first matching description-only rule for each unique description."""
+        ranks = np.full(len(uniques), _NO_MATCH, dtype=np.int64)
+
+        if self._automaton is not None:
+            search = self._automaton.search
+            ranks = np.fromiter((search(text) for text in uniques), np.int64, len(uniques))
+
+        if self._matcher is not None:
+            match = self._matcher.match
+            for pos, text in enumerate(uniques):
+                m = match(text)
+                if m is not None:
+                    ranks[pos] = min(ranks[pos], int(m.lastgroup[2:]))
+        return ranks
+
+    def match(self, descriptions: pd.Series, amounts: pd.Series) -> np.ndarray:
+        """
+        Returns:
+            Index into ``rules`` of the winning rule per row, ``len(rules)`` where none matched.
+        """
+        codes, uniques = pd.factorize(normalize_description(descriptions))
+        uniques = list(uniques)
+        ranks = self._plain_ranks(uniques)[codes] if len(codes) else np.empty(0, dtype=np.int64)
+
+        magnitude = amounts.abs().to_numpy(dtype=float)
+        for i, rule, pattern in self._ranged:
+            in_range = np.ones(len(magnitude), dtype=bool)
+            if rule.min_amount is not None:
+                in_range &= magnitude >= rule.min_amount
+            if rule.max_amount is not None:
+                in_range &= magnitude <= rule.max_amount
+            if rule.pattern:
+                hits = np.fromiter((pattern.search(text) is not None for text in uniques), bool, len(uniques))
+                in_range &= hits[codes]
+            ranks = np.where(in_range & (i < ranks), i, ranks)
+
+        ranks[ranks == _NO_MATCH] = len(self.rules)
+        return ranks
+
+    def categorize(self, descriptions: pd.Series, amounts: pd.Series) -> pd.Series:
+        """
+        Returns:
+            Category per row, ``''`` where no rule matched.
+        """
+        return pd.Series(
+            self.categories[self.match(descriptions, amounts)],
+            index=descriptions.index,
+            name='Category',
+        )
+
+
+class RuleSet:
+    """
+    Ordered, CSV-backed list of categorization rules; earlier rules win.
+    """
+
+    def __init__(self, rules: Optional[List[Rule]] = None, path: str | Path = 'data/category_rules.csv') -> None:
+        self.rules: List[Rule] = list(rules or [])
+        self.path = Path(path)
+        self._compiled: Optional[CompiledRules] = None
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+    @classmethod
+    def load(cls, path: str | Path = 'data/category_rules.csv') -> 'RuleSet':
+        try:
+            table = schemas.read_table(path, schemas.CATEGORY_RULES)
+        except FileNotFoundError:
+            return cls(path=path)
+        return cls(rules_from_frame(table), path=path)
+
+    def save(self) -> None:
+        """
+        Raises:
+            ValueError: See ``check_rules``; nothing is written.
+        """
+        check_rules(self.rules)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.to_frame().to_csv(self.path, index=False, encoding='utf-8-sig')
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                {
+                    'Category': rule.category,
+                    'Pattern': rule.pattern,
+                    'Kind': rule.kind,
+                    'Min Amount': rule.min_amount,
+                    'Max Amount': rule.max_amount,
+                    'Source': rule.source,
+                }
+                for rule in self.rules
+            ],
+            columns=list(schemas.CATEGORY_RULES.columns),
+        )
+
+    # ── Matching ─────────────────────────────────────────────────────────────
+    @property
+    def compiled(self) -> CompiledRules:
+        if self._compiled is None:
+            self._compiled = CompiledRules(self.rules)
+        return self._compiled
+
+    def categorize(self, transactions: pd.DataFrame, *, overwrite: bool = False) -> pd.DataFrame:
+        """
+        Fill the ``'Category'`` column of ``transactions``.
+
+        Args:
+            transactions: Frame with ``'Description'`` and ``'Amount'`` columns.
+            overwrite: Re-categorize rows that already have a category.
+
+        Returns:
+            Copy of ``transactions`` with categories assigned.
+        """
+        out = transactions.copy()
+        if 'Category' not in out.columns:
+            out['Category'] = ''
+
+        todo = out.index if overwrite else out.index[out['Category'].fillna('').eq('')]
+        if len(todo):
+            out.loc[todo, 'Category'] = self.compiled.categorize(
+                out.loc[todo, 'Description'],
+                out.loc[todo, 'Amount'],
+            )
+        return out
+
+    # ── Feedback ─────────────────────────────────────────────────────────────
+    def learn(self, description: str, category: str) -> None:
+        """
+        Record a user's manual categorization as a top-priority override rule.
+
+        Later overrides for the same description replace earlier ones.
+        """
+        self._learn([(description, category)])
+
+    def learn_many(self, corrections: pd.DataFrame) -> None:
+        """``learn`` every row of a frame with ``'Description'`` and ``'Category'``, rebuilding the rules once."""
+        self._learn(corrections[['Description', 'Category']].itertuples(index=False))
+
+    def _learn(self, corrections: Iterable[Tuple[str, str]]) -> None:
+        # Pattern -> category, most recent correction last, as repeated ``learn`` calls would leave them.
+        latest: Dict[str, str] = {}
+        for description, category in corrections:
+            pattern = _normalize_text(description)
+            if pattern:
+                latest.pop(pattern, None)
+                latest[pattern] = category
+        if not latest:
+            return
+        kept = [rule for rule in self.rules if not (rule.source == 'override' and rule.pattern in latest)]
+        overrides = [Rule(category=category, pattern=pattern, source='override')
+                     for pattern, category in reversed(latest.items())]
+        self.rules = overrides + kept
+        self._compiled = None
+
+
+def rules_from_frame(table: pd.DataFrame) -> List[Rule]:
+    """Build rules from a frame laid out like ``CATEGORY_RULES``, skipping blank categories."""
+    table = schemas.normalize(table, schemas.CATEGORY_RULES, errors='coerce')
+    table = table[table['Category'].fillna('').ne('')]
+    return [
+        Rule(
+            category=row.category,
+            pattern=row.pattern or '',
+            kind=row.kind,
+            min_amount=None if pd.isna(row.min_amount) else float(row.min_amount),
+            max_amount=None if pd.isna(row.max_amount) else float(row.max_amount),
+            source=row.source,
+        )
+        for row in table.rename(columns=lambda col: col.lower().replace(' ', '_')).itertuples(index=False)
+    ]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Payoff orderings the planner compares.
+STRATEGIES = ('Avalanche', 'Snowball', 'Custom')
+
+# Simulations stop after this many months even if some debt is still open.
+MAX_MONTHS = 600
+
+# Balances below this count as paid off (rounding leftovers of the interest).
+_PAID = 0.005
+
+
+def orderings(debts: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Rank of every debt (0 = paid first) under each strategy.
+
+    Avalanche targets the highest APR first (smaller balance on ties), snowball
+    the smallest balance first (higher APR on ties) and custom follows the
+    ``'Priority'`` column, falling back to avalanche order where it is missing.
+
+    Args:
+        debts: Normalized ``DEBTS`` rows.
+
+    Returns:
+        Strategy name -> integer ranks, one per row of ``debts``.
+    """
+    balance = debts['Balance'].to_numpy(dtype=float)
+    apr = debts['APR'].fillna(0).to_numpy(dtype=float)
+    priority = debts['Priority'].astype('Float64').fillna(np.inf).to_numpy(dtype=float)
+    avalanche = np.argsort(np.lexsort((balance, -apr)))
+    return {
+        'Avalanche': avalanche,
+        'Snowball': np.argsort(np.lexsort((-apr, balance))),
+        'Custom': np.argsort(np.lexsort((avalanche, priority))),
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class PayoffPlan:
+    """
+    Outcome of every strategy at every extra-payment level.
+
+    Arrays are indexed ``[strategy, extra]`` (and then ``[debt]`` or
+    ``[month]``); months to payoff are ``NaN`` where a debt is still open after
+    ``MAX_MONTHS``.
+
+    Attributes:
+        strategies: Strategy names, in axis order.
+        extras: Monthly extra payments, in axis order.
+        months: Months until every debt is paid, shape ``(strategy, extra)``.
+        interest: Total interest paid, shape ``(strategy, extra)``.
+        payoff_month: Month each debt is paid off, shape ``(strategy, extra, debt)``.
+        balance: Total balance at the end of each month, shape ``(strategy, extra, month)``.
+    """
+
+    strategies: Tuple[str, ...]
+    extras: np.ndarray
+    months: np.ndarray
+    interest: np.ndarray
+    payoff_month: np.ndarray
+    balance: np.ndarray
+
+    def summary(self) -> pd.DataFrame:
+        """Months to payoff and total interest as a long frame, one row per strategy and extra."""
+        n_strategies, n_extras = self.months.shape
+        return pd.DataFrame({
+            'Strategy': np.repeat(self.strategies, n_extras),
+            'Extra Payment': np.tile(self.extras, n_strategies),
+            'Months': self.months.ravel(),
+            'Interest': self.interest.ravel(),
+        })
+
+
+def simulate(
+        debts: pd.DataFrame,
+        extras: Sequence[float],
+        strategies: Sequence[str] = STRATEGIES,
+        max_months: int = MAX_MONTHS,
+) -> PayoffPlan:
+    """
+    Month-by-month payoff of ``debts`` for every strategy and extra payment at once.
+
+    Each month every balance accrues ``APR / 12`` interest and gets its
+    minimum payment. The rest of the monthly budget (all minimums plus the
+    extra) goes down the strategy's ordering: the first open debt is paid as
+    far as possible, then the next. Minimums of paid-off debts roll into the
+    extra, so the budget stays constant. The only Python loop is over months;
+    each step updates the whole ``(strategy, extra, debt)`` array.
+
+    Args:
+        debts: Normalized ``DEBTS`` rows.
+        extras: Monthly amounts paid on top of the minimums.
+        strategies: Names from ``STRATEGIES``.
+        max_months: Months simulated at most.
+
+    Returns:
+        The ``PayoffPlan``.
+    """
+    extras = np.asarray(extras, dtype=float)
+    ranks = orderings(debts)
+    # Debt indices in payment order, shape (strategy, 1, debt), for take_along_axis.
+    order = np.stack([np.argsort(ranks[name]) for name in strategies])[:, None, :]
+
+    rate = debts['APR'].fillna(0).to_numpy(dtype=float) / 12
+    minimum = debts['Minimum Payment'].fillna(0).to_numpy(dtype=float)
+    budget = minimum.sum() + extras[None, :]
+    shape = (len(strategies), len(extras), len(debts))
+
+    balance = np.broadcast_to(debts['Balance'].fillna(0).to_numpy(dtype=float), shape).copy()
+    payoff_month = np.where(balance > _PAID, np.nan, 0.0)
+    interest = np.zeros(shape[:2])
+    history = []
+
+    for month in range(1, max_months + 1):
+        if not (balance > _PAID).any():
+            break
+        accrued = balance * rate
+        interest += accrued.sum(axis=2)
+        balance += accrued
+
+        paid = np.minimum(balance, minimum)
+        balance -= paid
+        left = budget - paid.sum(axis=2)
+
+        # Waterfall the rest through the ordering: each debt gets what is left
+        # after every debt ahead of it is cleared.
+        ordered = np.take_along_axis(balance, np.broadcast_to(order, shape), axis=2)
+        ahead = np.cumsum(ordered, axis=2) - ordered
+        extra_paid = np.clip(left[..., None] - ahead, 0, ordered)
+        np.put_along_axis(balance, np.broadcast_to(order, shape), ordered - extra_paid, axis=2)
+
+        balance[balance <= _PAID] = 0.0
+        payoff_month[np.isnan(payoff_month) & (balance == 0)] = month
+        history.append(balance.sum(axis=2))
+
+    months = np.where(np.isnan(payoff_month).any(axis=2), np.nan, np.nanmax(payoff_month, axis=2, initial=0))
+    return PayoffPlan(
+        strategies=tuple(strategies),
+        extras=extras,
+        months=months,
+        interest=interest,
+        payoff_month=payoff_month,
+        balance=np.stack(history, axis=2) if history else np.zeros(shape[:2] + (0,)),
+    )
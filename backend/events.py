@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger('budgeting_app.events')
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """
+    One write to a stored table.
+
+    Attributes:
+        dataset: The table's file name, e.g. ``'budget_data.csv'``.
+        path: The file that was written.
+        version: The file's ``(mtime_ns, size)`` after the write.
+        row_ids: IDs of the rows added, updated or deleted; ``None`` when the
+            whole table was replaced.
+        table: The table as written, when the publisher has it; lets
+            subscribers avoid reading the file back.
+    """
+
+    dataset: str
+    path: Path
+    version: Tuple[int, int]
+    row_ids: Optional[FrozenSet[int]] = None
+    table: Optional[pd.DataFrame] = field(default=None, compare=False, repr=False)
+
+
+Subscriber = Callable[[Change], None]
+
+
+class ChangeBus:
+    """
+    In-process publish/subscribe channel for table writes.
+
+    Subscribers are called synchronously on the writing thread, after the file
+    is in place, in subscription order. A failing subscriber is logged and
+    skipped so one stale cache cannot fail a save.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: List[Tuple[Optional[FrozenSet[str]], Subscriber]] = []
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Subscriber, datasets: Optional[Tuple[str, ...]] = None) -> Callable[[], None]:
+        """
+        Call ``callback`` for every change to ``datasets`` (every dataset when ``None``).
+
+        Returns:
+            A function that removes the subscription.
+        """
+        entry = (frozenset(datasets) if datasets is not None else None, callback)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    def publish(self, change: Change) -> None:
+        """Deliver ``change`` to the matching subscribers."""
+        with self._lock:
+            self._generations[change.dataset] = self._generations.get(change.dataset, 0) + 1
+            subscribers = [cb for datasets, cb in self._subscribers if datasets is None or change.dataset in datasets]
+        for callback in subscribers:
+            try:
+                callback(change)
+            except Exception:  # a subscriber must never fail the write
+                logger.exception('change subscriber %r failed for %s', callback, change.dataset)
+
+    def generation(self, dataset: str) -> int:
+        """Number of changes published for ``dataset`` in this process."""
+        with self._lock:
+            return self._generations.get(dataset, 0)
+
+
+bus = ChangeBus()
+
+
+def subscribe(callback: Subscriber, datasets: Optional[Tuple[str, ...]] = None) -> Callable[[], None]:
+    """``ChangeBus.subscribe`` on the process-wide bus."""
+    return bus.subscribe(callback, datasets)
+
+
+def publish(change: Change) -> None:
+    """``ChangeBus.publish`` on the process-wide bus."""
+    bus.publish(change)
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import io
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from backend import schemas
+from backend.categorize import RuleSet
+from backend.storage import HashIndex, TransactionStore
+
+# Rows parsed, normalized and written per block; bounds memory for large exports.
+CHUNK_SIZE = 50_000
+
+# Bank/card export header -> transaction column. Earlier entries win when an
+# export carries several candidates (e.g. both 'Transaction Date' and 'Post Date').
+HEADER_ALIASES: Dict[str, List[str]] = {
+    'Date': ['Date', 'Transaction Date', 'Trans. Date', 'Posted Date', 'Post Date', 'Posting Date'],
+    'Description': ['Description', 'Payee', 'Merchant', 'Name', 'Memo', 'Details'],
+    'Amount': ['Amount', 'Transaction Amount', 'Amount (USD)'],
+    'Debit': ['Debit', 'Withdrawal', 'Withdrawals'],
+    'Credit': ['Credit', 'Deposit', 'Deposits'],
+    'Account': ['Account', 'Account Name', 'Card', 'Account Number'],
+}
+
+# OFX/QFX statement fields kept for each <STMTTRN> block.
+_OFX_FIELDS = {'DTPOSTED', 'TRNAMT', 'NAME', 'MEMO', 'FITID'}
+_OFX_TAG = re.compile(r'<(/?)([A-Z0-9.]+)>([^<\r\n]*)')
+
+Source = Union[str, Path, IO]
+
+
+@dataclass(frozen=True, slots=True)
+class ImportResult:
+    """
+    Row counts of one statement import.
+    """
+
+    rows_read: int
+    rows_imported: int
+    duplicates: int
+    rejected: int
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Readers
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _source_name(source: Source) -> str:
+    return str(getattr(source, 'name', source))
+
+
+def _text_stream(source: Source) -> IO[str]:
+    """Open ``source`` as a text stream, wrapping binary uploads."""
+    if isinstance(source, (str, Path)):
+        return open(source, 'r', encoding='utf-8-sig', errors='replace')
+    if isinstance(source, io.TextIOBase):
+        return source
+    return io.TextIOWrapper(source, encoding='utf-8-sig', errors='replace')
+
+
+def _pick_column(columns: List[str], candidates: List[str]) -> Optional[str]:
+    lookup = {col.strip().lower(): col for col in columns}
+    for candidate in candidates:
+        if candidate.lower() in lookup:
+            return lookup[candidate.lower()]
+    return None
+
+
+def iter_csv_chunks(source: Source, chunksize: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yield raw transaction blocks from a bank/card CSV export.
+
+    Each block has the columns ``'Date'``, ``'Description'``, ``'Amount'`` and
+    ``'Account'`` (the latter may be empty).
+
+    Raises:
+        schemas.SchemaError: The export has no recognisable date, description
+            or amount column.
+    """
+    reader = pd.read_csv(
+        source,
+        dtype=str,
+        encoding='utf-8-sig',
+        chunksize=chunksize,
+        skipinitialspace=True,
+    )
+    mapping: Optional[Dict[str, Optional[str]]] = None
+
+    for block in reader:
+        if mapping is None:
+            mapping = {
+                target: _pick_column(list(block.columns), candidates)
+                for target, candidates in HEADER_ALIASES.items()
+            }
+            has_amount = mapping['Amount'] or mapping['Debit'] or mapping['Credit']
+            if not (mapping['Date'] and mapping['Description'] and has_amount):
+                raise schemas.SchemaError(
+                    f"'{_source_name(source)}' is not a recognised statement export "
+                    f'(columns: {list(block.columns)})'
+                )
+
+        if mapping['Amount']:
+            amount = schemas.to_money(block[mapping['Amount']])
+        else:
+            # Split debit/credit exports: outflows become negative amounts.
+            debit = schemas.to_money(block[mapping['Debit']]) if mapping['Debit'] else 0.0
+            credit = schemas.to_money(block[mapping['Credit']]) if mapping['Credit'] else 0.0
+            amount = pd.Series(credit, index=block.index).fillna(0) - pd.Series(debit, index=block.index).fillna(0)
+
+        yield pd.DataFrame({
+            'Date': block[mapping['Date']],
+            'Description': block[mapping['Description']],
+            'Amount': amount,
+            'Account': block[mapping['Account']] if mapping['Account'] else '',
+        })
+
+
+def iter_ofx_chunks(source: Source, chunksize: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yield raw transaction blocks from an OFX/QFX export, streaming line by line.
+
+    Handles both SGML (OFX 1.x, unclosed tags) and XML (OFX 2.x) bodies.
+    """
+    rows: List[Dict[str, str]] = []
+    account = ''
+    current: Optional[Dict[str, str]] = None
+
+    with _text_stream(source) as stream:
+        for line in stream:
+            for closing, tag, value in _OFX_TAG.findall(line):
+                value = value.strip()
+                if tag == 'STMTTRN':
+                    if current is not None:
+                        rows.append(current)
+                    current = None if closing else {}
+                elif tag == 'ACCTID' and not closing:
+                    account = value
+                elif current is not None and not closing and tag in _OFX_FIELDS:
+                    current[tag] = value
+
+            if len(rows) >= chunksize:
+                yield _ofx_frame(rows, account)
+                rows = []
+
+    if current is not None:
+        rows.append(current)
+    if rows:
+        yield _ofx_frame(rows, account)
+
+
+def _ofx_frame(rows: List[Dict[str, str]], account: str) -> pd.DataFrame:
+    raw = pd.DataFrame(rows, columns=sorted(_OFX_FIELDS))
+    description = raw['NAME'].fillna(raw['MEMO'])
+    return pd.DataFrame({
+        # OFX dates are 'YYYYMMDD[HHMMSS[.XXX]][TZ]'; only the day matters here.
+        'Date': pd.to_datetime(raw['DTPOSTED'].str[:8], format='%Y%m%d', errors='coerce'),
+        'Description': description,
+        'Amount': schemas.to_money(raw['TRNAMT']),
+        'Account': account,
+    })
+
+
+def iter_statement_chunks(source: Source, chunksize: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Dispatch on the file extension to the CSV or OFX/QFX reader."""
+    suffix = Path(_source_name(source)).suffix.lower()
+    if suffix in ('.ofx', '.qfx'):
+        return iter_ofx_chunks(source, chunksize)
+    return iter_csv_chunks(source, chunksize)
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Normalization and dedup
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def normalize_chunk(raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast a raw block to transaction types in one vectorized pass.
+
+    Rows without a parseable date or amount are dropped.
+    """
+    out = pd.DataFrame({
+        'Date': schemas.to_date(raw['Date']).dt.normalize(),
+        'Description': raw['Description'].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True),
+        'Amount': schemas.to_money(raw['Amount']).round(2),
+        'Account': raw['Account'].fillna('').astype(str).str.strip(),
+    })
+    return out[out['Date'].notna() & out['Amount'].notna()]
+
+
+def row_hashes(df: pd.DataFrame, seen: Dict[int, int]) -> np.ndarray:
+    """
+    Hash each transaction by date, amount, description, account and occurrence.
+
+    The occurrence number keeps genuinely repeated charges (two identical
+    coffees on one day) distinct, and is carried across chunks through
+    ``seen``, which is updated in place.
+
+    Returns:
+        uint64 array of row hashes.
+    """
+    key = pd.util.hash_pandas_object(
+        pd.DataFrame({
+            'Date': df['Date'].to_numpy().astype('datetime64[D]').astype('int64'),
+            'Cents': (df['Amount'].to_numpy() * 100).round().astype('int64'),
+            'Description': df['Description'].str.lower(),
+            'Account': df['Account'],
+        }),
+        index=False,
+    )
+    offset = key.map(seen).fillna(0).astype('uint64')
+    occurrence = key.groupby(key).cumcount().astype('uint64') + offset
+
+    for value, count in key.value_counts().items():
+        seen[value] = seen.get(value, 0) + count
+
+    return pd.util.hash_array(key.to_numpy() ^ (occurrence.to_numpy() * np.uint64(0x9E3779B97F4A7C15)))
+
+
+def import_statement(
+        source: Source,
+        store: Optional[TransactionStore] = None,
+        *,
+        account: Optional[str] = None,
+        rules: Optional[RuleSet] = None,
+        chunksize: int = CHUNK_SIZE,
+) -> ImportResult:
+    """
+    Stream a bank/card statement into the transaction store.
+
+    Args:
+        source: Path or file-like object of a ``.csv``, ``.ofx`` or ``.qfx`` export.
+        store: Destination store. Defaults to the ``data/transactions`` ledger.
+        account: Account label overriding the one found in the export.
+        rules: Categorization rules applied to each chunk before it is written.
+        chunksize: Rows per parse/normalize/write block.
+
+    Returns:
+        ImportResult with read, imported, duplicate and rejected row counts.
+    """
+    store = store or TransactionStore()
+    index: HashIndex = store.hash_index()
+    next_id = store.next_id()
+    seen: Dict[int, int] = {}
+    read = imported = duplicates = rejected = 0
+
+    for raw in iter_statement_chunks(source, chunksize):
+        read += len(raw)
+        if account is not None:
+            raw = raw.assign(Account=account)
+
+        chunk = normalize_chunk(raw)
+        rejected += len(raw) - len(chunk)
+
+        hashes = row_hashes(chunk, seen)
+        fresh = ~index.contains(hashes)
+        duplicates += int((~fresh).sum())
+
+        chunk = chunk[fresh]
+        hashes = hashes[fresh]
+        if chunk.empty:
+            continue
+
+        chunk = chunk.assign(
+            ID=np.arange(next_id, next_id + len(chunk)),
+            Category='',
+            Source=Path(_source_name(source)).name,
+            Hash=hashes.view('int64'),
+        )
+        if rules is not None:
+            chunk = rules.categorize(chunk)
+        store.append(chunk)
+        index.add(hashes)
+        next_id += len(chunk)
+        imported += len(chunk)
+
+    return ImportResult(
+        rows_read=read,
+        rows_imported=imported,
+        duplicates=duplicates,
+        rejected=rejected,
+    )
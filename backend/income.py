@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from backend import events, schemas
+
+# Per-source figures shown on the Income page, all annual.
+METRIC_COLUMNS = [
+    'Job Title',
+    'Salary',
+    'Bonus',
+    'Total Compensation',
+    'After Tax Salary',
+    'After Tax Bonus',
+    'After Tax Total Compensation',
+    'Salary Tax',
+    'Bonus Tax',
+    'Total Compensation Tax',
+]
+
+# Resolved path -> (file version, table, metrics), shared by every store on that file.
+_cache: Dict[Path, Tuple[Tuple[int, int], pd.DataFrame, pd.DataFrame]] = {}
+_lock = threading.Lock()
+
+
+def income_metrics(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Every source's pre-tax, after-tax and tax figures in one vectorized pass.
+
+    Args:
+        table: Normalized ``INCOME`` table.
+
+    Returns:
+        Frame indexed by income ID with ``METRIC_COLUMNS``.
+    """
+    out = table.set_index('ID')[METRIC_COLUMNS[:7]].copy()
+    out['Salary Tax'] = out['Salary'] - out['After Tax Salary']
+    out['Bonus Tax'] = out['Bonus'] - out['After Tax Bonus']
+    out['Total Compensation Tax'] = out['Total Compensation'] - out['After Tax Total Compensation']
+    return out
+
+
+def _derived(salary: float, bonus: float, tax_rate: float) -> Dict[str, float]:
+    """Columns stored alongside salary and bonus, from one effective tax rate."""
+    return {
+        'Total Compensation': salary + bonus,
+        'Salary Effective Tax Rate': tax_rate,
+        'Total Compensation Effective Tax Rate': tax_rate,
+        'After Tax Salary': (1 - tax_rate) * salary,
+        'After Tax Bonus': (1 - tax_rate) * bonus,
+        'After Tax Total Compensation': (1 - tax_rate) * (salary + bonus),
+    }
+
+
+class IncomeStore:
+    """
+    Income sources in ``income.csv``, keyed by a stable ``'ID'``.
+
+    Rows without an ID get one on load (continuing after the largest) and keep
+    it from the first write on, so renaming a job title never changes which
+    row a selection points at. Loads are cached per file version and every
+    write replaces the cached entry.
+    """
+
+    def __init__(self, path: str | Path = 'data/income.csv') -> None:
+        self.path = Path(path)
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+    def _version(self) -> Tuple[int, int]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _entry(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        key = self.path.resolve()
+        version = self._version()
+        with _lock:
+            cached = _cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        try:
+            table = schemas.read_table(self.path, schemas.INCOME)
+        except FileNotFoundError:
+            table = schemas.INCOME.empty()
+        metrics = income_metrics(table)
+        with _lock:
+            _cache[key] = (version, table, metrics)
+        return table, metrics
+
+    def load(self) -> pd.DataFrame:
+        """Normalized income table. Shared between callers; treat as read-only."""
+        return self._entry()[0]
+
+    def metrics(self) -> pd.DataFrame:
+        """``income_metrics`` of the current table, indexed by ID. Treat as read-only."""
+        return self._entry()[1]
+
+    def get(self, income_id: int) -> Optional[pd.Series]:
+        """The row with ``income_id``, or ``None``."""
+        table = self.load()
+        rows = table[table['ID'] == income_id]
+        return rows.iloc[0] if len(rows) else None
+
+    # ── Writes ───────────────────────────────────────────────────────────────
+    def _write(self, table: pd.DataFrame, income_id: int) -> None:
+        """Normalize and save ``table`` through a temporary file, cache it and publish the change."""
+        table = schemas.normalize(table, schemas.INCOME)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+        table.to_csv(tmp, index=False, encoding='utf-8-sig')
+        os.replace(tmp, self.path)
+        version = self._version()
+        with _lock:
+            _cache[self.path.resolve()] = (version, table, income_metrics(table))
+        events.publish(events.Change(
+            dataset=self.path.name, path=self.path, version=version, row_ids=frozenset({income_id}), table=table,
+        ))
+
+    def add(self, job_title: str, salary: float, bonus: float, tax_rate: float) -> int:
+        """
+        Append an income source.
+
+        Args:
+            job_title: Display name.
+            salary: Annual salary.
+            bonus: Annual bonus.
+            tax_rate: Effective tax rate as a fraction, e.g. ``0.3``.
+
+        Returns:
+            The new source's ID.
+        """
+        table = self.load()
+        new_id = int(table['ID'].max()) + 1 if len(table) else 1
+        row = {'ID': new_id, 'Job Title': job_title, 'Salary': salary, 'Bonus': bonus,
+               'Frequency': 'Annual', **_derived(salary, bonus, tax_rate)}
+        self._write(pd.concat([table, pd.DataFrame([row])], ignore_index=True), new_id)
+        return new_id
+
+    def update(self, income_id: int, job_title: str, salary: float, bonus: float, tax_rate: float) -> None:
+        """Replace a source's title, pay and tax rate; derived columns are recomputed."""
+        table = self.load().copy()
+        mask = table['ID'] == income_id
+        values = {'Job Title': job_title, 'Salary': salary, 'Bonus': bonus, **_derived(salary, bonus, tax_rate)}
+        for col, value in values.items():
+            table.loc[mask, col] = value
+        self._write(table, income_id)
+
+    def delete(self, income_id: int) -> None:
+        """Remove a source."""
+        table = self.load()
+        self._write(table[table['ID'] != income_id].reset_index(drop=True), income_id)
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend.calculations import PAYMENTS_PER_YEAR
+
+# Pay frequencies -> paychecks in a regular year.
+PAY_FREQUENCIES: Dict[str, int] = {
+    'Weekly': 52,
+    'Bi-Weekly': 26,
+    'Semi-Monthly': 24,
+    'Monthly': 12,
+}
+
+SCHEDULE_COLUMNS = [
+    'Pay Date',
+    'Income ID',
+    'Job Title',
+    'Type',
+    'Gross',
+    'Pre-Tax Deductions',
+    'Taxable',
+    'Withholding',
+    'Net',
+]
+
+BILL_COLUMNS = ['Due Date', 'Name', 'Category', 'Amount', 'Frequency']
+
+COVERAGE_COLUMNS = ['Pay Date', 'Net', 'Bills', 'Due', 'Left Over']
+
+# Recurring frequencies billed on a month cycle -> months between bills.
+_MONTH_STEPS = {'Monthly': 1, 'Quarterly': 3, 'Semester': 6, 'Semi-Annually': 6, 'Annual': 12}
+
+# Recurring frequencies billed on a day cycle -> days between bills.
+_DAY_STEPS = {'Weekly': 7, 'Bi-Weekly': 14}
+
+
+def _check_frequencies(frequency: pd.Series, names: pd.Series, what: str) -> None:
+    """
+    Raises:
+        ValueError: Some rows have a frequency outside ``PAYMENTS_PER_YEAR``;
+            the message names them.
+    """
+    unknown = ~frequency.isin(list(PAYMENTS_PER_YEAR))
+    if unknown.any():
+        rows = ', '.join(f'{name} ({freq})' for name, freq in zip(names[unknown], frequency[unknown]))
+        raise ValueError(f'Unsupported {what} frequency for {rows}; expected one of {list(PAYMENTS_PER_YEAR)}')
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Paychecks
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def pay_dates(year: int, frequency: str, first_pay_date: Optional[datetime.date] = None) -> pd.DatetimeIndex:
+    """
+    Paydays of ``year``.
+
+    Args:
+        year: Calendar year.
+        frequency: One of ``PAY_FREQUENCIES``. Semi-monthly pay lands on the
+            15th and the last day of the month, monthly pay on the last day.
+        first_pay_date: Any payday of a weekly or bi-weekly schedule, in any
+            year; defaults to the year's first Friday.
+
+    Returns:
+        Sorted paydays within the year.
+
+    Raises:
+        ValueError: Unknown frequency.
+    """
+    start, end = pd.Timestamp(year, 1, 1), pd.Timestamp(year, 12, 31)
+    if frequency in ('Weekly', 'Bi-Weekly'):
+        step = 7 if frequency == 'Weekly' else 14
+        first_friday = start + pd.Timedelta(days=(4 - start.weekday()) % 7)
+        anchor = pd.Timestamp(first_pay_date) if first_pay_date else first_friday
+        first = start + pd.Timedelta(days=(anchor - start).days % step)
+        return pd.date_range(first, end, freq=f'{step}D')
+    if frequency == 'Semi-Monthly':
+        return pd.date_range(start, end, freq=pd.offsets.SemiMonthEnd())
+    if frequency == 'Monthly':
+        return pd.date_range(start, end, freq=pd.offsets.MonthEnd())
+    raise ValueError(f'Unknown pay frequency {frequency!r}; expected one of {list(PAY_FREQUENCIES)}')
+
+
+def paycheck_schedule(
+        income: pd.DataFrame,
+        dates: pd.DatetimeIndex,
+        pretax_rate: float = 0.0,
+        bonus_date: Optional[datetime.date] = None,
+) -> pd.DataFrame:
+    """
+    Every paycheck of every income source, in one vectorized pass.
+
+    Salary is split evenly over ``dates`` so the schedule adds up to the annual
+    figures shown elsewhere; a bonus is paid as its own check. Pre-tax
+    deductions (401(k), HSA, ...) come off the gross first, and withholding is
+    the source's effective tax rate on what is left: the salary rate for
+    salary checks, the total compensation rate for bonus checks.
+
+    Args:
+        income: Normalized ``INCOME`` rows.
+        dates: Paydays, e.g. from ``pay_dates``.
+        pretax_rate: Pre-tax deductions as a fraction of gross pay.
+        bonus_date: Payday of the bonus; defaults to the last of ``dates``.
+
+    Returns:
+        One row per paycheck with ``SCHEDULE_COLUMNS``, sorted by pay date.
+
+    Raises:
+        ValueError: A source's salary frequency is not in ``PAYMENTS_PER_YEAR``.
+    """
+    if income.empty or not len(dates):
+        return pd.DataFrame(columns=SCHEDULE_COLUMNS)
+
+    _check_frequencies(income['Frequency'], income['Job Title'], 'salary')
+    n_sources, n_dates = len(income), len(dates)
+    annual_salary = (income['Salary'] * income['Frequency'].map(PAYMENTS_PER_YEAR)).to_numpy(dtype=float)
+    bonus = income['Bonus'].fillna(0).to_numpy(dtype=float)
+    has_bonus = bonus > 0
+
+    # Salary checks, sources x dates flattened row-major, then one bonus check per source with a bonus.
+    source = np.concatenate([np.repeat(np.arange(n_sources), n_dates), np.flatnonzero(has_bonus)])
+    paid_on = np.concatenate([
+        np.tile(dates.to_numpy(), n_sources),
+        np.full(has_bonus.sum(), pd.Timestamp(bonus_date or dates[-1]).to_datetime64()),
+    ])
+    is_bonus = np.arange(len(source)) >= n_sources * n_dates
+    gross = np.where(is_bonus, bonus[source], annual_salary[source] / n_dates)
+    rate = np.where(
+        is_bonus,
+        income['Total Compensation Effective Tax Rate'].fillna(0).to_numpy(dtype=float)[source],
+        income['Salary Effective Tax Rate'].fillna(0).to_numpy(dtype=float)[source],
+    )
+
+    pretax = gross * pretax_rate
+    taxable = gross - pretax
+    withholding = taxable * rate
+    schedule = pd.DataFrame({
+        'Pay Date': paid_on,
+        'Income ID': income['ID'].to_numpy()[source],
+        'Job Title': income['Job Title'].to_numpy()[source],
+        'Type': np.where(is_bonus, 'Bonus', 'Salary'),
+        'Gross': gross,
+        'Pre-Tax Deductions': pretax,
+        'Taxable': taxable,
+        'Withholding': withholding,
+        'Net': taxable - withholding,
+    })
+    return schedule.sort_values(['Pay Date', 'Income ID', 'Type'], kind='stable', ignore_index=True)
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Bills
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def recurring_items(expenses: pd.DataFrame, subscriptions: pd.DataFrame) -> pd.DataFrame:
+    """
+    Active budget expenses and current subscriptions as one frame of
+    ``'Name'``, ``'Category'``, ``'Amount'`` (per period), ``'Frequency'`` and ``'Date'``.
+    """
+    expenses = expenses[expenses['Status'].fillna('Active') == 'Active']
+    subscriptions = subscriptions[subscriptions['Subscribed'].fillna(True).astype(bool)]
+    return pd.concat([
+        pd.DataFrame({
+            'Name': expenses['Name'],
+            'Category': expenses['Category'],
+            'Amount': expenses['Amount'],
+            'Frequency': expenses['Frequency'],
+            'Date': expenses['Date'],
+        }),
+        pd.DataFrame({
+            'Name': subscriptions['Subscription/ Recurring Expense'],
+            'Category': 'Subscriptions',
+            'Amount': subscriptions['Amount'],
+            'Frequency': subscriptions['Frequency'],
+            'Date': subscriptions['Date'],
+        }),
+    ], ignore_index=True)
+
+
+def _month_cycle(anchor: pd.DatetimeIndex, year: int, step: int) -> np.ndarray:
+    """Due dates, shape ``(items, 12 // step)``, on the anchor's day and month phase."""
+    month_starts = pd.date_range(pd.Timestamp(year, 1, 1), periods=12, freq=pd.offsets.MonthBegin())
+    days_in_month = month_starts.days_in_month.to_numpy()
+    months = ((anchor.month.to_numpy() - 1) % step)[:, None] + step * np.arange(12 // step)[None, :]
+    day = np.minimum(anchor.day.to_numpy()[:, None], days_in_month[months])
+    return month_starts.to_numpy()[months] + (day - 1).astype('timedelta64[D]')
+
+
+def due_dates(items: pd.DataFrame, year: int) -> pd.DataFrame:
+    """
+    Every bill of ``year`` from recurring items, vectorized per frequency.
+
+    Items bill on the day (and, for items billed every few months, the month
+    phase) of their ``'Date'``, or from January 1st when it is missing; days
+    past a month's end fall on its last day. Weekly and bi-weekly items bill
+    every seven or fourteen days from that date, semi-monthly items on the
+    15th and the last day of the month.
+
+    Args:
+        items: Frame like ``recurring_items`` returns.
+        year: Calendar year.
+
+    Returns:
+        One row per bill with ``BILL_COLUMNS``, sorted by due date.
+
+    Raises:
+        ValueError: An item's frequency is not in ``PAYMENTS_PER_YEAR``.
+    """
+    _check_frequencies(items['Frequency'], items['Name'], 'bill')
+    start, end = pd.Timestamp(year, 1, 1), pd.Timestamp(year, 12, 31)
+    anchors = pd.DatetimeIndex(pd.to_datetime(items['Date'], errors='coerce')).fillna(start)
+    frequency = items['Frequency'].to_numpy()
+    parts = []
+    for freq in PAYMENTS_PER_YEAR:
+        rows = np.flatnonzero(frequency == freq)
+        if not len(rows):
+            continue
+        anchor = anchors[rows]
+        if freq in _MONTH_STEPS:
+            due = _month_cycle(anchor, year, _MONTH_STEPS[freq])
+        elif freq in _DAY_STEPS:
+            step = _DAY_STEPS[freq]
+            first = start.to_datetime64() + ((anchor - start).days.to_numpy() % step).astype('timedelta64[D]')
+            due = first[:, None] + (step * np.arange(366 // step + 1)).astype('timedelta64[D]')[None, :]
+        else:
+            semi = pd.date_range(start, end, freq=pd.offsets.SemiMonthEnd()).to_numpy()
+            due = np.broadcast_to(semi, (len(rows), len(semi)))
+        item = np.repeat(rows, due.shape[1])
+        parts.append((due.ravel(), item))
+
+    if not parts:
+        return pd.DataFrame(columns=BILL_COLUMNS)
+    due = np.concatenate([p[0] for p in parts])
+    item = np.concatenate([p[1] for p in parts])
+    keep = due <= end.to_datetime64()
+    due, item = due[keep], item[keep]
+    bills = pd.DataFrame({
+        'Due Date': due,
+        'Name': items['Name'].to_numpy()[item],
+        'Category': items['Category'].to_numpy()[item],
+        'Amount': items['Amount'].to_numpy(dtype=float)[item],
+        'Frequency': frequency[item],
+    })
+    return bills.sort_values('Due Date', kind='stable', ignore_index=True)
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Allocation
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def allocate(schedule: pd.DataFrame, bills: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Assign every bill to the paycheck that must cover it: the last payday on
+    or before its due date. Bills due before the year's first payday fall to
+    the last one, which stands in for the previous year's final paycheck.
+
+    Args:
+        schedule: Frame from ``paycheck_schedule``.
+        bills: Frame from ``due_dates``.
+
+    Returns:
+        ``(coverage, bills)``: per payday the household's net pay, the number
+        and total of the bills it covers and what is left over
+        (``COVERAGE_COLUMNS``); and ``bills`` with a ``'Pay Date'`` column.
+    """
+    paydays = np.sort(schedule['Pay Date'].unique())
+    if not len(paydays):
+        return pd.DataFrame(columns=COVERAGE_COLUMNS), bills.assign(**{'Pay Date': pd.NaT})
+
+    pos = np.searchsorted(paydays, bills['Due Date'].to_numpy(), side='right') - 1
+    bills = bills.assign(**{'Pay Date': paydays[pos % len(paydays)]})
+
+    coverage = pd.DataFrame({'Pay Date': paydays})
+    coverage['Net'] = schedule.groupby('Pay Date')['Net'].sum().reindex(paydays).to_numpy()
+    by_payday = bills.groupby('Pay Date')['Amount']
+    coverage['Bills'] = by_payday.size().reindex(paydays, fill_value=0).to_numpy()
+    coverage['Due'] = by_payday.sum().reindex(paydays, fill_value=0.0).to_numpy()
+    coverage['Left Over'] = coverage['Net'] - coverage['Due']
+    return coverage, bills
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True, slots=True)
+class AccountType:
+    """
+    Tax treatment and growth of one kind of account.
+
+    Attributes:
+        pre_tax: Contributions come out of pay before income tax.
+        annual_limit: Cap on the employee's yearly contribution, if any.
+        tax_drag: Yearly return lost to taxes on dividends and realized gains.
+        fixed_return: Return earned instead of the market return (cash).
+    """
+
+    pre_tax: bool
+    annual_limit: Optional[float] = None
+    tax_drag: float = 0.0
+    fixed_return: Optional[float] = None
+
+
+# Account kinds offered on the Projections page; limits are the 2025 IRS limits for savers under 50.
+ACCOUNT_TYPES: Dict[str, AccountType] = {
+    '401(k)': AccountType(pre_tax=True, annual_limit=23_500),
+    'Roth IRA': AccountType(pre_tax=False, annual_limit=7_000),
+    'HSA': AccountType(pre_tax=True, annual_limit=4_300),
+    'Brokerage': AccountType(pre_tax=False, tax_drag=0.005),
+    'Cash': AccountType(pre_tax=False, fixed_return=0.04),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Account:
+    """
+    One savings or investment account and what goes into it each year.
+
+    Attributes:
+        name: Label, e.g. ``'Work 401(k)'``.
+        kind: Key of ``ACCOUNT_TYPES``.
+        balance: Balance today.
+        contribution: Employee contribution in the first year.
+        contribution_growth: Yearly growth of the contribution, e.g. ``0.03``.
+        match_rate: Employer match per dollar contributed, e.g. ``0.5``.
+        match_cap: Employer match limit as a fraction of salary, e.g. ``0.06``.
+    """
+
+    name: str
+    kind: str
+    balance: float = 0.0
+    contribution: float = 0.0
+    contribution_growth: float = 0.0
+    match_rate: float = 0.0
+    match_cap: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class Projection:
+    """
+    Year-end balances of every account under every return assumption.
+
+    Arrays are read-only. Year 0 is today.
+
+    Attributes:
+        accounts: Account names, in axis order.
+        returns: Expected yearly market returns, in axis order.
+        years: ``0 .. horizon``.
+        balance: Shape ``(account, return, year)``.
+        contributions: Employee contributions per year, shape ``(account, year)``.
+        match: Employer contributions per year, shape ``(account, year)``.
+    """
+
+    accounts: Tuple[str, ...]
+    returns: np.ndarray
+    years: np.ndarray
+    balance: np.ndarray
+    contributions: np.ndarray
+    match: np.ndarray
+
+    def net_worth(self) -> np.ndarray:
+        """Total of all accounts, shape ``(return, year)``."""
+        return self.balance.sum(axis=0)
+
+    def frame(self, return_index: int) -> pd.DataFrame:
+        """Balances at one return assumption as a long frame of ``'Year'``, ``'Account'`` and ``'Balance'``."""
+        balance = self.balance[:, return_index, :]
+        return pd.DataFrame({
+            'Year': np.tile(self.years, len(self.accounts)),
+            'Account': np.repeat(self.accounts, len(self.years)),
+            'Balance': balance.ravel(),
+        })
+
+
+def allocate_surplus(
+        accounts: Sequence[Account],
+        annual_surplus: float,
+        tax_rate: float = 0.0,
+        name: str = 'Remaining Surplus',
+) -> Tuple[Account, ...]:
+    """
+    ``accounts`` plus a brokerage account receiving what is left of the annual
+    surplus after the accounts' own first-year contributions.
+
+    Args:
+        accounts: Accounts funded from the surplus.
+        annual_surplus: After-tax income less expenses.
+        tax_rate: Effective tax rate; a pre-tax contribution costs the surplus
+            only its after-tax amount.
+        name: Name of the added account.
+    """
+    used = sum(
+        a.contribution * (1 - tax_rate if ACCOUNT_TYPES[a.kind].pre_tax else 1)
+        for a in accounts
+    )
+    remaining = max(annual_surplus - used, 0.0)
+    return tuple(accounts) + (Account(name=name, kind='Brokerage', contribution=remaining),)
+
+
+def _project(
+        accounts: Tuple[Account, ...],
+        returns: np.ndarray,
+        horizon: int,
+        salary: float,
+        salary_growth: float,
+        inflation: float,
+) -> Projection:
+    years = np.arange(horizon + 1)
+    t = years[1:] - 1
+    kinds = [ACCOUNT_TYPES[a.kind] for a in accounts]
+
+    # Contributions per account and year, paid at each year end.
+    contribution = np.array([a.contribution for a in accounts], dtype=float)[:, None]
+    growth = np.array([a.contribution_growth for a in accounts], dtype=float)[:, None]
+    limit = np.array([k.annual_limit if k.annual_limit is not None else np.inf for k in kinds])[:, None]
+    employee = np.minimum(contribution * (1 + growth) ** t, limit)
+    match_rate = np.array([a.match_rate for a in accounts], dtype=float)[:, None]
+    match_cap = np.array([a.match_cap for a in accounts], dtype=float)[:, None]
+    match = np.minimum(match_rate * employee, match_cap * salary * (1 + salary_growth) ** t)
+    paid = employee + match
+
+    # Yearly return per account and assumption: the market return less tax drag, or cash's fixed rate.
+    drag = np.array([k.tax_drag for k in kinds])[:, None]
+    fixed = np.array([k.fixed_return if k.fixed_return is not None else np.nan for k in kinds])[:, None]
+    rate = np.where(np.isnan(fixed), returns[None, :] - drag, fixed)
+
+    # factor[a, r, k] = (1 + rate) ** k. A contribution paid at the end of year s
+    # has grown for T - s years by year T, so every balance is one contraction over s.
+    factor = (1 + rate)[..., None] ** years
+    lag = years[:, None] - years[None, 1:]
+    grown = np.where(lag >= 0, factor[..., np.clip(lag, 0, None)], 0.0)
+    opening = np.array([a.balance for a in accounts], dtype=float)[:, None, None]
+    balance = opening * factor + np.einsum('arts,as->art', grown, paid)
+
+    if inflation:
+        balance = balance / (1 + inflation) ** years
+
+    zero = np.zeros((len(accounts), 1))
+    projection = Projection(
+        accounts=tuple(a.name for a in accounts),
+        returns=returns,
+        years=years,
+        balance=balance,
+        contributions=np.hstack([zero, employee]),
+        match=np.hstack([zero, match]),
+    )
+    for array in (projection.returns, projection.balance, projection.contributions, projection.match):
+        array.flags.writeable = False
+    return projection
+
+
+# Projections kept per parameter set, most recently used last.
+_CACHE_SIZE = 64
+_cache: 'OrderedDict[tuple, Projection]' = OrderedDict()
+_lock = threading.Lock()
+
+
+def project(
+        accounts: Sequence[Account],
+        returns: Sequence[float],
+        horizon: int,
+        salary: float = 0.0,
+        salary_growth: float = 0.0,
+        inflation: float = 0.0,
+) -> Projection:
+    """
+    Compounded balances of every account under every return assumption, in
+    one broadcasted evaluation.
+
+    Contributions grow by their own rate until the account type's yearly limit
+    and are paid at each year end; the employer matches ``match_rate`` of them
+    up to ``match_cap`` of a salary growing by ``salary_growth``. Results are
+    memoized per parameter set, so moving a slider back to a value seen before
+    costs a dictionary lookup.
+
+    Args:
+        accounts: Accounts to project.
+        returns: Expected yearly market returns, e.g. ``np.linspace(0, 0.1, 41)``.
+        horizon: Years to project.
+        salary: Current salary, for the employer match cap.
+        salary_growth: Yearly salary growth.
+        inflation: Yearly inflation; balances are in today's dollars when non-zero.
+
+    Returns:
+        The ``Projection``; shared between callers, so treat it as read-only.
+
+    Raises:
+        KeyError: An account's kind is not in ``ACCOUNT_TYPES``.
+    """
+    accounts = tuple(accounts)
+    returns = np.asarray(returns, dtype=float)
+    key = (accounts, returns.tobytes(), int(horizon), float(salary), float(salary_growth), float(inflation))
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+
+    projection = _project(accounts, returns.copy(), int(horizon), salary, salary_growth, inflation)
+    with _lock:
+        _cache[key] = projection
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return projection
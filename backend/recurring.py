@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set
+
+import numpy as np
+import pandas as pd
+
+from app.config import FREQUENCIES
+from backend.calculations import PAYMENTS_PER_YEAR
+from backend.schemas import FREQUENCY_ALIASES
+
+if TYPE_CHECKING:
+    from backend.storage import TransactionStore
+
+# Nominal days between charges for each frequency a subscription can be saved
+# with, under its canonical label. 'Semester' is left out: it cannot be told
+# apart from 'Semi-Annually' by interval alone.
+FREQUENCY_DAYS: Dict[str, float] = {
+    freq: 365.25 / PAYMENTS_PER_YEAR[freq]
+    for freq in (FREQUENCY_ALIASES[label.lower()] for label in FREQUENCIES)
+    if freq != 'Semester'
+}
+
+# Detection thresholds.
+MIN_CHARGES = 3
+MAX_INTERVAL_CV = 0.35  # std / mean of days between charges
+MAX_AMOUNT_CV = 0.25  # std / mean of charge amounts
+MAX_PERIOD_ERROR = 0.2  # |log(median interval / nominal interval)|
+
+_STATS_COLUMNS = [
+    'Charges',
+    'First Date',
+    'Last Date',
+    'Median Interval',
+    'Interval CV',
+    'Median Amount',
+    'Amount CV',
+    'Description',
+    'Account',
+]
+
+
+def normalize_merchant(descriptions: pd.Series) -> pd.Series:
+    """
+    Reduce raw statement descriptions to a stable merchant key.
+
+    Drops processor prefixes (``'SQ *'``, ``'TST*'``, ``'POS '``), store and
+    reference numbers, domains and punctuation, e.g.
+    ``'SPOTIFY USA 8834#12'`` and ``'Spotify USA'`` both become ``'spotify usa'``.
+    """
+    return (
+        descriptions.fillna('').astype(str).str.lower()
+        .str.replace(r'^(?:sq|tst|pos|ach|dd|pp|paypal)\s*\*?\s*', '', regex=True)
+        .str.replace(r'\.(?:com|net|org|io)\b', '', regex=True)
+        .str.replace(r'[#*]\S*|\d+', ' ', regex=True)
+        .str.replace(r'[^a-z& ]+', ' ', regex=True)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip()
+    )
+
+
+def _nearest_frequency(median_interval: pd.Series) -> pd.DataFrame:
+    """Closest nominal frequency per merchant and its relative (log) error."""
+    labels = np.array(list(FREQUENCY_DAYS))
+    nominal = np.array(list(FREQUENCY_DAYS.values()))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        error = np.abs(np.log(median_interval.to_numpy(dtype=float)[:, None] / nominal[None, :]))
+    error = np.where(np.isnan(error), np.inf, error)
+    best = error.argmin(axis=1) if len(error) else np.empty(0, dtype=int)
+    return pd.DataFrame(
+        {
+            'Frequency': labels[best] if len(best) else np.empty(0, dtype=object),
+            'Period Error': error[np.arange(len(best)), best] if len(best) else np.empty(0),
+        },
+        index=median_interval.index,
+    )
+
+
+def merchant_stats(charges: pd.DataFrame) -> pd.DataFrame:
+    """
+    Interval and amount statistics per merchant, computed with grouped vector ops.
+
+    Args:
+        charges: Frame with ``'Merchant'``, ``'Date'``, ``'Amount'`` (positive),
+            ``'Description'`` and ``'Account'``.
+
+    Returns:
+        One row per merchant, indexed by ``'Merchant'``.
+    """
+    if charges.empty:
+        return pd.DataFrame(columns=_STATS_COLUMNS, index=pd.Index([], name='Merchant'))
+
+    charges = charges.sort_values(['Merchant', 'Date'], kind='stable')
+    same = charges['Merchant'].eq(charges['Merchant'].shift())
+    gaps = charges['Date'].diff().dt.days.where(same)
+
+    by_merchant = charges.assign(Gap=gaps).groupby('Merchant', sort=False)
+    stats = by_merchant.agg(
+        **{
+            'Charges': ('Amount', 'size'),
+            'First Date': ('Date', 'min'),
+            'Last Date': ('Date', 'max'),
+            'Median Interval': ('Gap', 'median'),
+            'Interval Mean': ('Gap', 'mean'),
+            'Interval Std': ('Gap', 'std'),
+            'Median Amount': ('Amount', 'median'),
+            'Amount Mean': ('Amount', 'mean'),
+            'Amount Std': ('Amount', 'std'),
+            'Description': ('Description', 'last'),
+            'Account': ('Account', 'last'),
+        }
+    )
+    stats['Interval CV'] = (stats.pop('Interval Std') / stats.pop('Interval Mean')).fillna(np.inf)
+    stats['Amount CV'] = (stats.pop('Amount Std') / stats.pop('Amount Mean')).fillna(0.0)
+    return stats[_STATS_COLUMNS]
+
+
+class RecurringDetector:
+    """
+    Incremental recurring-charge detector over a ``TransactionStore``.
+
+    Keeps the outflows of every month partition and per-merchant statistics.
+    ``sync`` re-reads only the partitions whose files changed since the last
+    call (an import appends to one or two months) and recomputes only the
+    merchants whose charges changed, so rewritten or deleted rows drop out as
+    well. Safe to share between sessions.
+    """
+
+    def __init__(self) -> None:
+        self._charges = pd.DataFrame(columns=['Partition', 'Merchant', 'Date', 'Amount', 'Description', 'Account'])
+        self._versions: Dict[str, List[int]] = {}
+        self.stats = merchant_stats(self._charges)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _outflows(partition: str, transactions: pd.DataFrame) -> pd.DataFrame:
+        # Outflows only; statements record charges as negative amounts.
+        outflows = transactions[transactions['Amount'] < 0]
+        charges = pd.DataFrame({
+            'Partition': partition,
+            'Merchant': normalize_merchant(outflows['Description']),
+            'Date': pd.to_datetime(outflows['Date']),
+            'Amount': -outflows['Amount'].astype(float),
+            'Description': outflows['Description'],
+            'Account': outflows['Account'] if 'Account' in outflows else '',
+        })
+        return charges[charges['Merchant'].ne('')]
+
+    def _refresh(self, affected: Set[str]) -> pd.Index:
+        affected = pd.Index(sorted(affected), name='Merchant')
+        refreshed = merchant_stats(self._charges[self._charges['Merchant'].isin(affected)])
+        kept = self.stats.drop(index=affected, errors='ignore')
+        self.stats = pd.concat([kept, refreshed]) if len(kept) else refreshed
+        return affected
+
+    def update(self, partition: str, transactions: pd.DataFrame) -> pd.Index:
+        """
+        Replace the charges of one partition and refresh the merchants involved.
+
+        Args:
+            partition: Partition key, e.g. ``'2025-01'``.
+            transactions: All rows of the partition, laid out like
+                ``schemas.TRANSACTIONS``; empty to drop the partition.
+
+        Returns:
+            Merchants whose statistics changed.
+        """
+        with self._lock:
+            return self._update({partition: transactions})
+
+    def _update(self, partitions: Dict[str, pd.DataFrame]) -> pd.Index:
+        in_changed = self._charges['Partition'].isin(list(partitions))
+        affected = set(self._charges.loc[in_changed, 'Merchant'])
+        new = [self._outflows(partition, rows) for partition, rows in partitions.items() if len(rows)]
+        new = [charges for charges in new if len(charges)]
+        for charges in new:
+            affected.update(charges['Merchant'])
+        kept = self._charges[~in_changed]
+        frames = [kept, *new] if len(kept) else new
+        self._charges = pd.concat(frames, ignore_index=True) if frames else kept
+        return self._refresh(affected)
+
+    def sync(self, store: TransactionStore) -> pd.Index:
+        """
+        Bring the detector up to date with ``store``, reading only the month
+        partitions added, changed or deleted since the last call.
+
+        Returns:
+            Merchants whose statistics changed.
+        """
+        with self._lock:
+            current = store.ledger_version()
+            changed = [month for month, version in current.items() if self._versions.get(month) != version]
+            removed = [month for month in self._versions if month not in current]
+            if not changed and not removed:
+                return pd.Index([], name='Merchant')
+            partitions = {month: store.load([month]) for month in changed}
+            partitions.update({month: pd.DataFrame() for month in removed})
+            affected = self._update(partitions)
+            self._versions = current
+            return affected
+
+    def recurring(self) -> pd.DataFrame:
+        """
+        Merchants whose charges are regular in both timing and amount.
+
+        Returns:
+            ``stats`` rows that pass the thresholds, with ``'Frequency'`` and
+            ``'Confidence'`` columns, most confident first.
+        """
+        with self._lock:
+            stats = self.stats
+        stats = stats.join(_nearest_frequency(stats['Median Interval']))
+        regular = stats[
+            (stats['Charges'] >= MIN_CHARGES)
+            & (stats['Interval CV'] <= MAX_INTERVAL_CV)
+            & (stats['Amount CV'] <= MAX_AMOUNT_CV)
+            & (stats['Period Error'] <= MAX_PERIOD_ERROR)
+        ]
+        confidence = 1 - (
+            regular['Interval CV'] / MAX_INTERVAL_CV
+            + regular['Amount CV'] / MAX_AMOUNT_CV
+            + regular['Period Error'] / MAX_PERIOD_ERROR
+        ) / 3
+        return regular.assign(Confidence=confidence.clip(0, 1)).sort_values('Confidence', ascending=False)
+
+    def propose(self, existing_names: Iterable[str] = ()) -> pd.DataFrame:
+        """
+        Proposed subscription rows for recurring merchants not already tracked.
+
+        Args:
+            existing_names: ``'Subscription/ Recurring Expense'`` values already
+                in ``subscriptions.csv``.
+
+        Returns:
+            Frame with the subscriptions columns plus ``'Confidence'``.
+        """
+        known = set(normalize_merchant(pd.Series(list(existing_names), dtype=object)))
+        found = self.recurring()
+        merchants = found.index.to_series()
+        tracked = merchants.map(lambda m: any(m in k or k in m for k in known if k))
+        found = found[~tracked.to_numpy(dtype=bool)] if len(found) else found
+
+        return pd.DataFrame({
+            'Date': found['Last Date'],
+            'Subscription/ Recurring Expense': found.index.str.title(),
+            'Amount': found['Median Amount'].round(2),
+            'Frequency': found['Frequency'],
+            'Subscribed': True,
+            'Card': found['Account'],
+            'Notes': (
+                'Detected from ' + found['Charges'].astype(str) + ' charges, e.g. "'
+                + found['Description'].astype(str) + '"'
+            ),
+            'Confidence': found['Confidence'].round(2),
+        }).reset_index(drop=True)
@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Errors
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+class SchemaError(ValueError):
+    """
+    Raised immediately when a table cannot match its schema at all
+    (missing required columns or a column of the wrong type).
+    """
+
+
+class RowValidationError(ValueError):
+    """
+    Raised once per table with every bad cell found during normalization.
+
+    Attributes:
+        issues: DataFrame with one row per bad cell and the columns
+            ``'Row'``, ``'Column'``, ``'Value'`` and ``'Reason'``.
+    """
+
+    def __init__(self, table: str, issues: pd.DataFrame) -> None:
+        self.table = table
+        self.issues = issues
+        rows = issues['Row'].nunique()
+        super().__init__(
+            f"{len(issues)} invalid value(s) in {rows} row(s) of '{table}':\n"
+            f'{issues.to_string(index=False)}'
+        )
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Vectorized casts
+# ────────────────────────────────────────────────────────────────────────────────
+
+# Columns written by ``to_csv`` without ``index=False`` ('Unnamed: 0', 'Unnamed: 0.1', ...).
+_INDEX_ARTIFACT = re.compile(r'^Unnamed: \d+(\.\d+)?$')
+
+# Excel stores dates as days since 1899-12-30.
+_EXCEL_EPOCH = '1899-12-30'
+
+_TRUE_VALUES = ('yes', 'y', 'true', 't', '1', '1.0')
+_FALSE_VALUES = ('no', 'n', 'false', 'f', '0', '0.0', '')
+
+# Lower-cased label or alias -> canonical frequency label. Canonical labels are the
+# ``PERIOD_MAP`` keys where one exists, otherwise the ``app.config.FREQUENCIES`` label.
+FREQUENCY_ALIASES: Dict[str, str] = {
+    'weekly': 'Weekly',
+    'week': 'Weekly',
+    'bi-weekly': 'Bi-Weekly',
+    'biweekly': 'Bi-Weekly',
+    'semi-monthly': 'Semi-Monthly',
+    'semimonthly': 'Semi-Monthly',
+    'monthly': 'Monthly',
+    'month': 'Monthly',
+    'semester': 'Semester',
+    'quarterly': 'Quarterly',
+    'quarter': 'Quarterly',
+    'semi-annually': 'Semi-Annually',
+    'semiannually': 'Semi-Annually',
+    'semi-annual': 'Semi-Annually',
+    'annual': 'Annual',
+    'annually': 'Annual',
+    'yearly': 'Annual',
+    'year': 'Annual',
+}
+
+
+def _blank(s: pd.Series) -> pd.Series:
+    """Mask of values that are missing or empty strings."""
+    return s.isna() | s.astype(str).str.strip().isin(['', 'nan', 'NaN', 'None'])
+
+
+def to_money(s: pd.Series) -> pd.Series:
+    """
+    Parse accounting-formatted amounts (``' $1,250.00 '``, ``'$-'``, ``'(5.00)'``).
+
+    Args:
+        s: Raw column.
+
+    Returns:
+        float64 Series; unparseable values become NaN.
+    """
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        return s.astype('float64')
+
+    text = s.astype(str).str.strip()
+    negative = text.str.startswith('(') & text.str.endswith(')')
+    cleaned = text.str.replace(r'[\s$,()]', '', regex=True)
+    # Accounting format writes zero as a lone dash.
+    cleaned = cleaned.mask(cleaned == '-', '0')
+    out = pd.to_numeric(cleaned, errors='coerce').astype('float64')
+    return out.mask(negative, -out)
+
+
+def to_float(s: pd.Series) -> pd.Series:
+    """Vectorized float cast; unparseable values become NaN."""
+    return pd.to_numeric(s, errors='coerce').astype('float64')
+
+
+def to_int(s: pd.Series) -> pd.Series:
+    """Vectorized nullable-integer cast; non-integral values become NA."""
+    num = pd.to_numeric(s, errors='coerce')
+    return num.where(num.round() == num).astype('Int64')
+
+
+def to_bool(s: pd.Series) -> pd.Series:
+    """
+    Cast yes/no style flags to booleans.
+
+    Returns:
+        Nullable boolean Series; unrecognised values become NA.
+    """
+    if pd.api.types.is_bool_dtype(s):
+        return s.astype('boolean')
+
+    text = s.astype(str).str.strip().str.lower()
+    out = pd.Series(pd.NA, index=s.index, dtype='boolean')
+    out[text.isin(_TRUE_VALUES)] = True
+    out[text.isin(_FALSE_VALUES)] = False
+    return out
+
+
+def to_date(s: pd.Series) -> pd.Series:
+    """
+    Parse ISO/locale date strings and Excel serial numbers in one pass.
+
+    Returns:
+        datetime64 Series; unparseable values become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+
+    serial = pd.to_numeric(s, errors='coerce')
+    parsed = pd.to_datetime(
+        s.where(serial.isna()).astype(object),
+        errors='coerce',
+        format='mixed',
+    )
+    from_serial = pd.to_datetime(serial, unit='D', origin=_EXCEL_EPOCH, errors='coerce')
+    return parsed.fillna(from_serial)
+
+
+def to_frequency(s: pd.Series) -> pd.Series:
+    """Map frequency labels and their aliases onto canonical labels."""
+    return s.astype(str).str.strip().str.lower().map(FREQUENCY_ALIASES)
+
+
+def to_str(s: pd.Series) -> pd.Series:
+    """Cast to stripped strings, keeping missing values as NaN."""
+    return s.astype(str).str.strip().where(~_blank(s))
+
+
+def to_rate(s: pd.Series) -> pd.Series:
+    """
+    Cast rates stored as fractions (``0.21`` for 21%).
+
+    Values are taken as given, never guessed to be percentages; views that
+    show or edit percentages convert once on the way in and out.
+    """
+    return to_float(s)
+
+
+CASTS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    'str': to_str,
+    'int': to_int,
+    'float': to_float,
+    'money': to_money,
+    'rate': to_rate,
+    'bool': to_bool,
+    'date': to_date,
+    'frequency': to_frequency,
+}
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Schemas
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class TableSchema:
+    """
+    Column layout of one CSV-backed table.
+
+    Attributes:
+        name: Table name used in error messages.
+        columns: Column name -> cast kind (a key of ``CASTS``), in output order.
+        required: Columns that must be present in the file.
+        defaults: Fill values for optional columns and blank cells.
+        renames: Legacy column name -> current column name.
+        legacy_file: File read instead when the table's own file does not exist.
+    """
+
+    name: str
+    columns: Dict[str, str]
+    required: Tuple[str, ...]
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    renames: Dict[str, str] = field(default_factory=dict)
+    legacy_file: Optional[str] = None
+
+    def empty(self) -> pd.DataFrame:
+        """Return a zero-row DataFrame with this schema's columns."""
+        return normalize(pd.DataFrame(columns=list(self.columns)), self)
+
+
+BUDGET = TableSchema(
+    name='budget_data',
+    columns={
+        'ID': 'int',
+        'Date': 'date',
+        'Super Category': 'str',
+        'Category': 'str',
+        'Name': 'str',
+        'Amount': 'money',
+        'Frequency': 'frequency',
+        'Tax Deductible': 'bool',
+        'Notes': 'str',
+        'Status': 'str',
+    },
+    required=('Category', 'Name', 'Amount', 'Frequency'),
+    defaults={
+        'Amount': 0.0,
+        'Frequency': 'Monthly',
+        'Tax Deductible': False,
+        'Notes': '',
+        'Status': 'Active',
+    },
+    renames={
+        'Expense Category': 'Category',
+        'Expense Name': 'Name',
+    },
+    legacy_file='budget.csv',
+)
+
+SUBSCRIPTIONS = TableSchema(
+    name='subscriptions',
+    columns={
+        'ID': 'int',
+        'Date': 'date',
+        'Subscription/ Recurring Expense': 'str',
+        'Amount': 'money',
+        'Frequency': 'frequency',
+        'Subscribed': 'bool',
+        'Card': 'str',
+        'Notes': 'str',
+    },
+    required=('Subscription/ Recurring Expense', 'Amount', 'Frequency'),
+    defaults={
+        'Amount': 0.0,
+        'Subscribed': True,
+        'Card': '',
+        'Notes': '',
+    },
+)
+
+PLANNED_PURCHASES = TableSchema(
+    name='planned_purchases',
+    columns={
+        'Purchase': 'str',
+        'Date': 'date',
+        'Cost': 'money',
+        'Planned Purchase': 'bool',
+        'Pay from Savings or Amortize': 'str',
+        'Amortization Method': 'frequency',
+        'Paid Off': 'str',
+        'Notes': 'str',
+    },
+    required=('Purchase', 'Cost'),
+    defaults={
+        'Cost': 0.0,
+        'Planned Purchase': True,
+        'Amortization Method': 'Annual',
+        'Notes': '',
+    },
+)
+
+INCOME = TableSchema(
+    name='income',
+    columns={
+        'ID': 'int',
+        'Job Title': 'str',
+        'Salary': 'money',
+        'Bonus': 'money',
+        'Frequency': 'frequency',
+        'Total Compensation': 'money',
+        'Salary Effective Tax Rate': 'rate',
+        'Total Compensation Effective Tax Rate': 'rate',
+        'After Tax Salary': 'money',
+        'After Tax Bonus': 'money',
+        'After Tax Total Compensation': 'money',
+    },
+    required=('Job Title', 'Salary'),
+    defaults={
+        'Bonus': 0.0,
+        'Frequency': 'Annual',
+        'Salary Effective Tax Rate': 0.0,
+        'Total Compensation Effective Tax Rate': 0.0,
+    },
+)
+
+DEBTS = TableSchema(
+    name='debts',
+    columns={
+        'ID': 'int',
+        'Name': 'str',
+        'Balance': 'money',
+        'APR': 'rate',
+        'Minimum Payment': 'money',
+        'Priority': 'int',
+        'Notes': 'str',
+    },
+    required=('Name', 'Balance'),
+    defaults={
+        'APR': 0.0,
+        'Minimum Payment': 0.0,
+        'Notes': '',
+    },
+)
+
+TRANSACTIONS = TableSchema(
+    name='transactions',
+    columns={
+        'ID': 'int',
+        'Date': 'date',
+        'Description': 'str',
+        'Amount': 'money',
+        'Account': 'str',
+        'Category': 'str',
+        'Source': 'str',
+        'Hash': 'int',
+    },
+    required=('Date', 'Description', 'Amount'),
+    defaults={
+        'Account': '',
+        'Category': '',
+        'Source': '',
+    },
+)
+
+CATEGORY_RULES = TableSchema(
+    name='category_rules',
+    columns={
+        'Category': 'str',
+        'Pattern': 'str',
+        'Kind': 'str',
+        'Min Amount': 'money',
+        'Max Amount': 'money',
+        'Source': 'str',
+    },
+    required=('Category',),
+    defaults={
+        'Pattern': '',
+        'Kind': 'substring',
+        'Source': 'user',
+    },
+)
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Normalization
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def drop_index_artifacts(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop ``'Unnamed: N'`` columns left behind by saving with the index."""
+    artifacts = [col for col in df.columns if _INDEX_ARTIFACT.match(str(col))]
+    return df.drop(columns=artifacts)
+
+
+def normalize(
+        df: pd.DataFrame,
+        schema: TableSchema,
+        *,
+        errors: str = 'raise',
+) -> pd.DataFrame:
+    """
+    Validate ``df`` against ``schema`` and return a normalized copy.
+
+    Steps: drop index artifacts, migrate legacy column names, check required
+    columns, add optional columns, cast every column with one vectorized call,
+    fill defaults and assign missing IDs.
+
+    Args:
+        df: Raw table, typically straight from ``pd.read_csv``.
+        schema: Target layout.
+        errors: ``'raise'`` to raise ``RowValidationError`` listing every bad
+            cell, or ``'coerce'`` to leave bad cells as missing values.
+
+    Raises:
+        SchemaError: A required column is missing, or a column contains no
+            value at all that can be cast to its type.
+        RowValidationError: Some cells could not be cast (``errors='raise'``).
+
+    Returns:
+        DataFrame with exactly the schema's columns, in schema order, followed
+        by any extra columns found in the file.
+    """
+    if errors not in ('raise', 'coerce'):
+        raise ValueError(f"`errors` must be 'raise' or 'coerce', got {errors!r}")
+
+    out = drop_index_artifacts(df).rename(columns=schema.renames)
+    out.columns = [str(col).strip() for col in out.columns]
+
+    missing = [col for col in schema.required if col not in out.columns]
+    if missing:
+        raise SchemaError(f"'{schema.name}' is missing required column(s): {missing}")
+
+    n_rows = len(out)
+    bad_masks: Dict[str, pd.Series] = {}
+
+    for col, kind in schema.columns.items():
+        if col not in out.columns:
+            out[col] = pd.Series(np.nan, index=out.index, dtype='object')
+            raw_blank = pd.Series(True, index=out.index)
+        else:
+            raw_blank = _blank(out[col])
+
+        cast = CASTS[kind](out[col])
+        bad = cast.isna() & ~raw_blank
+
+        # Fail fast: a populated column with nothing castable has the wrong type.
+        if n_rows and bad.any() and bad.sum() == (~raw_blank).sum() and kind != 'str':
+            sample = out.loc[bad, col].head(3).tolist()
+            raise SchemaError(
+                f"Column '{col}' of '{schema.name}' is not of type '{kind}' "
+                f'(sample values: {sample})'
+            )
+
+        if bad.any():
+            bad_masks[col] = bad
+
+        if col in schema.defaults:
+            cast = cast.fillna(schema.defaults[col])
+            if kind == 'bool':
+                cast = cast.astype(bool)
+        out[col] = cast
+
+    if bad_masks and errors == 'raise':
+        issues = pd.concat(
+            [
+                pd.DataFrame({
+                    'Row': mask.index[mask],
+                    'Column': col,
+                    'Value': df.loc[mask.index[mask], _source_column(df, schema, col)].values,
+                    'Reason': f"not a valid '{schema.columns[col]}'",
+                })
+                for col, mask in bad_masks.items()
+            ],
+            ignore_index=True,
+        ).sort_values(['Row', 'Column'], kind='stable')
+        raise RowValidationError(schema.name, issues.reset_index(drop=True))
+
+    if 'ID' in schema.columns:
+        out['ID'] = _fill_ids(out['ID'])
+
+    extra = [col for col in out.columns if col not in schema.columns]
+    return out[list(schema.columns) + extra].reset_index(drop=True)
+
+
+def _source_column(df: pd.DataFrame, schema: TableSchema, col: str) -> str:
+    """Name of ``col`` in the raw frame, before legacy renames."""
+    for old, new in schema.renames.items():
+        if new == col and old in df.columns:
+            return old
+    return col
+
+
+def _fill_ids(ids: pd.Series) -> pd.Series:
+    """Assign sequential IDs, continuing after the current maximum, to rows without one."""
+    missing = ids.isna()
+    if not missing.any():
+        return ids.astype('int64')
+
+    start = int(ids.max()) + 1 if ids.notna().any() else 1
+    filled = ids.copy()
+    filled[missing] = np.arange(start, start + missing.sum())
+    return filled.astype('int64')
+
+
+def source_path(path: str | Path, schema: TableSchema) -> Path:
+    """The file a read of ``path`` actually uses: its legacy file when ``path`` is missing."""
+    path = Path(path)
+    if not path.exists() and schema.legacy_file:
+        legacy = path.with_name(schema.legacy_file)
+        if legacy.exists():
+            return legacy
+    return path
+
+
+def read_table(
+        path: str | Path,
+        schema: TableSchema,
+        *,
+        errors: str = 'raise',
+        **read_kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Load a CSV with UTF-8-SIG encoding and normalize it against ``schema``.
+
+    Falls back to ``schema.legacy_file`` in the same directory when ``path``
+    does not exist.
+
+    Raises:
+        FileNotFoundError: Neither the file nor its legacy predecessor exists.
+    """
+    path = source_path(path, schema)
+
+    # Read text columns as text so IDs like card or account numbers keep their form.
+    dtype = {col: str for col, kind in schema.columns.items() if kind == 'str'}
+    dtype.update(read_kwargs.pop('dtype', {}))
+    raw = pd.read_csv(path, encoding='utf-8-sig', dtype=dtype, **read_kwargs)
+    return normalize(raw, schema, errors=errors)
+
+
+TABLES: Mapping[str, TableSchema] = {
+    'budget_data.csv': BUDGET,
+    'subscriptions.csv': SUBSCRIPTIONS,
+    'planned_purchases.csv': PLANNED_PURCHASES,
+    'income.csv': INCOME,
+    'debts.csv': DEBTS,
+    'transactions.csv': TRANSACTIONS,
+    'category_rules.csv': CATEGORY_RULES,
+}
+
+
+def schema_for(file_name: str) -> Optional[TableSchema]:
+    """Look up the schema registered for a data file name."""
+    return TABLES.get(Path(file_name).name)
+
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import bisect
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend import events, schemas
+
+# Version of a table file: (modification time in ns, size); (0, 0) when missing.
+Version = Tuple[int, int]
+
+# A document: (dataset file name, row ID).
+Key = Tuple[str, int]
+
+# Query terms shorter than this only match whole words, not prefixes.
+MIN_PREFIX_LENGTH = 2
+
+# Query words at least this long also match words one edit away (typo tolerance).
+FUZZY_MIN_LENGTH = 4
+
+# Score of a term matching a word exactly, as a prefix and one edit away.
+_EXACT, _PREFIX, _FUZZY = 1.0, 0.6, 0.4
+
+_TOKEN = re.compile(r'\w+')
+
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    """
+    How the rows of one table are indexed.
+
+    Attributes:
+        title: Column shown as the result's name; weighted above the others.
+        fields: Further columns searched.
+        category_column: Column shown as the result's category.
+        category: Category shown when there is no category column.
+    """
+
+    title: str
+    fields: Tuple[str, ...]
+    category_column: Optional[str] = None
+    category: str = ''
+
+
+# Data file name -> how it is indexed.
+SOURCES: Dict[str, Source] = {
+    'budget_data.csv': Source(title='Name', fields=('Category', 'Notes'), category_column='Category'),
+    'subscriptions.csv': Source(title='Subscription/ Recurring Expense', fields=('Notes',), category='Subscriptions'),
+}
+
+# Weight of a word found in the title column and in the other columns.
+_TITLE_WEIGHT, _FIELD_WEIGHT = 2.0, 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class Hit:
+    """
+    One search result.
+
+    Attributes:
+        dataset: Data file name, e.g. ``'budget_data.csv'``.
+        row_id: The row's ``'ID'``.
+        title: The row's name.
+        category: The row's category.
+        score: Relevance; higher is better.
+    """
+
+    dataset: str
+    row_id: int
+    title: str
+    category: str
+    score: float
+
+
+def tokenize(text: object) -> List[str]:
+    """Lower-cased words of ``text``; nothing for missing values."""
+    return _TOKEN.findall(text.casefold()) if isinstance(text, str) else []
+
+
+def _deletes(word: str) -> Set[str]:
+    """Every string one deletion away from ``word``."""
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _one_edit(a: str, b: str) -> bool:
+    """Whether ``a`` and ``b`` differ by at most one insertion, deletion, substitution or adjacent swap."""
+    if a == b:
+        return True
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > 1:
+        return False
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    if a[i + 1:] == b[i + 1:]:
+        return True
+    return a[i:i + 1] == b[i + 1:i + 2] and a[i + 1:i + 2] == b[i:i + 1] and a[i + 2:] == b[i + 2:]
+
+
+def _union(arrays: List[np.ndarray]) -> np.ndarray:
+    """Distinct values of ``arrays``, each already free of duplicates."""
+    if len(arrays) == 1:
+        return arrays[0]
+    values = np.sort(np.concatenate(arrays))
+    return values[np.concatenate(([True], values[1:] != values[:-1]))]
+
+
+class SearchIndex:
+    """
+    Inverted index over the searchable text of stored tables.
+
+    Every indexed row gets a slot; each word maps to the slots of the rows
+    containing it and its weight there. A sorted vocabulary answers prefix
+    queries by bisection, and a table of one-deletion variants (symmetric
+    delete) finds words one typo away without scanning the vocabulary. Rows
+    are added and removed individually, so a write touching a few rows only
+    re-indexes those; scoring runs over NumPy arrays of the postings, built
+    lazily per word. Safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._vocabulary: List[str] = []
+        self._variants: Dict[str, Set[str]] = {}
+        self._slots: Dict[Key, int] = {}
+        # Per slot: the row's key, title, category and indexed words; None when free.
+        self._documents: List[Optional[Tuple[Key, str, str, Tuple[str, ...]]]] = []
+        self._free: List[int] = []
+        # Dataset code per slot, -1 when free.
+        self._owners = np.full(0, -1, dtype=np.int16)
+        self._codes: Dict[str, int] = {}
+        self._rows: Dict[str, Set[int]] = {}
+        self._versions: Dict[str, Version] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # ── Updates ──────────────────────────────────────────────────────────────
+    def version(self, dataset: str) -> Optional[Version]:
+        """File version the index last saw for ``dataset``, or ``None``."""
+        return self._versions.get(dataset)
+
+    def _add_word(self, word: str) -> None:
+        bisect.insort(self._vocabulary, word)
+        if len(word) >= FUZZY_MIN_LENGTH:
+            for variant in _deletes(word):
+                self._variants.setdefault(variant, set()).add(word)
+
+    def _remove_word(self, word: str) -> None:
+        del self._postings[word]
+        del self._vocabulary[bisect.bisect_left(self._vocabulary, word)]
+        if len(word) >= FUZZY_MIN_LENGTH:
+            for variant in _deletes(word):
+                words = self._variants[variant]
+                words.discard(word)
+                if not words:
+                    del self._variants[variant]
+
+    def _allocate(self, dataset: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._documents)
+            self._documents.append(None)
+            if slot >= len(self._owners):
+                grown = np.full(max(2 * len(self._owners), 1024), -1, dtype=np.int16)
+                grown[:len(self._owners)] = self._owners
+                self._owners = grown
+        self._owners[slot] = self._codes.setdefault(dataset, len(self._codes))
+        return slot
+
+    def _add(self, dataset: str, row_id: int, title: object, category: str, fields: Iterable[object]) -> None:
+        key = (dataset, row_id)
+        weights = {word: _TITLE_WEIGHT for word in tokenize(title)}
+        for value in fields:
+            for word in tokenize(value):
+                weights.setdefault(word, _FIELD_WEIGHT)
+        slot = self._allocate(dataset)
+        for word, weight in weights.items():
+            posting = self._postings.get(word)
+            if posting is None:
+                posting = self._postings[word] = {}
+                self._add_word(word)
+            posting[slot] = weight
+            self._arrays.pop(word, None)
+        self._slots[key] = slot
+        self._documents[slot] = (key, title if isinstance(title, str) else '', category, tuple(weights))
+        self._rows.setdefault(dataset, set()).add(row_id)
+
+    def _remove(self, dataset: str, row_id: int) -> None:
+        slot = self._slots.pop((dataset, row_id), None)
+        if slot is None:
+            return
+        for word in self._documents[slot][3]:
+            posting = self._postings[word]
+            del posting[slot]
+            self._arrays.pop(word, None)
+            if not posting:
+                self._remove_word(word)
+        self._documents[slot] = None
+        self._owners[slot] = -1
+        self._free.append(slot)
+        self._rows[dataset].discard(row_id)
+
+    def _add_rows(self, dataset: str, rows: pd.DataFrame) -> None:
+        source = SOURCES[dataset]
+        fields = rows[list(source.fields)].to_numpy(dtype=object)
+        categories = rows[source.category_column] if source.category_column else [source.category] * len(rows)
+        for row_id, title, category, values in zip(rows['ID'], rows[source.title], categories, fields):
+            self._add(dataset, int(row_id), title, category if isinstance(category, str) else '', values)
+
+    def replace(self, dataset: str, table: pd.DataFrame, version: Version) -> None:
+        """Index ``table`` as the whole of ``dataset``, dropping what was indexed for it before."""
+        with self._lock:
+            for row_id in list(self._rows.get(dataset, ())):
+                self._remove(dataset, row_id)
+            self._add_rows(dataset, table)
+            self._versions[dataset] = version
+
+    def apply(self, dataset: str, table: pd.DataFrame, version: Version,
+              row_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Bring ``dataset`` up to date with ``table`` after a write.
+
+        Args:
+            dataset: Data file name; must be in ``SOURCES``.
+            table: The table as written.
+            version: The file's version after the write.
+            row_ids: IDs of the rows added, updated or deleted; ``None``
+                re-indexes the whole table.
+        """
+        if row_ids is None:
+            self.replace(dataset, table, version)
+            return
+        row_ids = set(row_ids)
+        with self._lock:
+            for row_id in row_ids:
+                self._remove(dataset, row_id)
+            self._add_rows(dataset, table[table['ID'].isin(row_ids)])
+            self._versions[dataset] = version
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+    def _matches(self, term: str) -> Dict[str, float]:
+        """Indexed words ``term`` matches -> how well."""
+        matches: Dict[str, float] = {}
+        if len(term) >= FUZZY_MIN_LENGTH:
+            # Words with one letter more, fewer, changed or swapped.
+            candidates = set(self._variants.get(term, ()))
+            for variant in _deletes(term):
+                candidates.update(self._variants.get(variant, ()))
+                if variant in self._postings:
+                    candidates.add(variant)
+            for word in candidates:
+                if _one_edit(term, word):
+                    matches[word] = _FUZZY
+        if len(term) >= MIN_PREFIX_LENGTH:
+            start = bisect.bisect_left(self._vocabulary, term)
+            end = bisect.bisect_left(self._vocabulary, term + '\U0010ffff', start)
+            for word in self._vocabulary[start:end]:
+                matches[word] = _PREFIX + (_EXACT - _PREFIX) * len(term) / len(word)
+        elif term in self._postings:
+            matches[term] = _EXACT
+        return matches
+
+    def _array(self, word: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Slots and weights of ``word``'s posting."""
+        arrays = self._arrays.get(word)
+        if arrays is None:
+            posting = self._postings[word]
+            arrays = self._arrays[word] = (
+                np.fromiter(posting.keys(), dtype=np.intp, count=len(posting)),
+                np.fromiter(posting.values(), dtype=float, count=len(posting)),
+            )
+        return arrays
+
+    def search(self, query: str, datasets: Optional[Sequence[str]] = None, limit: Optional[int] = 50) -> List[Hit]:
+        """
+        Rows matching every word of ``query``, best first.
+
+        A query word matches an indexed word that equals it, starts with it
+        (search as you type) or, for longer words, is one typo away. A row's
+        score adds up each query word's best match, weighted double in the title.
+
+        Args:
+            query: Free text.
+            datasets: Data file names to search; all indexed ones when ``None``.
+            limit: Maximum number of results; ``None`` for all.
+
+        Returns:
+            Hits ordered by score, then title.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            n_slots = len(self._documents)
+            found: Optional[np.ndarray] = None
+            scores: Optional[np.ndarray] = None
+            for term in terms:
+                matches = self._matches(term)
+                if not matches:
+                    return []
+                # Best match of this term per slot; zero where it matches nothing.
+                best = np.zeros(n_slots)
+                for word, quality in matches.items():
+                    slots, weights = self._array(word)
+                    best[slots] = np.maximum(best[slots], quality * weights)
+                if found is None:
+                    found = _union([self._array(word)[0] for word in matches])
+                    scores = best[found]
+                else:
+                    keep = best[found] > 0
+                    found = found[keep]
+                    scores = scores[keep] + best[found]
+
+            if datasets is not None:
+                codes = [self._codes[d] for d in datasets if d in self._codes]
+                keep = np.isin(self._owners[found], codes)
+                found, scores = found[keep], scores[keep]
+            if limit is not None and len(found) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                found, scores = found[top], scores[top]
+            hits = []
+            for slot, score in zip(found.tolist(), scores.tolist()):
+                (dataset, row_id), title, category, _ = self._documents[slot]
+                hits.append(Hit(dataset, row_id, title, category, score))
+
+        hits.sort(key=lambda hit: (-hit.score, hit.title.casefold(), hit.row_id))
+        return hits
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Shared indexes
+# ────────────────────────────────────────────────────────────────────────────────
+
+# Resolved data directory -> its index, kept current by the change bus.
+_indexes: Dict[Path, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _version(path: Path) -> Version:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def index_for(data_dir: str | Path = 'data') -> SearchIndex:
+    """
+    The search index of the tables in ``data_dir``.
+
+    Built on first use; afterwards writes through ``TableStore`` update it row
+    by row. Tables changed behind the store's back (a different process, an
+    edited file) are noticed by their file version and re-indexed in full.
+
+    Args:
+        data_dir: Directory holding the ``SOURCES`` tables.
+
+    Returns:
+        The shared index; do not modify it.
+    """
+    from backend.storage import TableStore  # storage publishes to the bus this module subscribes to
+
+    data_dir = Path(data_dir)
+    with _indexes_lock:
+        index = _indexes.setdefault(data_dir.resolve(), SearchIndex())
+    for dataset in SOURCES:
+        path = data_dir / dataset
+        # The file the load reads, so an edited legacy file is noticed too.
+        version = _version(schemas.source_path(path, schemas.TABLES[dataset]))
+        if index.version(dataset) != version:
+            index.replace(dataset, TableStore(path, schemas.TABLES[dataset]).load(), version)
+    return index
+
+
+def _on_change(change: events.Change) -> None:
+    with _indexes_lock:
+        index = _indexes.get(Path(change.path).parent.resolve())
+    if index is None:
+        return  # built from the current files on first use
+    table = change.table
+    if table is None:
+        from backend.storage import TableStore
+
+        table = TableStore(change.path, schemas.TABLES[change.dataset]).load()
+    index.apply(change.dataset, table, change.version, change.row_ids)
+
+
+events.subscribe(_on_change, tuple(SOURCES))
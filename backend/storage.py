@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend import events, schemas, table_cache
+
+# Rows read per block when scanning large stored tables.
+SCAN_CHUNK_SIZE = 100_000
+
+AGGREGATE_COLUMNS = ['Month', 'Category', 'Amount', 'Outflow', 'Inflow', 'Count']
+
+# Resolved path -> (file version, table), shared by every ``TableStore`` on that file.
+_tables: Dict[Path, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+_tables_lock = threading.Lock()
+
+
+class HashIndex:
+    """
+    Sorted set of 64-bit row hashes with vectorized membership tests.
+    """
+
+    def __init__(self, hashes: Iterable[int] | np.ndarray = ()) -> None:
+        self._hashes = np.unique(np.asarray(hashes, dtype='uint64'))
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            hashes: uint64 array of row hashes.
+
+        Returns:
+            Boolean array, True where the hash is already indexed.
+        """
+        hashes = np.asarray(hashes, dtype='uint64')
+        if not len(self._hashes):
+            return np.zeros(len(hashes), dtype=bool)
+        pos = np.searchsorted(self._hashes, hashes)
+        pos[pos == len(self._hashes)] = 0
+        return self._hashes[pos] == hashes
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Merge ``hashes`` into the index."""
+        self._hashes = np.union1d(self._hashes, np.asarray(hashes, dtype='uint64'))
+
+
+def append_rows(df: pd.DataFrame, path: str | Path) -> None:
+    """
+    Append a batch of rows to a CSV in one write, adding the header for new files.
+
+    Args:
+        df: Rows to append; columns must match the existing file.
+        path: CSV file to append to. Parent directories are created as needed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    is_new = not path.exists() or path.stat().st_size == 0
+    df.to_csv(
+        path,
+        mode='w' if is_new else 'a',
+        header=is_new,
+        index=False,
+        encoding='utf-8-sig' if is_new else 'utf-8',
+    )
+
+
+def _write_atomic(df: pd.DataFrame, path: Path) -> None:
+    """Write a CSV through a temporary file so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    df.to_csv(tmp, index=False, encoding='utf-8-sig')
+    os.replace(tmp, path)
+
+
+def aggregate_transactions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Net amount, outflows, inflows and row count per month and category.
+
+    Returns:
+        Frame with ``'Month'`` (``'YYYY-MM'``), ``'Category'``, ``'Amount'``
+        (net), ``'Outflow'`` (money out, positive), ``'Inflow'`` (money in) and
+        ``'Count'``.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=AGGREGATE_COLUMNS)
+    amount = df['Amount'].astype(float)
+    return (
+        df.assign(
+            Month=pd.to_datetime(df['Date']).dt.strftime('%Y-%m'),
+            Category=df['Category'].fillna(''),
+            Outflow=(-amount).clip(lower=0),
+            Inflow=amount.clip(lower=0),
+        )
+        .groupby(['Month', 'Category'], as_index=False)
+        .agg(Amount=('Amount', 'sum'), Outflow=('Outflow', 'sum'), Inflow=('Inflow', 'sum'),
+             Count=('Amount', 'size'))
+    )
+
+
+class TransactionStore:
+    """
+    Ledger of imported bank/card transactions, partitioned into one CSV per
+    calendar month (``<root>/YYYY-MM.csv``).
+
+    Every write also updates ``<root>/_aggregates.csv``, the running net amount,
+    outflows, inflows and count per month and category, so period totals never
+    need a scan of the raw partitions. ``<root>/_aggregates.json`` records the
+    partition file versions the aggregates were computed from; a write that
+    was interrupted between the partitions and the aggregates leaves them out
+    of step, and the next read rebuilds.
+    """
+
+    AGGREGATES_FILE = '_aggregates.csv'
+    LEDGER_FILE = '_aggregates.json'
+
+    def __init__(self, root: str | Path = 'data/transactions') -> None:
+        self.root = Path(root)
+
+    # ── Partitions ───────────────────────────────────────────────────────────
+    def partition_path(self, month: str) -> Path:
+        return self.root / f'{month}.csv'
+
+    def months(self) -> List[str]:
+        """Months with stored transactions, oldest first."""
+        return sorted(path.stem for path in self.root.glob('[0-9][0-9][0-9][0-9]-[0-9][0-9].csv'))
+
+    def load(self, months: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Load stored transactions, normalized against ``TRANSACTIONS``.
+
+        Args:
+            months: ``'YYYY-MM'`` partitions to read. Defaults to all of them.
+        """
+        months = self.months() if months is None else [m for m in months if self.partition_path(m).exists()]
+        if not months:
+            return schemas.TRANSACTIONS.empty()
+        return pd.concat(
+            [schemas.read_table(self.partition_path(month), schemas.TRANSACTIONS) for month in months],
+            ignore_index=True,
+        )
+
+    def scan(self, columns: List[str]) -> Iterator[pd.DataFrame]:
+        """Yield ``columns`` of the stored transactions in blocks of at most one partition."""
+        for month in self.months():
+            yield from pd.read_csv(
+                self.partition_path(month),
+                usecols=columns,
+                encoding='utf-8-sig',
+                chunksize=SCAN_CHUNK_SIZE,
+            )
+
+    def uncategorized(self, columns: List[str], limit: int) -> Tuple[int, pd.DataFrame]:
+        """
+        Count the transactions without a category and keep the first ``limit``.
+
+        Args:
+            columns: Columns to return; ``'Category'`` is always read.
+            limit: Most rows to return.
+
+        Returns:
+            ``(count, rows)``, oldest partitions first.
+        """
+        usecols = list(dict.fromkeys([*columns, 'Category']))
+        count, kept = 0, []
+        for block in self.scan(usecols):
+            rows = block[block['Category'].fillna('').eq('')]
+            count += len(rows)
+            missing = limit - sum(len(part) for part in kept)
+            if missing > 0 and len(rows):
+                kept.append(rows.head(missing))
+        if not kept:
+            return count, schemas.TRANSACTIONS.empty()[columns]
+        rows = pd.concat(kept, ignore_index=True)[columns].fillna({'Category': ''})
+        if 'Date' in rows.columns:
+            rows['Date'] = pd.to_datetime(rows['Date'])
+        return count, rows
+
+    def hash_index(self) -> HashIndex:
+        """Build a ``HashIndex`` of every stored row without loading the full table."""
+        parts = [
+            block['Hash'].dropna().astype('int64').to_numpy().view('uint64')
+            for block in self.scan(['Hash'])
+        ]
+        return HashIndex(np.concatenate(parts) if parts else np.empty(0, dtype='uint64'))
+
+    def next_id(self) -> int:
+        """Return the first unused transaction ID."""
+        max_ids = [block['ID'].max() for block in self.scan(['ID']) if not block.empty]
+        return int(max(max_ids)) + 1 if max_ids else 1
+
+    # ── Writes ───────────────────────────────────────────────────────────────
+    def append(self, df: pd.DataFrame) -> None:
+        """Append a batch of normalized transactions, one write per touched month."""
+        if df.empty:
+            return
+        df = df[list(schemas.TRANSACTIONS.columns)]
+        # Read the current aggregates first: if they have to be rebuilt from the
+        # partitions, this batch must not be in the partitions yet.
+        merged = _sum_aggregates(pd.concat([self.aggregates(), aggregate_transactions(df)], ignore_index=True))
+
+        for month, part in df.groupby(pd.to_datetime(df['Date']).dt.strftime('%Y-%m')):
+            append_rows(part, self.partition_path(month))
+        self._write_aggregates(merged)
+
+    def save(self, df: pd.DataFrame) -> None:
+        """Replace the stored ledger with ``df``; see ``rewrite`` for changing rows in place."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        df = df[list(schemas.TRANSACTIONS.columns)]
+        months = pd.to_datetime(df['Date']).dt.strftime('%Y-%m')
+
+        for month in set(self.months()) - set(months):
+            self.partition_path(month).unlink()
+        for month, part in df.groupby(months):
+            _write_atomic(part, self.partition_path(month))
+        self._write_aggregates(aggregate_transactions(df))
+
+    def rewrite(self, transform: Callable[[pd.DataFrame], pd.DataFrame]) -> List[str]:
+        """
+        Apply ``transform`` to the ledger one partition at a time, writing back
+        only the partitions it changed.
+
+        Args:
+            transform: Takes a normalized month partition and returns it with
+                some column values changed; rows must stay in the same month.
+
+        Returns:
+            The months that were rewritten.
+        """
+        aggregates = self.aggregates()
+        changed: Dict[str, pd.DataFrame] = {}
+        for month in self.months():
+            path = self.partition_path(month)
+            part = schemas.read_table(path, schemas.TRANSACTIONS)
+            new = schemas.normalize(transform(part), schemas.TRANSACTIONS)[list(schemas.TRANSACTIONS.columns)]
+            if new.equals(part):
+                continue
+            _write_atomic(new, path)
+            changed[month] = aggregate_transactions(new)
+
+        if changed:
+            kept = aggregates[~aggregates['Month'].astype(str).isin(list(changed))]
+            self._write_aggregates(_sum_aggregates(pd.concat([kept, *changed.values()], ignore_index=True)))
+        return list(changed)
+
+    # ── Aggregates ───────────────────────────────────────────────────────────
+    def ledger_version(self) -> Dict[str, List[int]]:
+        """Month -> ``[mtime_ns, size]`` of its partition file."""
+        version = {}
+        for month in self.months():
+            stat = os.stat(self.partition_path(month))
+            version[month] = [stat.st_mtime_ns, stat.st_size]
+        return version
+
+    def _write_aggregates(self, aggregates: pd.DataFrame) -> None:
+        # Aggregates first, then the ledger version they match: a crash in
+        # between leaves an old or missing version, which forces a rebuild.
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_atomic(aggregates[AGGREGATE_COLUMNS], self.root / self.AGGREGATES_FILE)
+        path = self.root / self.LEDGER_FILE
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        tmp.write_text(json.dumps(self.ledger_version()), encoding='utf-8')
+        os.replace(tmp, path)
+
+    def _stored_ledger_version(self) -> Optional[Dict[str, List[int]]]:
+        try:
+            return json.loads((self.root / self.LEDGER_FILE).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def aggregates(self) -> pd.DataFrame:
+        """
+        Running net amount, outflows, inflows and count per month and category.
+
+        Rebuilt from the partitions when the aggregates file is missing, has an
+        older layout or does not match the partitions' current versions.
+        """
+        path = self.root / self.AGGREGATES_FILE
+        if path.exists() and self._stored_ledger_version() == self.ledger_version():
+            stored = pd.read_csv(path, encoding='utf-8-sig', dtype={'Month': str, 'Category': str}).fillna(
+                {'Category': ''}
+            )
+            if set(AGGREGATE_COLUMNS) <= set(stored.columns):
+                return stored
+
+        parts = [aggregate_transactions(block) for block in self.scan(['Date', 'Category', 'Amount'])]
+        if not parts:
+            return pd.DataFrame(columns=AGGREGATE_COLUMNS)
+
+        rebuilt = _sum_aggregates(pd.concat(parts, ignore_index=True))
+        self._write_aggregates(rebuilt)
+        return rebuilt
+
+
+def _sum_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+    return df.groupby(['Month', 'Category'], as_index=False)[['Amount', 'Outflow', 'Inflow', 'Count']].sum()
+
+
+def _read_table(path: Path, legacy: Optional[Path], schema: schemas.TableSchema) -> pd.DataFrame:
+    """``schemas.read_table``, or an empty table when neither ``path`` nor ``legacy`` exists."""
+    try:
+        return schemas.read_table(path, schema)
+    except FileNotFoundError:
+        return schema.empty()
+
+
+class TableStore:
+    """
+    One schema-backed CSV table (expenses, subscriptions, ...) keyed by ``'ID'``.
+
+    Loads are cached per file version and every write goes through a temporary
+    file and replaces the cached entry, so callers outside Streamlit (batch
+    jobs, benchmarks) get the same reads and writes as the pages. Loaded and
+    saved tables carry a version token (see ``table_cache.tag``), so caches
+    keyed on them never hash the full table.
+    """
+
+    def __init__(self, path: str | Path, schema: schemas.TableSchema) -> None:
+        self.path = Path(path)
+        self.schema = schema
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+    def _version(self) -> Tuple[int, int]:
+        # Of the file a load reads, so edits to a legacy file are noticed too.
+        try:
+            stat = os.stat(schemas.source_path(self.path, self.schema))
+        except OSError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _legacy(self) -> Optional[Path]:
+        return self.path.parent / self.schema.legacy_file if self.schema.legacy_file else None
+
+    def load(self) -> pd.DataFrame:
+        """Normalized table, or an empty one if neither the file nor its legacy file exists. Treat as read-only."""
+        key = self.path.resolve()
+        version = self._version()
+        with _tables_lock:
+            cached = _tables.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        # Parsing and normalizing the CSV is the slow part of a cold start; the
+        # disk cache keys it on the file's contents, so a restarted process skips it.
+        table = table_cache.cached(f'table.{self.schema.name}', _read_table, self.path, self._legacy(), self.schema)
+        with _tables_lock:
+            _tables[key] = (version, table)
+        return table
+
+    def get(self, row_id: int) -> Optional[pd.Series]:
+        """The row with ``row_id``, or ``None``."""
+        table = self.load()
+        rows = table[table['ID'] == row_id]
+        return rows.iloc[0] if len(rows) else None
+
+    # ── Writes ───────────────────────────────────────────────────────────────
+    def save(self, table: pd.DataFrame, row_ids: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """
+        Normalize and write ``table`` in full, then publish the change.
+
+        Args:
+            table: The complete new table.
+            row_ids: IDs of the rows that changed; ``None`` for a full replace.
+
+        Returns:
+            The stored table.
+        """
+        table = schemas.normalize(table, self.schema)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(table, self.path)
+        version = self._version()
+        # The token a fresh load of the written file would get.
+        key = table_cache.entry_key(_read_table, self.path, self._legacy(), self.schema)
+        table_cache.tag(table, table_cache.result_token(f'table.{self.schema.name}', key))
+        with _tables_lock:
+            _tables[self.path.resolve()] = (version, table)
+        events.publish(events.Change(
+            dataset=self.path.name,
+            path=self.path,
+            version=version,
+            row_ids=frozenset(int(i) for i in row_ids) if row_ids is not None else None,
+            table=table,
+        ))
+        return table
+
+    def add(self, **values: Any) -> int:
+        """
+        Append one row; columns not given take the schema defaults.
+
+        Returns:
+            The new row's ID.
+        """
+        table = self.load()
+        new_id = int(table['ID'].max()) + 1 if len(table) else 1
+        self.save(pd.concat([table, pd.DataFrame([{**values, 'ID': new_id}])], ignore_index=True), [new_id])
+        return new_id
+
+    def append(self, rows: pd.DataFrame) -> int:
+        """Append ``rows``, assigning IDs after the current maximum; returns how many were added."""
+        columns = [col for col in self.schema.columns if col != 'ID' and col in rows.columns]
+        table = self.load()
+        first_id = int(table['ID'].max()) + 1 if len(table) else 1
+        self.save(pd.concat([table, rows[columns]], ignore_index=True), range(first_id, first_id + len(rows)))
+        return len(rows)
+
+    def update(self, row_id: int, **values: Any) -> None:
+        """Overwrite the given columns of the row with ``row_id``."""
+        table = self.load().copy()
+        mask = table['ID'] == row_id
+        for col, value in values.items():
+            table.loc[mask, col] = value
+        self.save(table, [row_id])
+
+    def delete(self, row_id: int) -> None:
+        """Remove the row with ``row_id``."""
+        table = self.load()
+        self.save(table[table['ID'] != row_id].reset_index(drop=True), [row_id])
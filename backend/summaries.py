@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from backend import events, schemas
+from backend.calculations import PERIOD_MAP, annual_amount
+
+# Summary records of every table in a data directory, next to the tables.
+SUMMARY_FILE = '_summaries.json'
+
+# Bumped when the way records are computed changes, so older records are rebuilt.
+SUMMARY_FORMAT = 2
+
+# Version of a table file: (modification time in ns, size); (0, 0) when missing.
+Version = Tuple[int, int]
+
+_lock = threading.Lock()
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Records
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class TableSummary:
+    """
+    Annual total, row count and per-category totals of one expense-like table.
+    """
+
+    version: Version
+    rows: int
+    annual_total: float
+    by_category: Dict[str, float] = field(default_factory=dict)
+
+    def per_period(self, period_map: Dict[str, float] = PERIOD_MAP) -> Dict[str, float]:
+        """The annual total spread over each period, e.g. ``{'Monthly': ...}``."""
+        return {period: self.annual_total / mult for period, mult in period_map.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class IncomeSummary:
+    """
+    Pre-tax pay and taxes of all income sources; mirrors ``backend.budget.Income``.
+    """
+
+    version: Version
+    rows: int
+    salary_pre_tax: float
+    salary_taxes: float
+    bonus_pre_tax: float
+    bonus_taxes: float
+
+    @property
+    def salary_post_tax(self) -> float:
+        return self.salary_pre_tax - self.salary_taxes
+
+    @property
+    def bonus_post_tax(self) -> float:
+        return self.bonus_pre_tax - self.bonus_taxes
+
+    @property
+    def total_comp_pre_tax(self) -> float:
+        return self.salary_pre_tax + self.bonus_pre_tax
+
+    @property
+    def total_taxes(self) -> float:
+        return self.salary_taxes + self.bonus_taxes
+
+    @property
+    def total_comp_post_tax(self) -> float:
+        return self.total_comp_pre_tax - self.total_taxes
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetSummary:
+    """
+    Summary records of a whole data directory; mirrors ``backend.budget.Budget``.
+    """
+
+    income: IncomeSummary
+    expenses: TableSummary
+    subscriptions: TableSummary
+    planned_purchases: TableSummary
+
+    @property
+    def total_expense(self) -> float:
+        return (
+            self.expenses.annual_total
+            + self.subscriptions.annual_total
+            + self.planned_purchases.annual_total
+        )
+
+    @property
+    def annual_surplus(self) -> float:
+        return self.income.total_comp_post_tax - self.total_expense
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Summarizing
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _annual(table: pd.DataFrame, amount_col: str, frequency_col: str) -> pd.Series:
+    return annual_amount(table[amount_col], table[frequency_col])
+
+
+def _expense_summary(amount_col: str, frequency_col: str) -> Callable[[pd.DataFrame, Version], TableSummary]:
+    def summarize(table: pd.DataFrame, version: Version) -> TableSummary:
+        annual = _annual(table, amount_col, frequency_col)
+        by_category = {}
+        if 'Category' in table.columns:
+            by_category = {str(k): float(v) for k, v in annual.groupby(table['Category']).sum().items()}
+        return TableSummary(version=version, rows=len(table), annual_total=float(annual.sum()),
+                            by_category=by_category)
+    return summarize
+
+
+def _income_summary(table: pd.DataFrame, version: Version) -> IncomeSummary:
+    salary = _annual(table, 'Salary', 'Frequency')
+    return IncomeSummary(
+        version=version,
+        rows=len(table),
+        salary_pre_tax=float(salary.sum()),
+        salary_taxes=float((salary * table['Salary Effective Tax Rate']).sum()),
+        bonus_pre_tax=float(table['Bonus'].sum()),
+        bonus_taxes=float((table['Bonus'] * table['Total Compensation Effective Tax Rate']).sum()),
+    )
+
+
+# File name -> (schema, summarizer, record type); the tables ``Budget.from_csv_folder`` reads.
+DATASETS: Dict[str, Tuple[schemas.TableSchema, Callable[[pd.DataFrame, Version], Any], type]] = {
+    'income.csv': (schemas.INCOME, _income_summary, IncomeSummary),
+    'budget_data.csv': (schemas.BUDGET, _expense_summary('Amount', 'Frequency'), TableSummary),
+    'subscriptions.csv': (schemas.SUBSCRIPTIONS, _expense_summary('Amount', 'Frequency'), TableSummary),
+    'planned_purchases.csv': (schemas.PLANNED_PURCHASES, _expense_summary('Cost', 'Amortization Method'),
+                              TableSummary),
+}
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Materialized records
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _version(path: Path) -> Version:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_records(data_dir: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        records = json.loads((data_dir / SUMMARY_FILE).read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return records if records.get('_format') == SUMMARY_FORMAT else {}
+
+
+def _write_record(data_dir: Path, file_name: str, record: Any) -> None:
+    """Replace one table's record; the file is rewritten through a temporary file."""
+    path = data_dir / SUMMARY_FILE
+    with _lock:
+        records = _read_records(data_dir)
+        records['_format'] = SUMMARY_FORMAT
+        records[file_name] = asdict(record)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps(records, indent=1), encoding='utf-8')
+        os.replace(tmp, path)
+
+
+def refresh(path: str | Path, table: Optional[pd.DataFrame] = None) -> Optional[Any]:
+    """
+    Recompute and store the summary record of the table at ``path``.
+
+    Runs on every published table change (see the subscription below), with
+    the table the writer just stored. Each record carries the table's file version, so a record left behind
+    by an interrupted write is detected as stale and rebuilt on the next read.
+
+    Args:
+        path: Table file; files without a registered summary are ignored.
+        table: The table as just written; read from disk when omitted.
+
+    Returns:
+        The new record, or ``None`` for an unregistered or missing file.
+    """
+    path = Path(path)
+    entry = DATASETS.get(path.name)
+    if entry is None:
+        return None
+    schema, summarize, _ = entry
+    source = schemas.source_path(path, schema)
+    version = _version(source)
+    if table is None:
+        if version == (0, 0):
+            return None
+        from backend.storage import TableStore  # storage imports this module
+
+        table = TableStore(path, schema).load()
+    record = summarize(table, version)
+    _write_record(path.parent, path.name, record)
+    return record
+
+
+def table_summary(path: str | Path, records: Optional[Dict[str, Dict[str, Any]]] = None) -> Any:
+    """
+    Summary record of one table, from the materialized file when it is current.
+
+    Args:
+        path: Table file, e.g. ``data/budget_data.csv``.
+        records: Contents of the summary file, when the caller already read it.
+
+    Returns:
+        The table's record; an all-zero record when the file does not exist.
+
+    Raises:
+        KeyError: No summary is registered for the file name.
+    """
+    path = Path(path)
+    schema, summarize, record_type = DATASETS[path.name]
+    version = _version(schemas.source_path(path, schema))
+    if version == (0, 0):
+        return summarize(schema.empty(), version)
+
+    if records is None:
+        records = _read_records(path.parent)
+    stored = records.get(path.name)
+    if stored is not None and tuple(stored['version']) == version:
+        return record_type(**{**stored, 'version': tuple(stored['version'])})
+    return refresh(path)
+
+
+def budget_summary(data_dir: str | Path = 'data') -> BudgetSummary:
+    """Summary records of every table ``Budget.from_csv_folder`` reads from ``data_dir``."""
+    data_dir = Path(data_dir)
+    records = _read_records(data_dir)
+    return BudgetSummary(
+        income=table_summary(data_dir / 'income.csv', records),
+        expenses=table_summary(data_dir / 'budget_data.csv', records),
+        subscriptions=table_summary(data_dir / 'subscriptions.csv', records),
+        planned_purchases=table_summary(data_dir / 'planned_purchases.csv', records),
+    )
+
+
+def _on_change(change: events.Change) -> None:
+    refresh(change.path, change.table)
+
+
+events.subscribe(_on_change, tuple(DATASETS))
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import pandas as pd
+
+T = TypeVar('T')
+
+# Where derived tables are kept between restarts; shared by every server process on the host.
+CACHE_DIR = Path(os.environ.get('BUDGET_APP_CACHE_DIR', Path('.cache') / 'tables'))
+
+# Total size of the cache files; the least recently used are removed beyond it.
+MAX_BYTES = 512 * 2 ** 20
+
+# Bump when the file layout changes so old entries are ignored.
+FORMAT_VERSION = 1
+
+_SUFFIX = '.pkl'
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Version tokens
+# ────────────────────────────────────────────────────────────────────────────────
+
+# id(frame) -> (weak reference, token) for frames whose contents a writer vouches for.
+_tokens: Dict[int, Tuple[weakref.ref, str]] = {}
+# Re-entrant: a reference callback can run during garbage collection on a thread holding it.
+_tokens_lock = threading.RLock()
+
+
+def tag(frame: T, token: str) -> T:
+    """
+    Record ``token`` as the version of ``frame`` and return the frame.
+
+    A tagged frame is fingerprinted by its token instead of its values, so
+    cache lookups on it cost O(1) whatever its size. Only tag frames that are
+    never modified afterwards, such as the shared tables ``TableStore.load``
+    returns; copies and frames derived from a tagged one are not tagged.
+    """
+    key = id(frame)
+
+    def forget(ref: weakref.ref) -> None:
+        with _tokens_lock:
+            if _tokens.get(key, (None,))[0] is ref:
+                del _tokens[key]
+
+    with _tokens_lock:
+        _tokens[key] = (weakref.ref(frame, forget), token)
+    return frame
+
+
+def token(value: Any) -> Optional[str]:
+    """
+    The version token of a tagged frame or series, or of a dataclass (such as
+    ``Budget``) whose fields all have one; ``None`` otherwise.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        with _tokens_lock:
+            entry = _tokens.get(id(value))
+        return entry[1] if entry is not None and entry[0]() is value else None
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        parts = [token(getattr(value, f.name)) for f in dataclasses.fields(value)]
+        return None if None in parts else f'{type(value).__name__}({",".join(parts)})'
+    return None
+
+
+def _tag_result(value: Any, prefix: str) -> None:
+    """Tag the frames of a cached result: the value itself, tuple items or dataclass fields."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        tag(value, prefix)
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            _tag_result(item, f'{prefix}[{i}]')
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        for f in dataclasses.fields(value):
+            _tag_result(getattr(value, f.name), f'{prefix}.{f.name}')
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Fingerprints
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _update(digest: Any, value: Any) -> None:
+    """Feed ``value`` into ``digest`` by content, or by its version token when it has one."""
+    version = token(value)
+    if version is not None:
+        digest.update(b'token')
+        digest.update(version.encode())
+    elif isinstance(value, pd.DataFrame):
+        digest.update(b'frame')
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        digest.update(repr([(str(col), str(dtype)) for col, dtype in value.dtypes.items()]).encode())
+    elif isinstance(value, pd.Series):
+        digest.update(b'series')
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        digest.update(repr((value.name, str(value.dtype))).encode())
+    elif isinstance(value, Path):
+        digest.update(b'path')
+        files = sorted(value.glob('*.csv')) if value.is_dir() else [value]
+        for path in files:
+            digest.update(path.name.encode())
+            try:
+                digest.update(path.read_bytes())
+            except FileNotFoundError:
+                digest.update(b'<missing>')
+    elif isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(type(value).__name__.encode())
+        for item in value:
+            _update(digest, item)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        digest.update(type(value).__qualname__.encode())
+        for f in dataclasses.fields(value):
+            _update(digest, getattr(value, f.name))
+    else:
+        digest.update(repr(value).encode())
+
+
+def fingerprint(*inputs: Any) -> str:
+    """
+    Content digest of a computation's inputs.
+
+    Tagged frames (see ``tag``) are hashed by their token, other frames and
+    series by value, a ``Path`` by the bytes of the file (or of every CSV in
+    the directory), containers and dataclasses recursively and anything else
+    by ``repr``.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in inputs:
+        _update(digest, value)
+    return digest.hexdigest()
+
+
+_code_versions: Dict[Callable[..., Any], str] = {}
+
+
+def _source_files(func: Callable[..., Any]) -> List[Path]:
+    """Every module of the package ``func`` belongs to, or just its own file outside a package."""
+    package = sys.modules.get(getattr(func, '__module__', '').split('.')[0])
+    init = getattr(package, '__file__', None)
+    if init and Path(init).name == '__init__.py':
+        return sorted(Path(init).parent.rglob('*.py'))
+    source = inspect.getsourcefile(func)
+    return [Path(source)] if source else []
+
+
+def code_version(func: Callable[..., Any]) -> str:
+    """
+    Digest of the code behind ``func``: the sources of its package (or its file),
+    plus the pandas and Python versions, so an edit or an upgrade invalidates
+    the entries it produced.
+    """
+    version = _code_versions.get(func)
+    if version is None:
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(f'{FORMAT_VERSION}|{pd.__version__}|{sys.version_info[:2]}|{func.__qualname__}'.encode())
+        try:
+            for path in _source_files(func):
+                digest.update(path.read_bytes())
+        except (TypeError, OSError):
+            digest.update(repr(func).encode())
+        version = _code_versions[func] = digest.hexdigest()
+    return version
+
+
+def entry_key(compute: Callable[..., Any], *inputs: Any) -> str:
+    """Cache key of ``compute(*inputs)``: its code version and input fingerprint."""
+    return hashlib.blake2b(f'{code_version(compute)}|{fingerprint(*inputs)}'.encode(), digest_size=16).hexdigest()
+
+
+def result_token(name: str, key: str) -> str:
+    """Version token of the frames returned for entry ``name``/``key``; equal in every process."""
+    return f'{name}-{key}'
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Cache
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+class TableCache:
+    """
+    Content-addressed disk cache of derived tables and aggregates.
+
+    An entry's file name is ``<name>-<digest>.pkl``, with the digest taken over
+    the computation's code version and input fingerprint, so equal
+    inputs map to the same file in every process and a restarted server finds
+    the results of the previous one. Files are written to a temporary name and
+    renamed into place, so readers never see a partial entry. Hits refresh the
+    file's modification time; when the directory grows past ``max_bytes`` the
+    least recently used files are removed.
+
+    Entries are pickles written by this cache; point it only at a directory
+    the app owns.
+    """
+
+    def __init__(self, root: str | Path = CACHE_DIR, max_bytes: int = MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, name: str, key: str) -> Path:
+        return self.root / f'{name}-{key}{_SUFFIX}'
+
+    def get(self, name: str, key: str) -> Tuple[bool, Any]:
+        """``(True, value)`` for a stored entry, otherwise ``(False, None)``."""
+        path = self.path(name, key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return False, None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Unreadable or written by incompatible code; recompute and overwrite.
+            return False, None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True, value
+
+    def put(self, name: str, key: str, value: Any) -> None:
+        """Store ``value`` atomically, then evict down to ``max_bytes``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(name, key)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            with open(tmp, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def cached(self, name: str, compute: Callable[..., T], *inputs: Any) -> T:
+        """
+        ``compute(*inputs)``, read from disk when the same code already computed
+        it for equal inputs.
+
+        Args:
+            name: Entry name, e.g. ``'budget_plan'``; also the file name prefix.
+            compute: Pure function of ``inputs``.
+            *inputs: Arguments, fingerprinted by content (see ``fingerprint``).
+
+        Returns:
+            The stored or freshly computed value. Treat it as read-only: its
+            frames are tagged with the entry's token (see ``result_token``).
+        """
+        key = entry_key(compute, *inputs)
+        found, value = self.get(name, key)
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if not found:
+            value = compute(*inputs)
+            self.put(name, key, value)
+        _tag_result(value, result_token(name, key))
+        return value
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob(f'*{_SUFFIX}'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits ``max_bytes``; returns how many."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, bytes on disk, hits and misses of this process."""
+        entries = self._entries()
+        with self._lock:
+            return {
+                'entries': len(entries),
+                'bytes': sum(size for _, size, _ in entries),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+_default: Optional[TableCache] = None
+
+
+def default() -> TableCache:
+    """The process-wide cache in ``CACHE_DIR``."""
+    global _default
+    if _default is None:
+        _default = TableCache()
+    return _default
+
+
+def cached(name: str, compute: Callable[..., T], *inputs: Any) -> T:
+    """``TableCache.cached`` on the process-wide cache."""
+    return default().cached(name, compute, *inputs)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import pandas as pd
+
+UNCATEGORIZED = 'Uncategorized'
+
+
+def actuals(
+        aggregates: pd.DataFrame,
+        month: str,
+        *,
+        year_to_date: bool = False,
+        spending_categories: Optional[Iterable[str]] = None,
+) -> pd.Series:
+    """
+    Spending per category for one month, or from January through that month.
+
+    Only money going out counts as spending. Inflows reduce the spending of
+    spending categories (refunds); anywhere else (paychecks, deposits,
+    uncategorized transfers) they are ignored.
+
+    Args:
+        aggregates: ``TransactionStore.aggregates()`` frame.
+        month: ``'YYYY-MM'``.
+        year_to_date: Sum January through ``month`` instead of ``month`` alone.
+        spending_categories: Categories whose inflows are refunds; every
+            category except uncategorized rows when ``None``.
+
+    Returns:
+        Series indexed by category; outflows are positive, refunds reduce them.
+    """
+    months = aggregates['Month'].astype(str)
+    if year_to_date:
+        in_period = (months >= f'{month[:4]}-01') & (months <= month)
+    else:
+        in_period = months == month
+
+    rows = aggregates[in_period]
+    category = rows['Category'].replace('', UNCATEGORIZED)
+    if spending_categories is None:
+        refunds = category != UNCATEGORIZED
+    else:
+        refunds = category.isin(set(spending_categories))
+    spent = rows['Outflow'] - rows['Inflow'].where(refunds, 0.0)
+    return spent.groupby(category).sum().rename('Actual')
+
+
+def budget_vs_actual(
+        budget_plan: pd.DataFrame,
+        aggregates: pd.DataFrame,
+        month: str,
+        *,
+        year_to_date: bool = False,
+        annual_amount_col: str = 'Annual Amount',
+) -> pd.DataFrame:
+    """
+    Compare planned spending with actual spending per category.
+
+    The plan for a period is the category's annual amount pro-rated by month:
+    one twelfth for a single month, ``n`` twelfths for ``n`` months year-to-date.
+
+    Args:
+        budget_plan: Frame with ``'Category'`` and ``annual_amount_col``.
+        aggregates: ``TransactionStore.aggregates()`` frame.
+        month: ``'YYYY-MM'``.
+        year_to_date: Compare January through ``month``.
+        annual_amount_col: Annual planned amount column.
+
+    Returns:
+        Frame with ``'Category'``, ``'Budget'``, ``'Actual'``, ``'Variance'``
+        (budget minus actual; negative means overspent) and ``'% Used'``,
+        covering categories that are planned, spent, or both.
+    """
+    months_in_period = int(month[5:7]) if year_to_date else 1
+
+    budget = (
+        budget_plan.groupby('Category')[annual_amount_col].sum()
+        / 12 * months_in_period
+    ).rename('Budget')
+    actual = actuals(aggregates, month, year_to_date=year_to_date, spending_categories=budget.index)
+
+    out = pd.concat([budget, actual], axis=1).fillna(0.0)
+    out = out[(out['Budget'] != 0) | (out['Actual'] != 0)]  # e.g. an income category with deposits only
+    out['Variance'] = out['Budget'] - out['Actual']
+    out['% Used'] = (out['Actual'] / out['Budget'].where(out['Budget'] != 0) * 100).round(1)
+    out.index.name = 'Category'
+    return out.reset_index().sort_values('Budget', ascending=False, kind='stable').reset_index(drop=True)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+# Grid dimensions, in array axis order.
+AXES = ('Salary', 'Bonus', 'Raise', 'Tax Rate')
+
+
+class WhatIfGrid:
+    """
+    After-tax income and annual surplus for every combination of salary,
+    bonus, raise and effective tax rate, as one broadcasted array of shape
+    ``(salary, bonus, raise, tax rate)``.
+
+    The computation runs in stages. Each stage is kept with the inputs it
+    depends on and is rebuilt only when one of them changes: moving the tax
+    axis reuses the gross pay, and a new expense total reuses the after-tax
+    array.
+    """
+
+    def __init__(self) -> None:
+        self._stages: Dict[str, Tuple[Tuple[bytes, ...], np.ndarray]] = {}
+        self.recomputed: Dict[str, int] = {}
+
+    def _stage(self, name: str, inputs: Tuple[np.ndarray, ...], compute: Callable[[], np.ndarray]) -> np.ndarray:
+        key = tuple(np.ascontiguousarray(a, dtype=float).tobytes() for a in inputs)
+        cached = self._stages.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = compute()
+        self._stages[name] = (key, result)
+        self.recomputed[name] = self.recomputed.get(name, 0) + 1
+        return result
+
+    def gross(self, salary: np.ndarray, bonus: np.ndarray, raise_pct: np.ndarray) -> np.ndarray:
+        """Pre-tax pay, shape ``(salary, bonus, raise)``; the raise applies to salary only."""
+        salary, bonus, raise_pct = (np.asarray(a, dtype=float) for a in (salary, bonus, raise_pct))
+        raised = self._stage('raised salary', (salary, raise_pct),
+                             lambda: salary[:, None] * (1 + raise_pct)[None, :])
+        return self._stage('gross', (salary, bonus, raise_pct),
+                           lambda: raised[:, None, :] + bonus[None, :, None])
+
+    def after_tax(
+            self,
+            salary: np.ndarray,
+            bonus: np.ndarray,
+            raise_pct: np.ndarray,
+            tax_rate: np.ndarray,
+    ) -> np.ndarray:
+        """
+        After-tax pay over the whole grid.
+
+        Args:
+            salary: Annual salary values.
+            bonus: Annual bonus values.
+            raise_pct: Raises as fractions, e.g. ``0.05``.
+            tax_rate: Effective tax rates as fractions.
+
+        Returns:
+            Array of shape ``(len(salary), len(bonus), len(raise_pct), len(tax_rate))``.
+        """
+        tax_rate = np.asarray(tax_rate, dtype=float)
+        gross = self.gross(salary, bonus, raise_pct)
+        return self._stage('after tax', (salary, bonus, raise_pct, tax_rate),
+                           lambda: gross[..., None] * (1 - tax_rate))
+
+    def surplus(
+            self,
+            salary: np.ndarray,
+            bonus: np.ndarray,
+            raise_pct: np.ndarray,
+            tax_rate: np.ndarray,
+            annual_expense: float,
+    ) -> np.ndarray:
+        """After-tax pay minus ``annual_expense`` over the whole grid."""
+        after_tax = self.after_tax(salary, bonus, raise_pct, tax_rate)
+        expense = np.array([annual_expense], dtype=float)
+        return self._stage('surplus', (salary, bonus, raise_pct, tax_rate, expense),
+                           lambda: after_tax - expense[0])
+
+
+def grid_slice(values: np.ndarray, x_axis: str, y_axis: str, fixed: Dict[str, int]) -> np.ndarray:
+    """
+    Two-dimensional view of a grid array for a heatmap.
+
+    Args:
+        values: Array laid out along ``AXES``.
+        x_axis: Axis shown left to right.
+        y_axis: Axis shown top to bottom.
+        fixed: Index to hold every other axis at.
+
+    Returns:
+        Array of shape ``(len(y_axis values), len(x_axis values))``.
+    """
+    index = tuple(slice(None) if axis in (x_axis, y_axis) else fixed[axis] for axis in AXES)
+    view = values[index]
+    # The remaining dimensions keep AXES order; put y first.
+    return view if AXES.index(y_axis) < AXES.index(x_axis) else view.T
@@ -0,0 +1,145 @@
+"""
+Import-time report for the app's cold start and for each page.
+
+For ``app/main.py`` and every page registered in ``app/pages.py`` the
+module-level imports are collected (imports inside functions are deferred and
+left out) and run in a fresh interpreter under ``python -X importtime``, after
+``import streamlit`` so only what the script adds on top of Streamlit is counted.
+
+Usage:
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --repeat 5 --top 10
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.run import PROJECT_ROOT, RESULTS_DIR, environment
+
+APP_DIR = PROJECT_ROOT / 'app'
+
+# "import time:       self |  cumulative | <indent>name"
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$')
+
+_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+
+
+@dataclass(frozen=True, slots=True)
+class Report:
+    """Import cost of one script on top of ``import streamlit``."""
+
+    target: str
+    modules: int
+    total_ms: float
+    heaviest: List[Tuple[str, float]]  # (module, cumulative ms) of top-level imports
+
+
+def module_level_imports(path: Path) -> List[str]:
+    """Import statements a script runs when executed, skipping those inside functions and classes."""
+    tree = ast.parse(path.read_text(encoding='utf-8'))
+    statements = []
+
+    def visit(node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _SCOPES):
+                continue
+            if isinstance(child, (ast.Import, ast.ImportFrom)) and not getattr(child, 'level', 0):
+                statements.append(ast.unparse(child))
+            else:
+                visit(child)
+
+    visit(tree)
+    return list(dict.fromkeys(statements))
+
+
+def page_scripts() -> List[Path]:
+    """Page scripts registered in ``app/pages.py``, in navigation order."""
+    source = (APP_DIR / 'pages.py').read_text(encoding='utf-8')
+    return [APP_DIR / page for page in re.findall(r"page='([^']+\.py)'", source)]
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """``(module, self us, cumulative us, depth)`` for every line of ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def measure(statements: List[str]) -> List[Tuple[str, int, int, int]]:
+    """
+    Run ``statements`` after ``import streamlit`` in a fresh interpreter.
+
+    Returns:
+        The ``-X importtime`` rows recorded after Streamlit finished importing.
+    """
+    code = '\n'.join(['import streamlit', 'print("--", file=__import__("sys").stderr)', *statements])
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([str(PROJECT_ROOT), str(APP_DIR), env.get('PYTHONPATH', '')])
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=APP_DIR, env=env, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return parse_importtime(completed.stderr.split('--\n', 1)[-1])
+
+
+def report(target: str, statements: List[str], *, repeat: int = 3, top: int = 5) -> Report:
+    """Best of ``repeat`` runs for one script."""
+    best: Optional[List[Tuple[str, int, int, int]]] = None
+    for _ in range(repeat):
+        rows = measure(statements)
+        total = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+        if best is None or total < sum(c for _, _, c, d in best if d == 0):
+            best = rows
+
+    rows = best or []
+    top_level = sorted(((name, cumulative) for name, _, cumulative, depth in rows if depth == 0),
+                       key=lambda item: item[1], reverse=True)
+    return Report(
+        target=target,
+        modules=len(rows),
+        total_ms=sum(cumulative for _, cumulative in top_level) / 1000,
+        heaviest=[(name, cumulative / 1000) for name, cumulative in top_level[:top]],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Import-time cost of the app entry point and each page.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per script; the fastest is kept.')
+    parser.add_argument('--top', type=int, default=5, help='Heaviest top-level imports listed per script.')
+    parser.add_argument('--output', type=Path, help='Result file (default: benchmarks/results/importtime-<commit>.json).')
+    args = parser.parse_args()
+
+    scripts: Dict[str, Path] = {'main.py (before first paint)': APP_DIR / 'main.py'}
+    scripts.update({str(path.relative_to(APP_DIR)): path for path in page_scripts()})
+
+    reports = []
+    for target, path in scripts.items():
+        result = report(target, module_level_imports(path), repeat=args.repeat, top=args.top)
+        reports.append(result)
+        heaviest = ', '.join(f'{name} {ms:.0f}' for name, ms in result.heaviest)
+        print(f'{target:<52} {result.total_ms:>8.1f} ms  {result.modules:>5} modules  {heaviest}')
+
+    env = environment()
+    output = args.output or RESULTS_DIR / f"importtime-{env['commit']}{'-dirty' if env['dirty'] else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({'environment': env, 'reports': [asdict(r) for r in reports]}, indent=2))
+    print(f'\nSaved {output}')
+
+
+if __name__ == '__main__':
+    main()
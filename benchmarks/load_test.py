@@ -0,0 +1,308 @@
+"""
+Headless load test: N concurrent simulated sessions in one process.
+
+Each session is a Streamlit ``AppTest`` driven through a realistic flow (open
+the dashboard, edit an expense, add an income source, switch between pages).
+Sessions run on their own threads, as the server runs each session's script
+on its own thread, against a scratch copy of the data so nothing under
+``data/`` is modified.
+
+Reports p50/p95/p99 rerun latency, throughput and resident memory per session
+for each concurrency level, and saves them to ``benchmarks/results/``.
+
+Usage:
+    python -m benchmarks.load_test --sessions 1 5 10 20 --iterations 3
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from benchmarks import synthetic
+from benchmarks.run import PROJECT_ROOT, RESULTS_DIR, environment
+
+MAIN_SCRIPT = PROJECT_ROOT / 'app' / 'main.py'
+
+# Page scripts as registered in ``app/pages.py``.
+DASHBOARD = 'views/dashboard/page_dashboard.py'
+BUDGET = 'views/budget/page_budget.py'
+INCOME = 'views/income.py'
+SUBSCRIPTIONS = 'views/subscriptions/page_subscriptions.py'
+PLANNED_PURCHASES = 'views/planned_purchases/page_planned_purchases.py'
+
+
+@dataclass(frozen=True, slots=True)
+class LevelReport:
+    """Results for one concurrency level."""
+
+    sessions: int
+    reruns: int
+    errors: int
+    wall_s: float
+    throughput: float  # reruns per second
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    rss_mb: float
+    mb_per_session: float
+    error_kinds: Dict[str, int]
+    steps: Dict[str, Dict[str, float]]
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Simulated session
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+class SimulatedSession:
+    """
+    One browser tab. Every ``step`` is a single rerun and is timed.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        from streamlit.testing.v1 import AppTest
+
+        self.app = AppTest.from_file(str(MAIN_SCRIPT), default_timeout=timeout)
+        self.timings: List[Tuple[str, float]] = []
+        self.errors = 0
+        self.error_kinds: Counter = Counter()
+
+    def _rerun(self, step: str) -> None:
+        """Run and time one rerun; script exceptions and harness failures count as errors."""
+        start = time.perf_counter()
+        try:
+            self.app.run()
+        except Exception as exc:  # noqa: BLE001 - AppTest can fail on a stale widget tree
+            self.errors += 1
+            self.error_kinds[f'harness: {type(exc).__name__}'] += 1
+            return
+        self.timings.append((step, (time.perf_counter() - start) * 1000))
+        self.errors += len(self.app.exception)
+        for exc in self.app.exception:
+            self.error_kinds[f'{step}: {exc.message.splitlines()[0][:80]}'] += 1
+
+    def open(self, page: Optional[str] = None, step: str = 'open dashboard') -> None:
+        if page is not None:
+            self.app.switch_page(page)
+        self._rerun(step)
+
+    def edit_expense(self) -> None:
+        """Change the first expense's amount and submit its form."""
+        # Tabs are lazy; select the Expenses tab as a click on it would.
+        self.app.session_state['budget_tabs'] = 'Expenses'
+        self.open(BUDGET, 'open budget')
+        amounts = [w for w in self.app.number_input if str(w.key).startswith('amount-')]
+        saves = [b for b in self.app.button if b.label == '💾 Save']
+        if not amounts or not saves:
+            return
+        amounts[0].set_value(round(amounts[0].value + 1.0, 2))
+        saves[0].click()
+        self._rerun('save expense')
+
+    def add_income_source(self) -> None:
+        """Add an income source and pick a job title for it."""
+        self.open(INCOME, 'open income')
+        add = [b for b in self.app.button if b.label == '➕ Add']
+        if not add:
+            return
+        add[0].click()
+        self._rerun('add income source')
+
+        # Options are income IDs shown by job title; AppTest selects by value.
+        from backend.income import IncomeStore
+
+        ids = IncomeStore('data/income.csv').metrics().index.tolist()
+        selects = [s for s in self.app.selectbox if str(s.key).startswith('income_')]
+        if selects and len(ids) > 1:
+            selects[-1].set_value(ids[len(selects) % len(ids)])
+            self._rerun('select income source')
+
+    def flow(self) -> None:
+        """Dashboard → budget edit → income → subscriptions → planned purchases → dashboard."""
+        self.open(DASHBOARD)
+        self.edit_expense()
+        self.add_income_source()
+        self.open(SUBSCRIPTIONS, 'open subscriptions')
+        self.open(PLANNED_PURCHASES, 'open planned purchases')
+        self.open(DASHBOARD, 'back to dashboard')
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Runner
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def share_runtime() -> None:
+    """
+    Make concurrent ``AppTest`` runs share one runtime, as sessions on a server do.
+
+    Around every run ``AppTest`` installs a fresh mock ``Runtime`` and patches
+    ``config.get_option``, then undoes both, which breaks other sessions mid-run
+    and gives every rerun an empty ``st.cache_*`` store. Here the first mock
+    runtime is kept and the config patch is applied once for the process.
+    """
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.testing.v1 import app_test
+    from streamlit.testing.v1.util import build_mock_config_get_option
+
+    config.get_option = build_mock_config_get_option({'global.appTest': True})
+    app_test.patch_config_options = lambda overrides: contextlib.nullcontext()
+
+    class _KeepFirst(type):
+        def __setattr__(cls, name, value):
+            if name != '_instance':
+                super().__setattr__(name, value)
+            elif value is not None and Runtime._instance is None:
+                Runtime._instance = value
+
+    app_test.Runtime = _KeepFirst('SharedRuntime', (Runtime,), {})
+
+
+def _rss_mb() -> float:
+    """Resident set size of this process in MB."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@contextlib.contextmanager
+def workspace(size: Optional[str], seed: int = 0) -> Iterator[Path]:
+    """
+    Scratch working directory with ``data/`` and ``static/``.
+
+    Uses a copy of the project's data, or a synthetic dataset when ``size`` is given.
+    """
+    with tempfile.TemporaryDirectory(prefix='budget-load-') as tmp:
+        root = Path(tmp)
+        if size is None:
+            shutil.copytree(PROJECT_ROOT / 'data', root / 'data')
+        else:
+            synthetic.write_dataset(root / 'data', synthetic.parse_size(size), seed=seed)
+        shutil.copytree(PROJECT_ROOT / 'static', root / 'static')
+
+        cwd = os.getcwd()
+        os.chdir(root)
+        try:
+            yield root
+        finally:
+            os.chdir(cwd)
+
+
+def _percentiles(values: np.ndarray) -> Dict[str, float]:
+    if not len(values):
+        return {'count': 0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'count': int(len(values)), 'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99)}
+
+
+def run_level(sessions: int, iterations: int, timeout: float) -> LevelReport:
+    """
+    Run ``sessions`` concurrent sessions through the flow ``iterations`` times each.
+    """
+    gc.collect()
+    baseline = _rss_mb()
+
+    # Sessions stay referenced until the end so their state counts towards RSS.
+    simulated = [SimulatedSession(timeout) for _ in range(sessions)]
+    barrier = threading.Barrier(sessions)
+    failures: List[BaseException] = []
+
+    def worker(session: SimulatedSession) -> None:
+        barrier.wait()
+        try:
+            for _ in range(iterations):
+                session.flow()
+        except BaseException as exc:  # noqa: BLE001 - reported below
+            failures.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(s,), daemon=True) for s in simulated]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    gc.collect()
+    rss = _rss_mb()
+
+    by_step: Dict[str, List[float]] = defaultdict(list)
+    for session in simulated:
+        for step, ms in session.timings:
+            by_step[step].append(ms)
+    latencies = np.array([ms for values in by_step.values() for ms in values])
+    overall = _percentiles(latencies)
+
+    return LevelReport(
+        sessions=sessions,
+        reruns=len(latencies),
+        errors=sum(s.errors for s in simulated) + len(failures),
+        wall_s=wall,
+        throughput=len(latencies) / wall if wall else 0.0,
+        p50_ms=overall['p50_ms'],
+        p95_ms=overall['p95_ms'],
+        p99_ms=overall['p99_ms'],
+        max_ms=float(latencies.max()) if len(latencies) else 0.0,
+        rss_mb=rss,
+        mb_per_session=max(rss - baseline, 0.0) / sessions,
+        error_kinds=dict(sum((s.error_kinds for s in simulated), Counter())
+                         + Counter(type(f).__name__ for f in failures)),
+        steps={step: _percentiles(np.array(values)) for step, values in by_step.items()},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Simulate concurrent Streamlit sessions in one process.')
+    parser.add_argument('--sessions', nargs='+', type=int, default=[1, 5, 10, 20],
+                        help='Concurrency levels to run, in order.')
+    parser.add_argument('--iterations', type=int, default=2, help='Flows per session at each level.')
+    parser.add_argument('--size', help='Use a synthetic dataset of this size instead of a copy of data/.')
+    parser.add_argument('--timeout', type=float, default=120.0, help='Per-rerun timeout in seconds.')
+    parser.add_argument('--output', type=Path, help='Result file (default: benchmarks/results/load-<commit>.json).')
+    args = parser.parse_args()
+
+    reports = []
+    share_runtime()
+    with workspace(args.size):
+        # One untimed session first so imports and caches are warm for every level.
+        SimulatedSession(args.timeout).flow()
+
+        print(f"{'sessions':>8} {'reruns':>7} {'errors':>6} {'rerun/s':>8} {'p50 ms':>8} "
+              f"{'p95 ms':>8} {'p99 ms':>8} {'RSS MB':>8} {'MB/sess':>8}")
+        for sessions in args.sessions:
+            report = run_level(sessions, args.iterations, args.timeout)
+            reports.append(report)
+            print(f'{report.sessions:>8} {report.reruns:>7} {report.errors:>6} {report.throughput:>8.1f} '
+                  f'{report.p50_ms:>8.0f} {report.p95_ms:>8.0f} {report.p99_ms:>8.0f} '
+                  f'{report.rss_mb:>8.0f} {report.mb_per_session:>8.1f}')
+
+    env = environment()
+    output = args.output or RESULTS_DIR / f"load-{env['commit']}{'-dirty' if env['dirty'] else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(
+        {'environment': env, 'size': args.size or 'data', 'levels': [asdict(r) for r in reports]},
+        indent=2,
+    ))
+    print(f'\nSaved {output}')
+
+
+if __name__ == '__main__':
+    main()
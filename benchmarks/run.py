@@ -0,0 +1,427 @@
+"""
+Benchmark suite for the data paths behind the budget and dashboard pages.
+
+Every case runs against a synthetic dataset (see ``benchmarks.synthetic``) at
+each requested size. Results are written to ``benchmarks/results/<commit>.json``
+so runs from different commits can be compared.
+
+Usage:
+    python -m benchmarks.run --sizes 100 10k 100k
+    python -m benchmarks.run --compare benchmarks/results/abc1234.json benchmarks/results/def5678.json
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from benchmarks import synthetic  # noqa: E402
+
+RESULTS_DIR = PROJECT_ROOT / 'benchmarks' / 'results'
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """
+    One benchmark.
+
+    ``setup`` runs untimed before every repeat and returns the callable to time,
+    so cases that mutate state (session data, files) start from the same point.
+    ``max_rows`` skips sizes the operation is not meant to handle interactively.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    max_rows: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    case: str
+    size: str
+    rows: int
+    repeats: int
+    min_s: float
+    median_s: float
+    mean_s: float
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Cases
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def _session_state():
+    import streamlit as st
+    return st.session_state
+
+
+def _reset_session() -> None:
+    state = _session_state()
+    for key in list(state.keys()):
+        del state[key]
+
+
+def _marshal_dataframe(data) -> int:
+    """Serialise ``data`` the way ``st.dataframe`` does; returns the payload size."""
+    from pandas.io.formats.style import Styler
+    from streamlit import dataframe_util
+    from streamlit.elements.lib.pandas_styler_utils import marshall_styler
+    try:
+        from streamlit.proto.ArrowData_pb2 import ArrowData as ArrowProto
+    except ImportError:  # Streamlit < 1.50
+        from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+
+    proto = ArrowProto()
+    frame = data.data if isinstance(data, Styler) else data
+    proto.data = dataframe_util.convert_pandas_df_to_arrow_bytes(frame)
+    if isinstance(data, Styler):
+        marshall_styler(proto, data, default_uuid='benchmark')
+    return proto.ByteSize()
+
+
+def build_cases() -> List[Case]:
+    """
+    Cases for the current working directory, which must contain ``data/``.
+    """
+    from app.views.budget import db
+    from app.views.budget.config import PERIOD_MAP
+    from app.views.budget.utils import budget_plan_table, style_budget_plan_df
+    from backend import budget as models
+    from app import lazy_tabs
+    from backend import calculations, debt, projection, schemas, search
+    from backend.storage import TableStore
+    from backend.table_cache import TableCache
+
+    def bootstrap_cold():
+        _reset_session()
+        return lambda: db.bootstrap_budget_data(PERIOD_MAP, 'data/budget_data.csv')
+
+    def bootstrap_warm():
+        _reset_session()
+        db.bootstrap_budget_data(PERIOD_MAP, 'data/budget_data.csv')
+        return lambda: db.bootstrap_budget_data(PERIOD_MAP, 'data/budget_data.csv')
+
+    budget_frame = schemas.read_table('data/budget_data.csv', schemas.BUDGET)
+
+    def add_frequency_cols():
+        return lambda: calculations.add_frequency_cols(
+            budget_frame,
+            amount_col='Amount',
+            frequency_col='Frequency',
+            annual_col='Annual Amount',
+        )
+
+    def from_csv_folder():
+        return lambda: models.Budget.from_csv_folder('data')
+
+    def from_csv_folder_disk_cache():
+        # A warm entry on disk and nothing in memory, as after a restart.
+        cache = TableCache(Path(tempfile.mkdtemp(dir='.')) / 'tables')
+        cache.cached('budget', models.Budget.from_csv_folder, Path('data'))
+        return lambda: cache.cached('budget', models.Budget.from_csv_folder, Path('data'))
+
+    income = models.Income.from_csv(data_dir='data')
+
+    def income_properties():
+        def run():
+            return (
+                income.salary_pre_tax,
+                income.salary_taxes,
+                income.salary_post_tax,
+                income.bonus_pre_tax,
+                income.bonus_taxes,
+                income.bonus_post_tax,
+                income.total_comp_pre_tax,
+                income.total_taxes,
+                income.total_comp_post_tax,
+            )
+        return run
+
+    def style_budget_plan():
+        _reset_session()
+        _, budget_plan, _, _ = db.bootstrap_budget_data(PERIOD_MAP, 'data/budget_data.csv')
+        pct_cols = ['% of Total Budget', '% of Total Category']
+        display = budget_plan[['Name', *PERIOD_MAP, *pct_cols]]
+        # Rendering to HTML forces the gradients and formats the Styler defers.
+        return lambda: style_budget_plan_df(display, list(PERIOD_MAP), pct_cols).to_html()
+
+    def render_budget_plan():
+        _reset_session()
+        _, budget_plan, _, _ = db.bootstrap_budget_data(PERIOD_MAP, 'data/budget_data.csv')
+        pct_cols = ['% of Total Budget', '% of Total Category']
+        display = budget_plan[['Name', *PERIOD_MAP, *pct_cols]]
+
+        def run():
+            data, _ = budget_plan_table(display, list(PERIOD_MAP), pct_cols)
+            return _marshal_dataframe(data)
+        return run
+
+    def budget_plan():
+        return lambda: calculations.budget_plan(budget_frame, PERIOD_MAP)
+
+    # Writes go through the backend store the pages wrap, without Streamlit.
+    store = TableStore('data/budget_data.csv', schemas.BUDGET)
+
+    debts = TableStore('data/debts.csv', schemas.DEBTS).load()
+
+    def debt_payoff_sweep():
+        # What the Debts page runs when the extra-payment range changes.
+        extras = np.linspace(0, 2_000, 41)
+        return lambda: debt.simulate(debts, extras)
+
+    def net_worth_projection():
+        # What the Projections page runs for a new account set, bypassing the memo.
+        accounts = projection.allocate_surplus(
+            [projection.Account(f'Account {i}', kind, 10_000.0, 5_000.0, 0.03, 0.5, 0.06)
+             for i, kind in enumerate(projection.ACCOUNT_TYPES)],
+            100_000.0,
+        )
+        returns = np.round(np.arange(0, 0.12001, 0.0025), 4)
+        return lambda: projection._project(accounts, returns, 50, 150_000.0, 0.03, 0.025)
+
+    def search_index_build():
+        return lambda: search.SearchIndex().replace('budget_data.csv', budget_frame, (0, 0))
+
+    def search_as_you_type():
+        # One keystroke's query against the shared index, across expenses and subscriptions.
+        index = search.index_for('data')
+        return lambda: index.search('car insur')
+
+    def frame_version_untagged():
+        return lambda: lazy_tabs.frame_version(budget_frame)
+
+    def frame_version_tagged():
+        table = store.load()
+        return lambda: lazy_tabs.frame_version(table)
+
+    def _middle_id():
+        data = store.load()
+        return int(data['ID'].iloc[len(data) // 2])
+
+    def add_expense():
+        return lambda: store.add(Date=pd.Timestamp(datetime.date.today()), Category='Housing', Name='New Expense')
+
+    def save_expense():
+        expense_id = _middle_id()
+        return lambda: store.update(
+            expense_id,
+            **{
+                'Name': 'Benchmark',
+                'Amount': 123.45,
+                'Frequency': 'Monthly',
+                'Date': pd.Timestamp(datetime.date(2025, 1, 1)),
+                'Tax Deductible': False,
+                'Notes': '',
+            },
+        )
+
+    def delete_expense():
+        expense_id = _middle_id()
+        return lambda: store.delete(expense_id)
+
+    return [
+        Case('bootstrap_budget_data (cold)', bootstrap_cold),
+        Case('bootstrap_budget_data (warm)', bootstrap_warm),
+        Case('budget_plan', budget_plan),
+        Case('debt payoff sweep', debt_payoff_sweep, max_rows=10_000),
+        Case('frame_version (untagged)', frame_version_untagged),
+        Case('net worth projection', net_worth_projection, max_rows=10_000),
+        Case('frame_version (tagged table)', frame_version_tagged),
+        Case('_add_frequency_cols', add_frequency_cols),
+        Case('Budget.from_csv_folder', from_csv_folder),
+        Case('Budget.from_csv_folder (disk cache)', from_csv_folder_disk_cache),
+        Case('Income properties', income_properties),
+        Case('search index build', search_index_build),
+        Case('search as you type', search_as_you_type),
+        Case('style_budget_plan_df', style_budget_plan, max_rows=100_000),
+        Case('render budget plan', render_budget_plan),
+        Case('add_expense', add_expense),
+        Case('save_expense', save_expense),
+        Case('delete_expense', delete_expense),
+    ]
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Runner
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+@contextlib.contextmanager
+def _workspace(size: str, rows: int, seed: int, keep: Optional[Path]) -> Iterator[Path]:
+    """Working directory holding ``data/`` for one size; the app uses relative paths."""
+    with tempfile.TemporaryDirectory(prefix=f'budget-bench-{size}-') as tmp:
+        root = keep / size if keep is not None else Path(tmp)
+        data_dir = root / 'data'
+        if not (data_dir / 'budget_data.csv').exists():
+            synthetic.write_dataset(data_dir, rows, seed=seed)
+
+        cwd = os.getcwd()
+        os.chdir(root)
+        try:
+            yield root
+        finally:
+            os.chdir(cwd)
+
+
+def time_case(case: Case, repeats: int) -> List[float]:
+    timings = []
+    for _ in range(repeats):
+        func = case.setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_suite(
+        sizes: List[str],
+        *,
+        repeats: int = 5,
+        seed: int = 0,
+        only: Optional[List[str]] = None,
+        keep: Optional[Path] = None,
+) -> List[Result]:
+    """
+    Run every case at every size.
+
+    Args:
+        sizes: Size names or row counts, e.g. ``['100', '10k']``.
+        repeats: Timed runs per case; the minimum is the headline number.
+        seed: Dataset seed.
+        only: Case names (substring match) to run; all when ``None``.
+        keep: Directory to write and reuse datasets in, instead of a temp dir.
+
+    Returns:
+        One result per case and size.
+    """
+    results = []
+    for size in sizes:
+        rows = synthetic.parse_size(size)
+        with _workspace(size, rows, seed, keep):
+            for case in build_cases():
+                if only and not any(pattern in case.name for pattern in only):
+                    continue
+                if case.max_rows is not None and rows > case.max_rows:
+                    print(f'{size:>6}  {case.name:<32} skipped (> {case.max_rows:,} rows)')
+                    continue
+
+                timings = time_case(case, repeats)
+                result = Result(
+                    case=case.name,
+                    size=size,
+                    rows=rows,
+                    repeats=repeats,
+                    min_s=min(timings),
+                    median_s=statistics.median(timings),
+                    mean_s=statistics.fmean(timings),
+                )
+                results.append(result)
+                print(f'{size:>6}  {case.name:<32} {result.min_s * 1000:>10.2f} ms (min)  '
+                      f'{result.median_s * 1000:>10.2f} ms (median)')
+    return results
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ['git', *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def environment() -> Dict[str, Any]:
+    """Commit and interpreter details stored alongside the timings."""
+    return {
+        'commit': _git('rev-parse', '--short', 'HEAD') or 'unknown',
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+    }
+
+
+def save_results(results: List[Result], output: Optional[Path] = None) -> Path:
+    """Write results to ``output`` (default ``benchmarks/results/<commit>.json``)."""
+    env = environment()
+    if output is None:
+        suffix = '-dirty' if env['dirty'] else ''
+        output = RESULTS_DIR / f"{env['commit']}{suffix}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(
+        {'environment': env, 'results': [asdict(r) for r in results]},
+        indent=2,
+    ))
+    return output
+
+
+def compare(base_path: Path, head_path: Path) -> pd.DataFrame:
+    """
+    Side-by-side minimum timings of two result files.
+
+    Returns:
+        Frame indexed by case and size with base/head milliseconds and the
+        head/base ratio (below 1 means head is faster).
+    """
+    def load(path: Path) -> pd.Series:
+        payload = json.loads(path.read_text())
+        frame = pd.DataFrame(payload['results'])
+        return frame.set_index(['case', 'size'])['min_s'] * 1000
+
+    base, head = load(base_path), load(head_path)
+    out = pd.concat({'base (ms)': base, 'head (ms)': head}, axis=1)
+    out['ratio'] = out['head (ms)'] / out['base (ms)']
+    return out.round(3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Time the budgeting data paths on synthetic data.')
+    parser.add_argument('--sizes', nargs='+', default=['100', '10k', '100k'],
+                        help=f'Dataset sizes: {list(synthetic.SIZES)} or integers.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='+', help='Run only cases whose name contains one of these.')
+    parser.add_argument('--keep-data', type=Path, help='Write and reuse datasets under this directory.')
+    parser.add_argument('--output', type=Path, help='Result file (default: benchmarks/results/<commit>.json).')
+    parser.add_argument('--compare', nargs=2, type=Path, metavar=('BASE', 'HEAD'),
+                        help='Compare two result files instead of running.')
+    args = parser.parse_args()
+
+    if args.compare:
+        with pd.option_context('display.width', 200, 'display.max_rows', None):
+            print(compare(*args.compare))
+        return
+
+    results = run_suite(
+        args.sizes,
+        repeats=args.repeat,
+        seed=args.seed,
+        only=args.only,
+        keep=args.keep_data.resolve() if args.keep_data else None,
+    )
+    print(f'\nSaved {save_results(results, args.output)}')
+
+
+if __name__ == '__main__':
+    main()
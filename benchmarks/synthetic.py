@@ -0,0 +1,295 @@
+"""
+Synthetic budgeting datasets for benchmarks.
+
+Each generator is vectorized with NumPy so a million-row table takes seconds,
+and seeded so the same size and seed always give the same files.
+
+Usage:
+    python -m benchmarks.synthetic 10k --out /tmp/budget-10k
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+# Named dataset sizes used by the benchmark suite.
+SIZES: Dict[str, int] = {
+    '100': 100,
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Vocabulary
+# ────────────────────────────────────────────────────────────────────────────────
+
+# Category -> (super category, typical monthly amount, example names)
+_CATEGORIES = {
+    'Housing': ('Needs', 1_800.0, ['Rent', 'Mortgage', 'HOA Dues', 'Property Tax', 'Renters Insurance']),
+    'Utilities & Communications': ('Needs', 90.0, ['Electric', 'Water', 'Gas', 'Internet', 'Phone']),
+    'Insurance': ('Needs', 120.0, ['Car Insurance', 'Health Insurance', 'Life Insurance', 'Umbrella Policy']),
+    'Debt Service': ('Needs', 400.0, ['Student Loan', 'Car Loan', 'Credit Card Payment']),
+    'Transportation': ('Needs', 150.0, ['Fuel', 'Parking', 'Transit Pass', 'Tolls']),
+    'Groceries': ('Needs', 110.0, ['Groceries', 'Costco Run', 'Farmers Market']),
+    'Health': ('Needs', 60.0, ['Pharmacy', 'Dentist', 'Gym Membership']),
+    'Discretionary Income': ('Wants', 80.0, ['Dining Out', 'Concerts', 'Hobbies', 'Gifts', 'Travel']),
+    'Subscriptions & Recurring Expenses': ('Wants', 25.0, ['Streaming', 'Cloud Storage', 'News', 'Music']),
+    'Savings': ('Savings', 500.0, ['Emergency Fund', 'Brokerage', 'Roth IRA', '529 Plan']),
+}
+
+_SERVICES = [
+    'Spotify', 'Netflix', 'Hulu', 'Disney+', 'Amazon Prime', 'Apple', 'Google', 'Microsoft',
+    'Adobe', 'Dropbox', 'Medium', 'Seeking Alpha', 'Tradingview', 'PlayStation Plus',
+    'Xbox Game Pass', 'Peloton', 'Audible', 'YouTube Premium', 'LastPass', 'ChatGPT',
+]
+
+_PURCHASES = [
+    'Vacation', 'Laptop', 'Sofa', 'Bike', 'Camera', 'Wedding Gift', 'Car Repair',
+    'Concert Tickets', 'Annual Pass', 'Phone Upgrade', 'Mattress', 'Dog Purchase',
+]
+
+_JOB_TITLES = [
+    'Analyst', 'Senior Analyst', 'Associate', 'Manager', 'Senior Manager',
+    'Director', 'Engineer', 'Senior Engineer', 'Staff Engineer', 'Consultant',
+]
+
+_DEBTS = ['Credit Card', 'Store Card', 'Car Loan', 'Student Loan', 'Personal Loan', 'Medical Bill']
+
+_CARDS = ['', 'Apple', 'Amex', 'Visa', 'Chase Sapphire', 'Discover']
+
+_STATUSES = ['Active', 'Active', 'Active', 'Inactive']
+
+# Frequencies and how often each shows up in real budgets.
+_FREQUENCIES = ['Monthly', 'Semi-Monthly', 'Weekly', 'Quarterly', 'Annual']
+_FREQUENCY_WEIGHTS = [0.6, 0.15, 0.1, 0.08, 0.07]
+_PER_MONTH = {'Monthly': 1.0, 'Semi-Monthly': 0.5, 'Weekly': 12 / 52, 'Quarterly': 3.0, 'Annual': 12.0}
+
+# Excel epoch used by the spreadsheet-exported planned_purchases.csv.
+_EXCEL_EPOCH = pd.Timestamp('1899-12-30')
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def parse_size(size: str | int) -> int:
+    """Row count for a named size (``'10k'``) or a plain integer."""
+    if isinstance(size, int):
+        return size
+    key = size.strip().lower()
+    if key in SIZES:
+        return SIZES[key]
+    if key.endswith('k'):
+        return int(float(key[:-1]) * 1_000)
+    if key.endswith('m'):
+        return int(float(key[:-1]) * 1_000_000)
+    return int(key)
+
+
+def _dates(rng: np.random.Generator, n: int, *, start: str = '2021-01-01', days: int = 4 * 365) -> np.ndarray:
+    offsets = rng.integers(0, days, size=n)
+    return (np.datetime64(start) + offsets.astype('timedelta64[D]')).astype('datetime64[D]')
+
+
+def _pick(rng: np.random.Generator, options: list, n: int, p: list | None = None) -> np.ndarray:
+    return np.asarray(options, dtype=object)[rng.choice(len(options), size=n, p=p)]
+
+
+def _numbered(names: np.ndarray, rng: np.random.Generator, share: float = 0.3) -> np.ndarray:
+    """Suffix a share of names with a number so large tables are not all duplicates."""
+    n = len(names)
+    suffix = rng.integers(2, 99, size=n).astype(str)
+    numbered = rng.random(n) < share
+    return np.where(numbered, names + ' ' + suffix, names)
+
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Table generators
+# ────────────────────────────────────────────────────────────────────────────────
+
+
+def budget_data(n: int, *, seed: int = 0) -> pd.DataFrame:
+    """
+    Expense lines laid out like ``schemas.BUDGET``.
+
+    Args:
+        n: Number of rows.
+        seed: Random seed.
+
+    Returns:
+        DataFrame as written to ``budget_data.csv``.
+    """
+    rng = np.random.default_rng(seed)
+    categories = list(_CATEGORIES)
+    cat_idx = rng.integers(0, len(categories), size=n)
+
+    super_categories = np.array([_CATEGORIES[c][0] for c in categories], dtype=object)[cat_idx]
+    typical = np.array([_CATEGORIES[c][1] for c in categories])[cat_idx]
+
+    # Names come from the category's own vocabulary.
+    vocab = [_CATEGORIES[c][2] for c in categories]
+    width = max(len(v) for v in vocab)
+    table = np.array([(v * width)[:width] for v in vocab], dtype=object)
+    names = table[cat_idx, rng.integers(0, width, size=n)]
+
+    frequency = _pick(rng, _FREQUENCIES, n, _FREQUENCY_WEIGHTS)
+    per_month = pd.Series(frequency, dtype=object).map(_PER_MONTH).to_numpy(dtype=float)
+    amount = np.round(typical * per_month * rng.lognormal(0.0, 0.5, size=n), 2)
+
+    notes = np.where(rng.random(n) < 0.1, 'Auto-pay', '')
+
+    return pd.DataFrame({
+        'ID': np.arange(1, n + 1),
+        'Date': _dates(rng, n),
+        'Super Category': super_categories,
+        'Category': np.asarray(categories, dtype=object)[cat_idx],
+        'Name': _numbered(names, rng),
+        'Amount': amount,
+        'Frequency': frequency,
+        'Tax Deductible': rng.random(n) < 0.05,
+        'Notes': notes,
+        'Status': _pick(rng, _STATUSES, n),
+    })
+
+
+def subscriptions(n: int, *, seed: int = 0) -> pd.DataFrame:
+    """
+    Subscriptions laid out like ``subscriptions.csv``, with amounts in the
+    spreadsheet's ``' $1,234.00 '`` / ``' $-   '`` currency format.
+    """
+    rng = np.random.default_rng(seed + 1)
+    amount = np.round(rng.lognormal(2.7, 0.8, size=n), 2)
+    amount[rng.random(n) < 0.05] = 0.0
+    formatted = pd.Series(amount).map(lambda v: f' ${v:,.2f} ' if v else ' $-   ')
+
+    return pd.DataFrame({
+        'ID': np.arange(1, n + 1),
+        'Date': _dates(rng, n),
+        'Subscription/ Recurring Expense': _numbered(_pick(rng, _SERVICES, n), rng),
+        'Amount': formatted.to_numpy(dtype=object),
+        'Frequency': _pick(rng, ['Monthly', 'Annual', 'Quarterly'], n, [0.8, 0.15, 0.05]),
+        'Subscribed': np.where(rng.random(n) < 0.85, 'Yes', 'No'),
+        'Card': _pick(rng, _CARDS, n),
+        'Notes': np.where(rng.random(n) < 0.1, '*Cancelled', ''),
+    })
+
+
+def planned_purchases(n: int, *, seed: int = 0) -> pd.DataFrame:
+    """
+    Planned purchases laid out like ``planned_purchases.csv``, with Excel serial dates.
+    """
+    rng = np.random.default_rng(seed + 2)
+    dates = pd.DatetimeIndex(_dates(rng, n, start='2023-01-01', days=3 * 365))
+    serial = (dates - _EXCEL_EPOCH).days.to_numpy()
+    planned = rng.random(n) < 0.6
+
+    return pd.DataFrame({
+        'Purchase': _numbered(_pick(rng, _PURCHASES, n), rng),
+        'Date': serial,
+        'Cost': np.round(rng.lognormal(6.0, 1.2, size=n), 0),
+        'Planned Purchase': np.where(planned, 'Yes', 'No'),
+        'Pay from Savings or Amortize': np.where(rng.random(n) < 0.5, 'Amortize', 'Savings'),
+        'Amortization Method': _pick(rng, ['Year', 'Monthly', 'Quarterly'], n, [0.7, 0.2, 0.1]),
+        'Paid Off': np.where(planned, 'No', 'Paid'),
+        'Notes': '',
+    })
+
+
+def income(n: int, *, seed: int = 0) -> pd.DataFrame:
+    """
+    Income scenarios laid out like ``schemas.INCOME``; tax rates are fractions.
+    """
+    rng = np.random.default_rng(seed + 3)
+    salary = np.round(rng.lognormal(11.7, 0.4, size=n), -2)
+    bonus = np.round(salary * rng.uniform(0.0, 0.2, size=n), -1)
+    salary_rate = np.round(np.clip(0.12 + salary / 2_000_000, 0.1, 0.4), 2)
+    total_rate = np.round(np.clip(salary_rate + rng.uniform(0.0, 0.02, size=n), 0.1, 0.45), 2)
+
+    return pd.DataFrame({
+        'ID': np.arange(1, n + 1),
+        'Job Title': _numbered(_pick(rng, _JOB_TITLES, n), rng, share=0.5),
+        'Salary': salary,
+        'Bonus': bonus,
+        'Frequency': 'Annual',
+        'Total Compensation': salary + bonus,
+        'Salary Effective Tax Rate': salary_rate,
+        'Total Compensation Effective Tax Rate': total_rate,
+        'After Tax Salary': np.round(salary * (1 - salary_rate), 2),
+        'After Tax Bonus': np.round(bonus * (1 - total_rate), 2),
+        'After Tax Total Compensation': np.round(salary * (1 - salary_rate) + bonus * (1 - total_rate), 2),
+    })
+
+
+def debts(n: int, *, seed: int = 0) -> pd.DataFrame:
+    """
+    Debts laid out like ``schemas.DEBTS``; APRs are fractions.
+    """
+    rng = np.random.default_rng(seed + 4)
+    balance = np.round(rng.lognormal(8.5, 1.0, size=n), 2)
+    apr = np.round(rng.uniform(0.03, 0.2999, size=n), 4)
+    # At least the interest plus 1-3% of the balance, so every debt pays off.
+    minimum = np.round(balance * (apr / 12 + rng.uniform(0.01, 0.03, size=n)), 2)
+
+    return pd.DataFrame({
+        'ID': np.arange(1, n + 1),
+        'Name': _numbered(_pick(rng, _DEBTS, n), rng, share=0.5),
+        'Balance': balance,
+        'APR': apr,
+        'Minimum Payment': minimum,
+        'Priority': '',
+        'Notes': '',
+    })
+
+
+# File name -> generator, matching the files under ``data/``.
+TABLES = {
+    'budget_data.csv': budget_data,
+    'subscriptions.csv': subscriptions,
+    'planned_purchases.csv': planned_purchases,
+    'income.csv': income,
+    'debts.csv': debts,
+}
+
+
+def write_dataset(data_dir: str | Path, n: int, *, seed: int = 0) -> Dict[str, Path]:
+    """
+    Write every table with ``n`` rows into ``data_dir`` the way the app saves them.
+
+    Args:
+        data_dir: Target directory, created if missing.
+        n: Rows per table.
+        seed: Random seed.
+
+    Returns:
+        Mapping of file name to written path.
+    """
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    written = {}
+    for file_name, generate in TABLES.items():
+        path = data_dir / file_name
+        generate(n, seed=seed).to_csv(path, index=False, encoding='utf-8-sig')
+        written[file_name] = path
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Write a synthetic budgeting dataset.')
+    parser.add_argument('size', help=f'Rows per table: one of {list(SIZES)} or an integer.')
+    parser.add_argument('--out', required=True, help='Directory to write the CSV files to.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for file_name, path in write_dataset(args.out, parse_size(args.size), seed=args.seed).items():
+        print(f'{file_name:>24}  {path}')
+
+
+if __name__ == '__main__':
+    main()
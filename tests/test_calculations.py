@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from backend import calculations
+
+
+def _budget(rows):
+    return pd.DataFrame(rows, columns=['Category', 'Name', 'Amount', 'Frequency'])
+
+
+def test_budget_plan_annualizes_every_supported_frequency():
+    plan = calculations.budget_plan(_budget([
+        ['Housing', 'Rent', 1_500.0, 'Monthly'],
+        ['Childcare', 'Sitter', 100.0, 'Bi-Weekly'],
+        ['Education', 'Tuition', 4_000.0, 'Semester'],
+        ['Insurance', 'Car', 600.0, 'Semi-Annually'],
+    ]))
+
+    assert plan['Annual Amount'].tolist() == [18_000.0, 2_600.0, 8_000.0, 1_200.0]
+    # Displayed periods come from PERIOD_MAP only.
+    assert plan.loc[1, 'Monthly'] == pytest.approx(2_600.0 / 12)
+    assert 'Bi-Weekly' not in plan.columns
+    assert plan['% of Total Budget'].sum() == pytest.approx(100.0)
+
+
+def test_budget_plan_shares_of_income():
+    budget = _budget([
+        ['Housing', 'Rent', 1_500.0, 'Monthly'],
+        ['Food', 'Groceries', 50.0, 'Weekly'],
+    ])
+    plan = calculations.budget_plan(budget, pre_tax_income=100_000.0, after_tax_income=75_000.0)
+
+    # 18,000 and 2,600 a year.
+    assert plan['% of Pre-Tax Income'].tolist() == pytest.approx([18.0, 2.6])
+    assert plan['% of After Tax Income'].tolist() == pytest.approx([24.0, 2_600 / 750])
+
+    # Without income there is nothing to take a share of.
+    plan = calculations.budget_plan(budget)
+    assert plan['% of Pre-Tax Income'].isna().all()
+    assert plan['% of After Tax Income'].isna().all()
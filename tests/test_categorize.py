@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from backend.categorize import CompiledRules, Rule, RuleSet, check_rules
+
+
+def _categorize(rules, descriptions, amounts=None):
+    amounts = pd.Series(amounts if amounts is not None else [-10.0] * len(descriptions))
+    return CompiledRules(rules).categorize(pd.Series(descriptions), amounts).tolist()
+
+
+def test_earlier_rule_wins_across_substring_regex_and_amount_rules():
+    rules = [
+        Rule('Big Purchase', '', min_amount=500.0),
+        Rule('Coffee', 'star', kind='substring'),
+        Rule('Dining', r'bucks|cafe', kind='regex'),
+        Rule('Shopping', 'amazon'),
+    ]
+    descriptions = ['STARBUCKS #123', 'Corner  Cafe', 'Amazon Mktp', 'Starbucks Reserve', 'Rent']
+    amounts = [-5.0, -12.0, -40.0, -800.0, -20.0]
+
+    assert _categorize(rules, descriptions, amounts) == ['Coffee', 'Dining', 'Shopping', 'Big Purchase', '']
+
+
+def test_later_substring_loses_to_earlier_regex_in_the_same_text():
+    rules = [Rule('Gas', r'shell\b', kind='regex'), Rule('Grocery', 'shell')]
+    assert _categorize(rules, ['shell oil 42', 'shellfish shack']) == ['Gas', 'Grocery']
+
+
+def test_backreference_and_inline_flag_rules_keep_their_priority():
+    # Neither compiles inside the combined alternation; both take the per-rule path.
+    rules = [
+        Rule('Ride', '(?i)uber', kind='regex'),
+        Rule('Double Letter', r'(\w)\1', kind='regex'),
+        Rule('Coffee', 'latte|mocha', kind='regex'),
+    ]
+    assert _categorize(rules, ['UBER *TRIP', 'latte', 'mocha', 'book']) == [
+        'Ride', 'Double Letter', 'Coffee', 'Double Letter',
+    ]
+
+
+def test_invalid_rules_are_rejected_on_save(tmp_path):
+    rule_set = RuleSet([Rule('Ok', 'ok'), Rule('Broken', '(unclosed', kind='regex')], path=tmp_path / 'rules.csv')
+
+    with pytest.raises(ValueError, match=r"rule 2 \(Broken\): invalid regex"):
+        rule_set.save()
+    assert not (tmp_path / 'rules.csv').exists()
+    with pytest.raises(ValueError, match='kind must be one of'):
+        check_rules([Rule('X', 'x', kind='glob')])
+
+
+def test_learn_many_keeps_the_last_correction_per_description():
+    rule_set = RuleSet([Rule('Coffee', 'coffee')])
+    rule_set.learn_many(pd.DataFrame({
+        'Description': ['Joe  Coffee', 'Gas Co', 'joe coffee'],
+        'Category': ['Coffee', 'Auto', 'Dining'],
+    }))
+
+    assert [(r.pattern, r.category, r.source) for r in rule_set.rules] == [
+        ('joe coffee', 'Dining', 'override'),
+        ('gas co', 'Auto', 'override'),
+        ('coffee', 'Coffee', 'user'),
+    ]
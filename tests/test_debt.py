@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend import debt, schemas
+
+
+def _debts(rows):
+    return schemas.normalize(
+        pd.DataFrame(rows, columns=['Name', 'Balance', 'APR', 'Minimum Payment']),
+        schemas.DEBTS,
+    )
+
+
+def test_single_debt_amortizes_month_by_month():
+    # $1,000 at 12% APR (1% a month), $300 a month:
+    #   1,000.00 * 1.01 - 300 = 710.00
+    #     710.00 * 1.01 - 300 = 417.10
+    #     417.10 * 1.01 - 300 = 121.271
+    #     121.271 * 1.01      = 122.48371, paid off in month 4
+    plan = debt.simulate(_debts([['Card', 1_000.0, 0.12, 300.0]]), [0.0])
+
+    assert plan.months.tolist() == [[4.0]] * len(debt.STRATEGIES)
+    np.testing.assert_allclose(plan.balance[0, 0], [710.0, 417.10, 121.271, 0.0])
+    assert plan.interest[0, 0] == pytest.approx(10.0 + 7.10 + 4.171 + 1.21271)
+
+
+def test_minimum_of_paid_off_debt_rolls_into_the_next():
+    # No interest, $100 a month in minimums. A is cleared in month 2; from
+    # month 3 its $50 goes to B, which is paid off in month 4 instead of 6.
+    debts = _debts([['A', 100.0, 0.0, 50.0], ['B', 300.0, 0.0, 50.0]])
+    plan = debt.simulate(debts, [0.0], strategies=['Snowball'])
+
+    assert plan.payoff_month[0, 0].tolist() == [2.0, 4.0]
+    assert plan.months[0, 0] == 4.0
+    np.testing.assert_allclose(plan.balance[0, 0], [300.0, 200.0, 100.0, 0.0])
+    assert plan.interest[0, 0] == 0.0
+
+
+def test_extra_payment_goes_to_the_strategy_target():
+    # Avalanche puts the $100 extra on the 24% debt, snowball on the smaller one.
+    debts = _debts([['Low APR', 200.0, 0.0, 0.0], ['High APR', 1_000.0, 0.24, 0.0]])
+    plan = debt.simulate(debts, [100.0], strategies=['Avalanche', 'Snowball'], max_months=1)
+
+    # High APR accrues 1,000 * 0.02 = 20 in the month.
+    np.testing.assert_allclose(plan.balance[:, 0, 0], [200.0 + 920.0, 100.0 + 1_020.0])
@@ -0,0 +1,87 @@
+import pandas as pd
+
+from backend import importer
+from backend.importer import import_statement
+from backend.storage import TransactionStore
+
+STATEMENT = """Transaction Date,Payee,Amount,Card
+2024-03-01,Blue Bottle,-4.50,Visa
+2024-03-01,Blue Bottle,-4.50,Visa
+2024-03-02,Payroll,2000.00,Visa
+not a date,Broken,-1.00,Visa
+"""
+
+
+def _write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def test_repeated_charges_are_kept_and_reimports_are_duplicates(tmp_path):
+    store = TransactionStore(tmp_path / 'transactions')
+    statement = _write(tmp_path / 'march.csv', STATEMENT)
+
+    first = import_statement(statement, store)
+    assert (first.rows_read, first.rows_imported, first.duplicates, first.rejected) == (4, 3, 0, 1)
+
+    again = import_statement(statement, store)
+    assert (again.rows_imported, again.duplicates) == (0, 3)
+    assert store.load()['Description'].tolist() == ['Blue Bottle', 'Blue Bottle', 'Payroll']
+
+
+def test_overlapping_statement_imports_only_the_extra_occurrence(tmp_path):
+    store = TransactionStore(tmp_path / 'transactions')
+    import_statement(_write(tmp_path / 'march.csv', STATEMENT), store)
+
+    # The later export has a third identical coffee on the same day.
+    later = STATEMENT.replace('2024-03-02', '2024-03-01,Blue Bottle,-4.50,Visa\n2024-03-02', 1)
+    result = import_statement(_write(tmp_path / 'later.csv', later), store)
+
+    assert (result.rows_imported, result.duplicates) == (1, 3)
+    assert store.load()['ID'].tolist() == [1, 2, 3, 4]
+
+
+def test_occurrences_carry_across_chunks():
+    rows = pd.DataFrame({
+        'Date': pd.to_datetime(['2024-03-01'] * 3),
+        'Description': ['Blue Bottle'] * 3,
+        'Amount': [-4.5] * 3,
+        'Account': ['Visa'] * 3,
+    })
+    whole = importer.row_hashes(rows, {})
+
+    seen = {}
+    chunked = [*importer.row_hashes(rows.iloc[:2], seen), *importer.row_hashes(rows.iloc[2:], seen)]
+
+    assert len(set(whole)) == 3
+    assert chunked == whole.tolist()
+
+
+def test_split_debit_credit_exports_sign_outflows(tmp_path):
+    statement = _write(tmp_path / 'checking.csv', (
+        'Posted Date,Description,Debit,Credit\n'
+        '03/05/2024,Rent,1500.00,\n'
+        '03/06/2024,Refund,,25.00\n'
+    ))
+    store = TransactionStore(tmp_path / 'transactions')
+    import_statement(statement, store, account='Checking')
+
+    table = store.load()
+    assert table['Amount'].tolist() == [-1_500.0, 25.0]
+    assert table['Account'].tolist() == ['Checking', 'Checking']
+
+
+def test_ofx_transactions_are_read(tmp_path):
+    statement = _write(tmp_path / 'card.ofx', (
+        '<OFX><BANKACCTFROM><ACCTID>1234\n'
+        '<STMTTRN><DTPOSTED>20240307120000<TRNAMT>-12.34<NAME>Corner Cafe<FITID>a1\n'
+        '<STMTTRN><DTPOSTED>20240308<TRNAMT>-60.00<MEMO>Gas Station<FITID>a2\n'
+        '</OFX>\n'
+    ))
+    store = TransactionStore(tmp_path / 'transactions')
+    import_statement(statement, store)
+
+    table = store.load()
+    assert table['Description'].tolist() == ['Corner Cafe', 'Gas Station']
+    assert table['Date'].dt.strftime('%Y-%m-%d').tolist() == ['2024-03-07', '2024-03-08']
+    assert table['Account'].tolist() == ['1234', '1234']
@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from backend.income import IncomeStore
+
+
+def _metrics(store):
+    return store.metrics().loc[:, ['Job Title', 'After Tax Total Compensation', 'Total Compensation Tax']]
+
+
+def test_metrics_of_each_source(tmp_path):
+    store = IncomeStore(tmp_path / 'income.csv')
+    analyst = store.add('Analyst', 100_000.0, 10_000.0, 0.3)
+    manager = store.add('Manager', 150_000.0, 0.0, 0.25)
+
+    metrics = store.metrics()
+    assert metrics.index.tolist() == [analyst, manager]
+    assert metrics.loc[analyst, ['After Tax Salary', 'After Tax Bonus', 'Salary Tax', 'Bonus Tax']].tolist() == (
+        pytest.approx([70_000.0, 7_000.0, 30_000.0, 3_000.0])
+    )
+    assert metrics.loc[manager, ['Total Compensation', 'Total Compensation Tax']].tolist() == (
+        pytest.approx([150_000.0, 37_500.0])
+    )
+
+
+def test_ids_survive_renames_and_deletes(tmp_path):
+    store = IncomeStore(tmp_path / 'income.csv')
+    first = store.add('Analyst', 100_000.0, 0.0, 0.2)
+    second = store.add('Analyst', 120_000.0, 0.0, 0.2)
+    third = store.add('Manager', 150_000.0, 0.0, 0.3)
+
+    store.update(first, 'Senior Analyst', 110_000.0, 5_000.0, 0.2)
+    store.delete(second)
+
+    assert store.metrics().index.tolist() == [first, third]
+    assert _metrics(store).loc[first].tolist() == ['Senior Analyst', pytest.approx(92_000.0), pytest.approx(23_000.0)]
+    assert store.get(second) is None
+
+
+def test_legacy_rows_get_ids_and_outside_edits_are_reloaded(tmp_path):
+    path = tmp_path / 'income.csv'
+    path.write_text(
+        'Job Title,Salary,Bonus,Total Compensation,Salary Effective Tax Rate,'
+        'Total Compensation Effective Tax Rate,After Tax Salary,After Tax Bonus,After Tax Total Compensation\n'
+        'Analyst,100000,0,100000,0.2,0.2,80000,0,80000\n',
+        encoding='utf-8',
+    )
+    store = IncomeStore(path)
+    assert store.load()['ID'].tolist() == [1]
+
+    path.write_text(path.read_text(encoding='utf-8').replace('Analyst', 'Associate'), encoding='utf-8')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert store.get(1)['Job Title'] == 'Associate'
@@ -0,0 +1,97 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from backend import paycheck, schemas
+
+
+def _income(rows):
+    return schemas.normalize(
+        pd.DataFrame(rows, columns=['ID', 'Job Title', 'Salary', 'Bonus', 'Frequency',
+                                    'Salary Effective Tax Rate', 'Total Compensation Effective Tax Rate']),
+        schemas.INCOME,
+    )
+
+
+def _items(rows):
+    return pd.DataFrame(rows, columns=['Name', 'Category', 'Amount', 'Frequency', 'Date'])
+
+
+def _days(dates):
+    return [d.strftime('%m-%d') for d in pd.DatetimeIndex(dates)]
+
+
+def test_pay_dates_per_frequency():
+    # 2024 starts on a Monday; its first Friday is January 5th.
+    biweekly = paycheck.pay_dates(2024, 'Bi-Weekly')
+    assert len(biweekly) == 26
+    assert _days(biweekly[[0, 1, -1]]) == ['01-05', '01-19', '12-20']
+
+    # A payday from the previous year sets the phase: Dec 29 + 14 days.
+    assert _days(paycheck.pay_dates(2024, 'Bi-Weekly', datetime.date(2023, 12, 29))[:1]) == ['01-12']
+
+    semi = paycheck.pay_dates(2024, 'Semi-Monthly')
+    assert len(semi) == 24
+    assert _days(semi[[0, 1, 3, -1]]) == ['01-15', '01-31', '02-29', '12-31']
+
+    with pytest.raises(ValueError, match='Unknown pay frequency'):
+        paycheck.pay_dates(2024, 'Annual')
+
+
+def test_schedule_splits_salary_and_pays_the_bonus_separately():
+    income = _income([[1, 'Analyst', 120_000.0, 12_000.0, 'Annual', 0.25, 0.3]])
+    schedule = paycheck.paycheck_schedule(income, paycheck.pay_dates(2024, 'Monthly'), pretax_rate=0.1)
+
+    assert len(schedule) == 13
+    columns = ['Gross', 'Pre-Tax Deductions', 'Taxable', 'Withholding', 'Net']
+    # 10,000 a month; 10% pre-tax, then 25% of the rest.
+    assert schedule.loc[0, columns].tolist() == pytest.approx([10_000.0, 1_000.0, 9_000.0, 2_250.0, 6_750.0])
+    # The bonus is withheld at the total compensation rate, on the last payday.
+    bonus = schedule[schedule['Type'] == 'Bonus'].iloc[0]
+    assert bonus[columns].tolist() == pytest.approx([12_000.0, 1_200.0, 10_800.0, 3_240.0, 7_560.0])
+    assert bonus['Pay Date'] == pd.Timestamp('2024-12-31')
+    assert schedule['Gross'].sum() == pytest.approx(132_000.0)
+
+
+def test_due_dates_follow_each_items_anchor():
+    bills = paycheck.due_dates(_items([
+        ['Rent', 'Housing', 1_500.0, 'Monthly', '2024-01-31'],
+        ['Car', 'Insurance', 300.0, 'Quarterly', '2023-02-10'],
+        ['Gym', 'Health', 20.0, 'Bi-Weekly', '2024-01-03'],
+        ['Domain', 'Web', 12.0, 'Annual', None],
+    ]), 2024)
+
+    def due(name):
+        return _days(bills.loc[bills['Name'] == name, 'Due Date'])
+
+    # Days past a month's end fall on its last day.
+    assert due('Rent')[:4] == ['01-31', '02-29', '03-31', '04-30']
+    assert len(due('Rent')) == 12
+    assert due('Car') == ['02-10', '05-10', '08-10', '11-10']
+    assert len(due('Gym')) == 26
+    assert due('Gym')[-1] == '12-18'
+    assert due('Domain') == ['01-01']
+
+    with pytest.raises(ValueError, match=r'Unsupported bill frequency for Odd \(Daily\)'):
+        paycheck.due_dates(_items([['Odd', 'Misc', 1.0, 'Daily', None]]), 2024)
+
+
+def test_bills_go_to_the_last_payday_on_or_before_their_due_date():
+    schedule = pd.DataFrame({
+        'Pay Date': pd.to_datetime(['2024-01-15', '2024-01-31', '2024-01-31']),
+        'Net': [2_000.0, 1_500.0, 500.0],
+    })
+    bills = pd.DataFrame({
+        'Due Date': pd.to_datetime(['2024-01-10', '2024-01-15', '2024-01-20', '2024-01-31']),
+        'Amount': [100.0, 1_200.0, 300.0, 50.0],
+    })
+
+    coverage, bills = paycheck.allocate(schedule, bills)
+
+    # January 10th comes before the first payday; the year's last payday stands in.
+    assert _days(bills['Pay Date']) == ['01-31', '01-15', '01-15', '01-31']
+    assert coverage.values[:, 1:].tolist() == [
+        [2_000.0, 2, 1_500.0, 500.0],
+        [2_000.0, 2, 150.0, 1_850.0],
+    ]
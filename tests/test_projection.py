@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from backend.projection import ACCOUNT_TYPES, Account, project
+
+
+def test_contribution_limit_and_match_cap():
+    # $30,000 asked, capped at the 401(k) limit. The 50% match would be
+    # $11,750 but stops at 6% of a $100,000 salary.
+    limit = ACCOUNT_TYPES['401(k)'].annual_limit
+    account = Account('401(k)', '401(k)', contribution=30_000.0, match_rate=0.5, match_cap=0.06)
+    projection = project([account], [0.0], horizon=2, salary=100_000.0)
+
+    assert projection.contributions[0].tolist() == [0.0, limit, limit]
+    assert projection.match[0].tolist() == [0.0, 6_000.0, 6_000.0]
+    assert projection.balance[0, 0].tolist() == [0.0, limit + 6_000.0, 2 * (limit + 6_000.0)]
+
+
+def test_match_below_cap_follows_salary_growth():
+    # Year 1: min(0.5 * 8,000, 6% of 100,000) = 4,000.
+    # Year 2: contribution 8,000 * 1.5 = 12,000, so 6,000 against a cap of 6% of 105,000 = 6,300.
+    # Year 3: contribution 18,000, so 9,000 against a cap of 6% of 110,250 = 6,615.
+    account = Account('401(k)', '401(k)', contribution=8_000.0, contribution_growth=0.5,
+                      match_rate=0.5, match_cap=0.06)
+    projection = project([account], [0.0], horizon=3, salary=100_000.0, salary_growth=0.05)
+
+    np.testing.assert_allclose(projection.match[0], [0.0, 4_000.0, 6_000.0, 6_615.0])
+
+
+def test_balance_is_closed_form_future_value():
+    # Opening balance compounded plus an ordinary annuity of year-end contributions.
+    r, n = 0.07, 10
+    account = Account('Roth', 'Roth IRA', balance=10_000.0, contribution=5_000.0)
+    projection = project([account], [0.0, r], horizon=n)
+
+    expected = 10_000.0 * (1 + r) ** n + 5_000.0 * ((1 + r) ** n - 1) / r
+    assert projection.balance[0, 1, -1] == pytest.approx(expected)
+    assert projection.balance[0, 0, -1] == pytest.approx(10_000.0 + n * 5_000.0)
+
+
+def test_growing_contributions_and_inflation():
+    # Growing annuity: C * ((1 + r)^n - (1 + g)^n) / (r - g), then deflated to today's dollars.
+    r, g, n, inflation = 0.06, 0.03, 20, 0.025
+    account = Account('Brokerage', 'Brokerage', contribution=1_000.0, contribution_growth=g)
+    projection = project([account], [r + ACCOUNT_TYPES['Brokerage'].tax_drag], horizon=n, inflation=inflation)
+
+    nominal = 1_000.0 * ((1 + r) ** n - (1 + g) ** n) / (r - g)
+    assert projection.balance[0, 0, -1] == pytest.approx(nominal / (1 + inflation) ** n)
@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+from backend import schemas
+from backend.recurring import RecurringDetector, normalize_merchant
+from backend.storage import TransactionStore
+
+
+def _charges(description, start, days, amount, count):
+    dates = pd.date_range(start, periods=count, freq=f'{days}D')
+    return pd.DataFrame({
+        'Date': dates,
+        'Description': description,
+        'Amount': -amount,
+        'Account': 'Visa',
+    })
+
+
+def _detector(*frames):
+    detector = RecurringDetector()
+    rows = pd.concat(frames, ignore_index=True)
+    for month, part in rows.groupby(rows['Date'].dt.strftime('%Y-%m')):
+        detector.update(month, part)
+    return detector
+
+
+def test_normalize_merchant_drops_prefixes_and_reference_numbers():
+    raw = pd.Series(['SPOTIFY USA 8834#12', 'Spotify USA', 'SQ *BLUE BOTTLE 0042', 'Netflix.com'])
+    assert normalize_merchant(raw).tolist() == ['spotify usa', 'spotify usa', 'blue bottle', 'netflix']
+
+
+@pytest.mark.parametrize('days, expected', [
+    (7, 'Weekly'),
+    (14, 'Bi-Weekly'),
+    (30, 'Monthly'),
+    (91, 'Quarterly'),
+    (182, 'Semi-Annually'),
+    (365, 'Annual'),
+])
+def test_interval_is_proposed_as_the_nearest_frequency(days, expected):
+    detector = _detector(_charges('Gym', '2022-01-03', days, 25.0, 4))
+    found = detector.recurring()
+
+    assert found.loc['gym', 'Frequency'] == expected
+    assert found.loc['gym', 'Median Interval'] == days
+
+
+def test_irregular_or_rare_charges_are_not_recurring():
+    irregular = pd.DataFrame({
+        'Date': pd.to_datetime(['2024-01-01', '2024-01-04', '2024-02-20', '2024-02-25', '2024-05-01']),
+        'Description': 'Hardware Store',
+        'Amount': -40.0,
+        'Account': 'Visa',
+    })
+    rare = _charges('Streaming', '2024-01-05', 30, 15.0, 2)
+    detector = _detector(irregular, rare, _charges('Music', '2024-01-10', 30, 10.0, 3))
+
+    assert detector.recurring().index.tolist() == ['music']
+
+
+def test_proposals_skip_tracked_subscriptions():
+    detector = _detector(_charges('NETFLIX.COM 123', '2024-01-07', 30, 15.49, 5),
+                         _charges('Payroll Gym', '2024-01-05', 14, 20.0, 6))
+    proposed = detector.propose(['Netflix'])
+
+    assert proposed[['Subscription/ Recurring Expense', 'Amount', 'Frequency']].values.tolist() == [
+        ['Payroll Gym', 20.0, 'Bi-Weekly'],
+    ]
+
+
+def test_sync_reads_changed_partitions_and_drops_rewritten_rows(tmp_path):
+    store = TransactionStore(tmp_path / 'transactions')
+    rows = _charges('Music', '2024-01-10', 30, 10.0, 4).assign(Category='', Source='x.csv')
+    store.save(schemas.normalize(rows, schemas.TRANSACTIONS))
+
+    detector = RecurringDetector()
+    assert detector.sync(store).tolist() == ['music']
+    assert detector.stats.loc['music', 'Charges'] == 4
+    assert detector.sync(store).empty
+
+    # Drop the April charge: only that partition changes.
+    store.save(store.load(['2024-01', '2024-02', '2024-03']))
+    assert detector.sync(store).tolist() == ['music']
+    assert detector.stats.loc['music', 'Charges'] == 3
@@ -0,0 +1,18 @@
+import pandas as pd
+
+from backend import schemas
+
+
+def test_rates_are_read_as_stored_fractions():
+    table = schemas.normalize(
+        pd.DataFrame({'Name': ['Card', 'Loan', 'Promo', 'Payday'], 'Balance': 100.0,
+                      'APR': [0.2499, 0.005, 1.0, 3.9]}),
+        schemas.DEBTS,
+    )
+    assert table['APR'].tolist() == [0.2499, 0.005, 1.0, 3.9]
+
+
+def test_frequency_aliases_map_to_canonical_labels():
+    raw = pd.Series(['monthly', ' Bi-Weekly ', 'Annually', 'yearly', 'semiannually', 'fortnightly'])
+    assert schemas.to_frequency(raw).tolist()[:5] == ['Monthly', 'Bi-Weekly', 'Annual', 'Annual', 'Semi-Annually']
+    assert pd.isna(schemas.to_frequency(raw).iloc[5])
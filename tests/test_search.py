@@ -0,0 +1,79 @@
+import os
+
+import pandas as pd
+import pytest
+
+from backend import schemas, search
+from backend.search import SearchIndex
+
+BUDGET = 'budget_data.csv'
+
+
+def _expenses(rows):
+    return schemas.normalize(
+        pd.DataFrame(rows, columns=['ID', 'Category', 'Name', 'Amount', 'Frequency', 'Notes']),
+        schemas.BUDGET,
+    )
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.replace(BUDGET, _expenses([
+        [1, 'Entertainment', 'Netflix', 15.0, 'Monthly', ''],
+        [2, 'Housing', 'Rent', 1_500.0, 'Monthly', 'due on the first'],
+        [3, 'Food', 'Groceries', 400.0, 'Monthly', 'weekly shop'],
+    ]), (1, 1))
+    return index
+
+
+def _scores(hits):
+    return [(hit.row_id, round(hit.score, 6)) for hit in hits]
+
+
+def test_exact_prefix_and_typo_matches_are_scored_in_that_order(index):
+    # Title words weigh 2; exact 1.0, prefix 0.6 + 0.4 * 3/7, one typo 0.4.
+    assert _scores(index.search('netflix')) == [(1, 2.0)]
+    assert _scores(index.search('net')) == [(1, round(2 * (0.6 + 0.4 * 3 / 7), 6))]
+    assert _scores(index.search('netflx')) == [(1, 0.8)]
+    assert _scores(index.search('netlfix')) == [(1, 0.8)]
+    assert _scores(index.search('nteflix')) == [(1, 0.8)]
+
+
+def test_every_query_word_must_match(index):
+    assert _scores(index.search('rent housing')) == [(2, 3.0)]
+    assert _scores(index.search('rent first')) == [(2, 3.0)]
+    assert index.search('rent weekly') == []
+
+
+def test_only_words_of_fuzzy_length_match_with_a_typo(index):
+    # Both are one edit from 'rent'; only the four-letter query is long enough to be fuzzy.
+    assert index.search('rnt') == []
+    assert _scores(index.search('rant')) == [(2, 0.8)]
+
+
+def test_updated_rows_are_reindexed(index):
+    table = _expenses([
+        [1, 'Entertainment', 'Hulu', 12.0, 'Monthly', ''],
+        [2, 'Housing', 'Rent', 1_500.0, 'Monthly', 'due on the first'],
+        [3, 'Food', 'Groceries', 400.0, 'Monthly', 'weekly shop'],
+    ])
+    index.apply(BUDGET, table, (2, 2), row_ids=[1])
+
+    assert index.search('netflix') == []
+    assert _scores(index.search('hulu')) == [(1, 2.0)]
+    assert index.version(BUDGET) == (2, 2)
+
+
+def test_index_notices_edits_to_the_legacy_file(tmp_path):
+    legacy = tmp_path / 'budget.csv'
+    _expenses([[1, 'Food', 'Groceries', 400.0, 'Monthly', '']]).to_csv(legacy, index=False)
+    assert [hit.title for hit in search.index_for(tmp_path).search('groceries')] == ['Groceries']
+
+    _expenses([[1, 'Food', 'Farmers Market', 400.0, 'Monthly', '']]).to_csv(legacy, index=False)
+    stat = os.stat(legacy)
+    os.utime(legacy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    index = search.index_for(tmp_path)
+    assert index.search('groceries') == []
+    assert [hit.title for hit in index.search('market')] == ['Farmers Market']
@@ -0,0 +1,78 @@
+import pandas as pd
+
+from backend import schemas, variance
+from backend.storage import TransactionStore
+
+
+def _transactions(rows):
+    return schemas.normalize(
+        pd.DataFrame(rows, columns=['ID', 'Date', 'Description', 'Amount', 'Category']).assign(
+            Account='Visa', Source='x.csv'
+        ),
+        schemas.TRANSACTIONS,
+    )
+
+
+LEDGER = [
+    [1, '2024-01-05', 'Grocer', -80.0, 'Food'],
+    [2, '2024-01-20', 'Grocer', -20.0, 'Food'],
+    [3, '2024-01-21', 'Grocer refund', 5.0, 'Food'],
+    [4, '2024-01-25', 'Payroll', 2_000.0, ''],
+    [5, '2024-02-02', 'Cafe', -4.5, ''],
+]
+
+
+def _aggregates(store):
+    table = store.aggregates().sort_values(['Month', 'Category'])
+    return table[['Month', 'Category', 'Amount', 'Outflow', 'Inflow', 'Count']].values.tolist()
+
+
+def test_appends_keep_running_aggregates(tmp_path):
+    store = TransactionStore(tmp_path)
+    store.append(_transactions(LEDGER[:3]))
+    store.append(_transactions(LEDGER[3:]))
+
+    assert _aggregates(store) == [
+        ['2024-01', '', 2_000.0, 0.0, 2_000.0, 1],
+        ['2024-01', 'Food', -95.0, 100.0, 5.0, 3],
+        ['2024-02', '', -4.5, 4.5, 0.0, 1],
+    ]
+    # Outflows less Food refunds; the paycheck is not spending.
+    assert variance.actuals(store.aggregates(), '2024-01').to_dict() == {'Food': 95.0, 'Uncategorized': 0.0}
+
+
+def test_partitions_edited_outside_the_store_rebuild_the_aggregates(tmp_path):
+    store = TransactionStore(tmp_path)
+    store.append(_transactions(LEDGER))
+    assert (tmp_path / store.AGGREGATES_FILE).exists()
+
+    # Another process drops the refund from January's partition.
+    january = store.partition_path('2024-01')
+    part = pd.read_csv(january)
+    part[part['ID'] != 3].to_csv(january, index=False)
+
+    assert _aggregates(store)[1] == ['2024-01', 'Food', -100.0, 100.0, 0.0, 2]
+
+
+def test_rewrite_writes_only_changed_partitions(tmp_path):
+    store = TransactionStore(tmp_path)
+    store.append(_transactions(LEDGER))
+    february = store.partition_path('2024-02').stat().st_mtime_ns
+
+    def categorize(part):
+        return part.assign(Category=part['Category'].mask(part['Description'] == 'Payroll', 'Income'))
+
+    assert store.rewrite(categorize) == ['2024-01']
+    assert store.partition_path('2024-02').stat().st_mtime_ns == february
+    assert _aggregates(store)[0] == ['2024-01', 'Food', -95.0, 100.0, 5.0, 3]
+    assert _aggregates(store)[1] == ['2024-01', 'Income', 2_000.0, 0.0, 2_000.0, 1]
+
+
+def test_uncategorized_counts_all_and_returns_the_first_rows(tmp_path):
+    store = TransactionStore(tmp_path)
+    store.append(_transactions(LEDGER))
+
+    count, rows = store.uncategorized(['ID', 'Description'], limit=1)
+
+    assert count == 2
+    assert rows.values.tolist() == [[4, 'Payroll']]
@@ -0,0 +1,58 @@
+import json
+
+import pandas as pd
+import pytest
+
+from backend import calculations, schemas, summaries
+from backend.storage import TableStore
+
+
+def _expenses(rows):
+    return pd.DataFrame(rows, columns=['Category', 'Name', 'Amount', 'Frequency'])
+
+
+def test_summary_totals_match_the_budget_plan(tmp_path):
+    store = TableStore(tmp_path / 'budget_data.csv', schemas.BUDGET)
+    table = store.save(_expenses([
+        ['Housing', 'Rent', 1_500.0, 'Monthly'],
+        ['Childcare', 'Sitter', 100.0, 'Bi-Weekly'],
+        ['Education', 'Tuition', 4_000.0, 'Semester'],
+        ['Food', 'Groceries', 50.0, 'Weekly'],
+    ]))
+
+    record = summaries.table_summary(tmp_path / 'budget_data.csv')
+    plan = calculations.budget_plan(table)
+
+    # 18,000 + 2,600 + 8,000 + 2,600
+    assert record.annual_total == pytest.approx(31_200.0)
+    assert record.annual_total == pytest.approx(plan['Annual Amount'].sum())
+    assert record.by_category == pytest.approx(plan.groupby('Category')['Annual Amount'].sum().to_dict())
+    assert record.per_period()['Monthly'] == pytest.approx(plan['Monthly'].sum())
+
+
+def test_saving_a_table_refreshes_its_record(tmp_path):
+    path = tmp_path / 'budget_data.csv'
+    store = TableStore(path, schemas.BUDGET)
+    store.save(_expenses([['Housing', 'Rent', 1_000.0, 'Monthly']]))
+    assert summaries.table_summary(path).annual_total == 12_000.0
+
+    store.save(_expenses([['Housing', 'Rent', 1_000.0, 'Monthly'], ['Auto', 'Insurance', 600.0, 'Semi-Annually']]))
+    records = json.loads((tmp_path / summaries.SUMMARY_FILE).read_text(encoding='utf-8'))
+
+    # The change event rewrote the record; reading it does not recompute.
+    assert records['budget_data.csv']['annual_total'] == 13_200.0
+    assert summaries.table_summary(path).by_category == {'Auto': 1_200.0, 'Housing': 12_000.0}
+
+
+def test_records_of_an_older_format_are_rebuilt(tmp_path):
+    path = tmp_path / 'budget_data.csv'
+    store = TableStore(path, schemas.BUDGET)
+    store.save(_expenses([['Housing', 'Rent', 1_000.0, 'Monthly']]))
+
+    records_path = tmp_path / summaries.SUMMARY_FILE
+    records = json.loads(records_path.read_text(encoding='utf-8'))
+    records['_format'] = summaries.SUMMARY_FORMAT - 1
+    records['budget_data.csv']['annual_total'] = -1.0
+    records_path.write_text(json.dumps(records), encoding='utf-8')
+
+    assert summaries.table_summary(path).annual_total == 12_000.0
@@ -0,0 +1,86 @@
+import os
+
+import pandas as pd
+
+from backend import table_cache
+from backend.table_cache import TableCache
+
+calls = []
+
+
+def _totals(df):
+    calls.append(len(df))
+    return df.groupby('Category', as_index=False)['Amount'].sum()
+
+
+def _frame(amounts):
+    return pd.DataFrame({'Category': ['Food', 'Food', 'Rent'], 'Amount': amounts})
+
+
+def test_fingerprint_follows_values_dtypes_and_file_contents(tmp_path):
+    frame = _frame([1.0, 2.0, 3.0])
+
+    assert table_cache.fingerprint(frame) == table_cache.fingerprint(frame.copy())
+    assert table_cache.fingerprint(frame) != table_cache.fingerprint(_frame([1.0, 2.0, 4.0]))
+    assert table_cache.fingerprint(frame) != table_cache.fingerprint(frame.astype({'Amount': 'float32'}))
+
+    path = tmp_path / 'budget.csv'
+    path.write_text('a\n1\n', encoding='utf-8')
+    before = table_cache.fingerprint(path)
+    path.write_text('a\n2\n', encoding='utf-8')
+    assert table_cache.fingerprint(path) != before
+
+
+def test_tagged_frames_are_fingerprinted_by_token():
+    first = table_cache.tag(_frame([1.0, 2.0, 3.0]), 'budget-1')
+    second = table_cache.tag(_frame([9.0, 9.0, 9.0]), 'budget-1')
+
+    assert table_cache.token(first) == 'budget-1'
+    assert table_cache.fingerprint(first) == table_cache.fingerprint(second)
+    # A copy may be modified, so it is hashed by value again.
+    assert table_cache.token(first.copy()) is None
+    assert table_cache.fingerprint(first.copy()) != table_cache.fingerprint(second.copy())
+
+
+def test_entries_are_reused_until_an_input_changes(tmp_path):
+    calls.clear()
+    cache = TableCache(tmp_path)
+
+    first = cache.cached('totals', _totals, _frame([1.0, 2.0, 3.0]))
+    again = cache.cached('totals', _totals, _frame([1.0, 2.0, 3.0]))
+    changed = cache.cached('totals', _totals, _frame([1.0, 2.0, 5.0]))
+
+    assert calls == [3, 3]
+    assert again['Amount'].tolist() == first['Amount'].tolist() == [3.0, 3.0]
+    assert changed['Amount'].tolist() == [3.0, 5.0]
+    stats = cache.stats()
+    assert (stats['entries'], stats['hits'], stats['misses']) == (2, 1, 2)
+
+    # Results carry the entry's token, the same one another process would give them.
+    key = table_cache.entry_key(_totals, _frame([1.0, 2.0, 3.0]))
+    assert table_cache.token(again) == table_cache.result_token('totals', key)
+
+    # A restarted server finds the entry on disk.
+    TableCache(tmp_path).cached('totals', _totals, _frame([1.0, 2.0, 3.0]))
+    assert calls == [3, 3]
+
+
+def test_unreadable_entries_are_recomputed(tmp_path):
+    calls.clear()
+    cache = TableCache(tmp_path)
+    key = table_cache.entry_key(_totals, _frame([1.0, 2.0, 3.0]))
+    cache.path('totals', key).write_bytes(b'not a pickle')
+
+    assert cache.cached('totals', _totals, _frame([1.0, 2.0, 3.0]))['Amount'].tolist() == [3.0, 3.0]
+    assert calls == [3]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = TableCache(tmp_path, max_bytes=10)
+    for age, name in enumerate(['old', 'newer', 'newest']):
+        path = cache.path(name, 'k')
+        path.write_bytes(b'12345')
+        os.utime(path, (1_000 + age, 1_000 + age))
+
+    assert cache.evict() == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['newer-k.pkl', 'newest-k.pkl']
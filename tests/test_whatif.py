@@ -0,0 +1,40 @@
+import numpy as np
+
+from backend.whatif import WhatIfGrid, grid_slice
+
+SALARY = np.array([100_000.0, 120_000.0])
+BONUS = np.array([0.0, 10_000.0, 20_000.0])
+RAISE = np.array([0.0, 0.1])
+TAX = np.array([0.2, 0.25, 0.3, 0.35])
+
+
+def test_after_tax_grid_cells():
+    values = WhatIfGrid().after_tax(SALARY, BONUS, RAISE, TAX)
+
+    assert values.shape == (2, 3, 2, 4)
+    # (120,000 * 1.1 + 20,000) * (1 - 0.3); the raise does not touch the bonus.
+    assert values[1, 2, 1, 2] == 106_400.0
+    assert values[0, 0, 0, 0] == 80_000.0
+
+
+def test_slice_puts_the_y_axis_first_in_either_order():
+    values = WhatIfGrid().surplus(SALARY, BONUS, RAISE, TAX, annual_expense=50_000.0)
+    fixed = {'Salary': 1, 'Bonus': 2, 'Raise': 1, 'Tax Rate': 2}
+
+    tax_by_bonus = grid_slice(values, x_axis='Tax Rate', y_axis='Bonus', fixed=fixed)
+    bonus_by_tax = grid_slice(values, x_axis='Bonus', y_axis='Tax Rate', fixed=fixed)
+
+    assert tax_by_bonus.shape == (3, 4)
+    assert bonus_by_tax.shape == (4, 3)
+    np.testing.assert_array_equal(bonus_by_tax, tax_by_bonus.T)
+    # Row bonus 10,000, column tax 0.25: (132,000 + 10,000) * 0.75 - 50,000.
+    assert tax_by_bonus[1, 1] == 56_500.0
+
+
+def test_only_stages_downstream_of_a_change_are_recomputed():
+    grid = WhatIfGrid()
+    grid.surplus(SALARY, BONUS, RAISE, TAX, 50_000.0)
+    grid.surplus(SALARY, BONUS, RAISE, TAX[:2], 50_000.0)
+    grid.surplus(SALARY, BONUS, RAISE, TAX[:2], 60_000.0)
+
+    assert grid.recomputed == {'raised salary': 1, 'gross': 1, 'after tax': 2, 'surplus': 3}